@@ -103,7 +103,7 @@ async def main(
         return_exceptions=True,
     )
 
-    ws_task = asyncio.create_task(controller.start_websocket())
+    ws_task = asyncio.create_task(controller.run_websocket())
 
     try:
         while True:
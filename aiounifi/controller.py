@@ -2,9 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable, Collection
+import enum
+from http import HTTPStatus
 import logging
-from typing import TYPE_CHECKING
+import random
+from typing import TYPE_CHECKING, Any
 
+import aiohttp
+
+from .errors import AiounifiException
+from .interfaces.api_handlers import APIHandler, UnsubscribeType
 from .interfaces.clients import Clients
 from .interfaces.clients_all import ClientsAll
 from .interfaces.connectivity import Connectivity
@@ -14,17 +23,20 @@ from .interfaces.dpi_restriction_groups import DPIRestrictionGroups
 from .interfaces.events import EventHandler
 from .interfaces.firewall_policies import FirewallPolicies
 from .interfaces.firewall_zones import FirewallZones
+from .interfaces.message_queue import MessageQueue
 from .interfaces.messages import MessageHandler
 from .interfaces.object_oriented_network_configs import ObjectOrientedNetworkConfigs
 from .interfaces.outlets import Outlets
 from .interfaces.port_forwarding import PortForwarding
 from .interfaces.ports import Ports
+from .interfaces.scheduler import RequestPriority
 from .interfaces.sites import Sites
 from .interfaces.speedtest import SpeedtestHandler
 from .interfaces.system_information import SystemInformationHandler
 from .interfaces.traffic_routes import TrafficRoutes
 from .interfaces.traffic_rules import TrafficRules
 from .interfaces.vouchers import Vouchers
+from .interfaces.watchdog import ANY_MESSAGE, WebsocketWatchdog
 from .interfaces.wlans import Wlans
 from .models.configuration import Configuration
 
@@ -33,6 +45,22 @@ if TYPE_CHECKING:
 
 LOGGER = logging.getLogger(__name__)
 
+WEBSOCKET_RETRY_MIN = 1.0
+WEBSOCKET_RETRY_MAX = 300.0
+WEBSOCKET_WATCHDOG_INTERVAL = 10.0
+
+
+class WebsocketState(enum.StrEnum):
+    """State of the supervised websocket connection."""
+
+    CONNECTING = "connecting"
+    RUNNING = "running"
+    DISCONNECTED = "disconnected"
+    STOPPED = "stopped"
+
+
+WebsocketStateCallback = Callable[[WebsocketState], None]
+
 
 class Controller:
     """Control a UniFi controller."""
@@ -40,6 +68,7 @@ class Controller:
     def __init__(self, config: Configuration) -> None:
         """Session setup."""
         self.connectivity = Connectivity(config)
+        self.watchdog = WebsocketWatchdog()
 
         self.messages = MessageHandler(self)
         self.events = EventHandler(self)
@@ -63,15 +92,215 @@ class Controller:
         self.vouchers = Vouchers(self)
         self.wlans = Wlans(self)
 
+        self.websocket_state = WebsocketState.STOPPED
+        self._websocket_state_subscribers: list[WebsocketStateCallback] = []
+        self._resync_task: asyncio.Task[None] | None = None
+
     async def login(self) -> None:
-        """Log in to controller."""
+        """Log in to controller, reuse a stored session on first login."""
+        if (
+            self.connectivity.session_generation == 0
+            and await self.connectivity.restore_session()
+        ):
+            return
         await self.connectivity.check_unifi_os()
         await self.connectivity.login()
 
-    async def request(self, api_request: ApiRequest) -> TypedApiResponse:
-        """Make a request to the API, retry login on failure."""
-        return await self.connectivity.request(api_request)
+    async def close(self) -> None:
+        """Stop background tasks, call when the controller is no longer used."""
+        if self._resync_task is not None:
+            self._resync_task.cancel()
+            self._resync_task = None
+        await self.connectivity.close()
+
+    async def request(
+        self,
+        api_request: ApiRequest,
+        item_callback: Callable[[dict[str, Any]], Awaitable[None] | None] | None = None,
+        priority: RequestPriority | None = None,
+    ) -> TypedApiResponse:
+        """Make a request to the API, retry login on failure.
+
+        "item_callback" - receives each element of the response data list
+        while the response is streamed, instead of returning it in "data",
+        an awaitable result pauses receiving until done.
+        "priority" - scheduling priority, commands are sent before refreshes.
+        """
+        return await self.connectivity.request(api_request, item_callback, priority)
 
     async def start_websocket(self) -> None:
         """Start websocket session."""
         await self.connectivity.websocket(self.messages.new_data)
+
+    async def run_websocket(
+        self,
+        retry_min: float = WEBSOCKET_RETRY_MIN,
+        retry_max: float = WEBSOCKET_RETRY_MAX,
+        watchdog_interval: float | None = WEBSOCKET_WATCHDOG_INTERVAL,
+        message_queue: MessageQueue | None = None,
+    ) -> None:
+        """Run websocket session and reconnect on failure until cancelled.
+
+        Reconnects use jittered exponential backoff between "retry_min" and
+        "retry_max" seconds, a 401 during handshake triggers a new login.
+        Handlers receiving websocket messages are refreshed after reconnecting
+        so changes made while disconnected are not missed.
+        Every "watchdog_interval" seconds the watchdog is checked for stalls,
+        a stall of all frames reconnects while a stall of specific message
+        types refreshes handlers, None disables the watchdog.
+        Frames are passed through "message_queue" when provided, so slow
+        subscribers do not delay reading the websocket.
+        """
+        attempt = 0
+        has_connected = False
+
+        def connected() -> None:
+            nonlocal attempt, has_connected
+            attempt = 0
+            self.watchdog.reset()
+            self._set_websocket_state(WebsocketState.RUNNING)
+            if has_connected:
+                self._resync_task = asyncio.create_task(self.resync())
+            has_connected = True
+
+        callback: Callable[[str], Awaitable[None] | None] = self.messages.new_data
+        queue_task = None
+        if message_queue is not None:
+            callback = message_queue.put
+            queue_task = asyncio.create_task(message_queue.run())
+
+        try:
+            while True:
+                self._set_websocket_state(WebsocketState.CONNECTING)
+                try:
+                    await self._connect_websocket(
+                        callback, connected, watchdog_interval
+                    )
+
+                except (AiounifiException, aiohttp.ClientError, TimeoutError) as err:
+                    LOGGER.warning("UniFi websocket disconnected: %s", err)
+                    if (
+                        isinstance(err, aiohttp.WSServerHandshakeError)
+                        and err.status == HTTPStatus.UNAUTHORIZED
+                    ):
+                        await self._websocket_relogin()
+
+                self._set_websocket_state(WebsocketState.DISCONNECTED)
+                delay = min(retry_max, retry_min * 2**attempt)
+                attempt += 1
+                await asyncio.sleep(random.uniform(delay / 2, delay))
+
+        finally:
+            if queue_task is not None:
+                queue_task.cancel()
+            if self._resync_task is not None:
+                self._resync_task.cancel()
+                self._resync_task = None
+            self._set_websocket_state(WebsocketState.STOPPED)
+
+    async def _connect_websocket(
+        self,
+        callback: Callable[[str], Awaitable[None] | None],
+        connected: Callable[[], None],
+        watchdog_interval: float | None,
+    ) -> None:
+        """Run a single websocket connection supervised by the watchdog."""
+
+        def received(raw_string: str) -> Awaitable[None] | None:
+            # Record frames as read, before queueing or handling them
+            self.watchdog.record_frame(self.connectivity.ws_message_received)
+            return callback(raw_string)
+
+        self.watchdog.reset()
+        async with asyncio.timeout(None) as timeout:
+            watchdog_task = (
+                asyncio.create_task(self._run_watchdog(timeout, watchdog_interval))
+                if watchdog_interval is not None
+                else None
+            )
+            try:
+                await self.connectivity.websocket(received, connected)
+            finally:
+                if watchdog_task is not None:
+                    watchdog_task.cancel()
+
+    async def _run_watchdog(self, timeout: asyncio.Timeout, interval: float) -> None:
+        """Periodically check watchdog, expire "timeout" to force a reconnect."""
+        while True:
+            await asyncio.sleep(interval)
+            if not (stalled := self.watchdog.stalled()):
+                continue
+            if ANY_MESSAGE in stalled:
+                LOGGER.warning("UniFi websocket stalled, reconnecting")
+                timeout.reschedule(asyncio.get_running_loop().time())
+                return
+            LOGGER.warning("UniFi websocket stalled on %s, resyncing", stalled)
+            await self.resync(stalled)
+
+    async def _websocket_relogin(self) -> None:
+        """Log in again after websocket handshake was unauthorized."""
+        LOGGER.debug("UniFi websocket unauthorized, logging in")
+        try:
+            await self.login()
+        except AiounifiException as err:
+            LOGGER.warning("UniFi websocket login failed: %s", err)
+
+    async def resync(self, message_keys: Collection[str] | None = None) -> None:
+        """Refresh initialized handlers that are updated through websocket.
+
+        "message_keys" - only refresh handlers of these message keys,
+        all handlers updated through websocket if None.
+        Items missing from the refreshed data were removed while disconnected
+        and are removed from the handlers as well.
+        """
+        handlers = [
+            handler
+            for handler in self.api_handlers
+            if handler.initialized
+            and (handler.process_messages or handler.remove_messages)
+            and (
+                message_keys is None
+                or any(
+                    message_key.value in message_keys
+                    for message_key in (
+                        *handler.process_messages,
+                        *handler.remove_messages,
+                    )
+                )
+            )
+        ]
+        results = await asyncio.gather(
+            *(handler.update(remove_missing=True) for handler in handlers),
+            return_exceptions=True,
+        )
+        for handler, result in zip(handlers, results, strict=True):
+            if isinstance(result, Exception):
+                LOGGER.warning(
+                    "Failed to resync %s: %s", type(handler).__name__, result
+                )
+
+    @property
+    def api_handlers(self) -> list[APIHandler[Any]]:
+        """List all API handlers."""
+        return [
+            handler
+            for handler in vars(self).values()
+            if isinstance(handler, APIHandler)
+        ]
+
+    def subscribe_websocket_state(
+        self, callback: WebsocketStateCallback
+    ) -> UnsubscribeType:
+        """Subscribe to websocket state changes of "run_websocket"."""
+        self._websocket_state_subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            self._websocket_state_subscribers.remove(callback)
+
+        return unsubscribe
+
+    def _set_websocket_state(self, state: WebsocketState) -> None:
+        """Update websocket state and signal subscribers."""
+        self.websocket_state = state
+        for callback in list(self._websocket_state_subscribers):
+            callback(state)
@@ -43,6 +43,18 @@ class BadGateway(RequestError):
     """Invalid response from the upstream server."""
 
 
+class TooManyRequests(ResponseError):
+    """Controller is rate limiting requests (HTTP 429).
+
+    "retry_after" holds seconds from the Retry-After header if provided.
+    """
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        """Initialize error."""
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 # Raised when login attempt limit is reached (HTTP 429 AUTHENTICATION_FAILED_LIMIT_REACHED)
 class AuthenticationRateLimitError(AiounifiException):
     """Raised when login attempt limit is reached (HTTP 429)."""
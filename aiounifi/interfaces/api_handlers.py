@@ -3,15 +3,32 @@
 from __future__ import annotations
 
 from abc import ABC
-from collections.abc import Callable, ItemsView, Iterator, ValuesView
+import asyncio
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    ItemsView,
+    Iterable,
+    Iterator,
+    Mapping,
+    ValuesView,
+)
+from contextlib import aclosing, contextmanager, suppress
+from dataclasses import dataclass, field
 import enum
+import itertools
 from typing import TYPE_CHECKING, Any, Generic, cast, final
 
-from ..models.api import ApiItemT, ApiRequest
+from ..models.api import ApiItemT, ApiRequest, cached_property
+from .columns import ColumnStore
 
 if TYPE_CHECKING:
     from ..controller import Controller
-    from ..models.message import Message, MessageKey
+    from ..models.api import TypedApiResponse
+    from ..models.message import Message, MessageKey, Meta
 
 
 class ItemEvent(enum.Enum):
@@ -22,62 +39,388 @@ class ItemEvent(enum.Enum):
     DELETED = "deleted"
 
 
+@dataclass
+class ItemBatch:
+    """Object IDs added, changed and deleted while applying a batch of items.
+
+    Events are merged to their net effect, e.g. an item added and then
+    changed within the same batch is only reported as added.
+    """
+
+    added: set[str] = field(default_factory=set)
+    changed: set[str] = field(default_factory=set)
+    deleted: set[str] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        """Return true if batch holds any event."""
+        return bool(self.added or self.changed or self.deleted)
+
+    def add_event(self, event: ItemEvent, obj_id: str) -> None:
+        """Merge event of object ID into batch."""
+        if event is ItemEvent.ADDED:
+            if obj_id in self.deleted:
+                self.deleted.discard(obj_id)
+                self.changed.add(obj_id)
+            else:
+                self.added.add(obj_id)
+
+        elif event is ItemEvent.CHANGED:
+            if obj_id not in self.added:
+                self.changed.add(obj_id)
+
+        elif obj_id in self.added:
+            self.added.discard(obj_id)
+
+        else:
+            self.changed.discard(obj_id)
+            self.deleted.add(obj_id)
+
+
+@dataclass(frozen=True)
+class Index:
+    """Index of handler items on keys extracted from raw data.
+
+    "key" - raw field name or function returning key of raw data,
+    items with key None are not indexed.
+    "multi" - key function returns an iterable of keys.
+    """
+
+    key: str | Callable[[Mapping[str, Any]], Any]
+    multi: bool = False
+
+    def keys(self, raw: Mapping[str, Any]) -> tuple[Hashable, ...]:
+        """Return index keys of raw data."""
+        key = raw.get(self.key) if isinstance(self.key, str) else self.key(raw)
+        if key is None:
+            return ()
+        if self.multi:
+            return tuple(dict.fromkeys(value for value in key if value is not None))
+        return (key,)
+
+
 CallbackType = Callable[[ItemEvent, str], None]
-SubscriptionType = tuple[CallbackType, tuple[ItemEvent, ...] | None]
+BatchCallbackType = Callable[[ItemBatch], None]
+ChangesCallbackType = Callable[[ItemEvent, str, frozenset[str]], None]
+SubscriptionType = tuple[CallbackType | ChangesCallbackType, bool]
+# Ordered set of subscriptions keyed by subscription ID
+SubscribersType = dict[int, SubscriptionType]
 UnsubscribeType = Callable[[], None]
 
 ID_FILTER_ALL = "*"
 
+_MISSING = object()
+
+
+def diff_raw(old: Mapping[str, Any], new: Mapping[str, Any]) -> frozenset[str]:
+    """Return top-level keys whose values differ between two raw dicts."""
+    if old == new:
+        return frozenset()
+    return frozenset(
+        key
+        for key in old.keys() | new.keys()
+        if old.get(key, _MISSING) != new.get(key, _MISSING)
+    )
+
+
+def _as_tuple[FilterT: (str, ItemEvent)](
+    value: Iterable[FilterT] | FilterT | None, default: tuple[FilterT, ...]
+) -> tuple[FilterT, ...]:
+    """Normalize a subscription filter into a tuple."""
+    if value is None:
+        return default
+    if isinstance(value, (str, ItemEvent)):
+        return (value,)
+    return tuple(value)
+
 
 class SubscriptionHandler(ABC):
-    """Manage subscription and notification to subscribers."""
+    """Manage subscription and notification to subscribers.
+
+    Subscriptions are indexed per event and object ID so signalling only visits
+    interested subscribers. A bucket that is modified while signalling is
+    replaced with a copy rather than mutated, keeping ongoing iteration valid.
+    """
 
     def __init__(self) -> None:
         """Initialize subscription handler."""
-        self._subscribers: dict[str, list[SubscriptionType]] = {ID_FILTER_ALL: []}
-
-    def signal_subscribers(self, event: ItemEvent, obj_id: str) -> None:
-        """Signal subscribers."""
-        subscribers: list[SubscriptionType] = (
-            self._subscribers.get(obj_id, []) + self._subscribers[ID_FILTER_ALL]
-        )
-        for callback, event_filter in subscribers:
-            if event_filter is not None and event not in event_filter:
+        self._subscribers: dict[ItemEvent, dict[str, SubscribersType]] = {
+            event: {} for event in ItemEvent
+        }
+        # CHANGED subscriptions with field filter indexed per field and object ID
+        self._field_subscribers: dict[str, dict[str, SubscribersType]] = {}
+        self._batch_subscribers: dict[int, BatchCallbackType] = {}
+        # Number of subscriptions receiving changed keys
+        self._changes_subscriptions = 0
+        self._subscription_ids = itertools.count()
+        self._signalling = 0
+        self._batch: ItemBatch | None = None
+        # Handlers updated from events of this handler, batched together with it
+        self._batch_dependents: list[SubscriptionHandler] = []
+
+    def signal_subscribers(
+        self,
+        event: ItemEvent,
+        obj_id: str,
+        changed_keys: frozenset[str] = frozenset(),
+    ) -> None:
+        """Signal subscribers.
+
+        "changed_keys" - raw keys that changed, passed to change subscribers
+        and matched against field filters on CHANGED events.
+        """
+        if self._batch is not None:
+            self._batch.add_event(event, obj_id)
+
+        subscribers = self._subscribers[event]
+        obj_subscribers = subscribers.get(obj_id)
+        all_subscribers = subscribers.get(ID_FILTER_ALL)
+        self._signalling += 1
+        try:
+            if obj_subscribers is not None:
+                for callback, with_changes in obj_subscribers.values():
+                    if with_changes:
+                        cast(ChangesCallbackType, callback)(event, obj_id, changed_keys)
+                    else:
+                        cast(CallbackType, callback)(event, obj_id)
+
+            if all_subscribers is not None:
+                for callback, with_changes in all_subscribers.values():
+                    if with_changes:
+                        cast(ChangesCallbackType, callback)(event, obj_id, changed_keys)
+                    else:
+                        cast(CallbackType, callback)(event, obj_id)
+
+            if event is ItemEvent.CHANGED and self._field_subscribers:
+                self._signal_field_subscribers(obj_id, changed_keys)
+        finally:
+            self._signalling -= 1
+
+    def _signal_field_subscribers(
+        self, obj_id: str, changed_keys: frozenset[str]
+    ) -> None:
+        """Signal field filtered subscribers of the changed fields.
+
+        Only subscriptions indexed under a changed field are visited.
+        """
+        signalled: set[int] = set()
+        for field_name in self._field_subscribers.keys() & changed_keys:
+            if (field_subscribers := self._field_subscribers.get(field_name)) is None:
                 continue
-            callback(event, obj_id)
+            for key in (obj_id, ID_FILTER_ALL):
+                if (subscribers := field_subscribers.get(key)) is None:
+                    continue
+                for subscription_id, (callback, with_changes) in subscribers.items():
+                    if subscription_id in signalled:
+                        continue
+                    signalled.add(subscription_id)
+                    if with_changes:
+                        cast(ChangesCallbackType, callback)(
+                            ItemEvent.CHANGED, obj_id, changed_keys
+                        )
+                    else:
+                        cast(CallbackType, callback)(ItemEvent.CHANGED, obj_id)
 
     def subscribe(
         self,
         callback: CallbackType,
         event_filter: tuple[ItemEvent, ...] | ItemEvent | None = None,
         id_filter: tuple[str] | str | None = None,
+        field_filter: Iterable[str] | str | None = None,
+    ) -> UnsubscribeType:
+        """Subscribe to added events.
+
+        "field_filter" - raw keys or model properties, CHANGED events are only
+        signalled when one of them changed.
+        """
+        return self._subscribe(callback, event_filter, id_filter, field_filter, False)
+
+    def subscribe_changes(
+        self,
+        callback: ChangesCallbackType,
+        event_filter: tuple[ItemEvent, ...] | ItemEvent | None = None,
+        id_filter: tuple[str] | str | None = None,
+        field_filter: Iterable[str] | str | None = None,
     ) -> UnsubscribeType:
-        """Subscribe to added events."""
-        if isinstance(event_filter, ItemEvent):
-            event_filter = (event_filter,)
-        subscription = (callback, event_filter)
-
-        _id_filter: tuple[str]
-        if id_filter is None:
-            _id_filter = (ID_FILTER_ALL,)
-        elif isinstance(id_filter, str):
-            _id_filter = (id_filter,)
-
-        for obj_id in _id_filter:
-            if obj_id not in self._subscribers:
-                self._subscribers[obj_id] = []
-            self._subscribers[obj_id].append(subscription)
+        """Subscribe to events together with the set of changed raw keys.
+
+        ADDED carries all keys of the new item, CHANGED the keys whose value
+        differs from the previous data and DELETED an empty set.
+        """
+        return self._subscribe(callback, event_filter, id_filter, field_filter, True)
+
+    def _subscribe(
+        self,
+        callback: CallbackType | ChangesCallbackType,
+        event_filter: tuple[ItemEvent, ...] | ItemEvent | None,
+        id_filter: tuple[str] | str | None,
+        field_filter: Iterable[str] | str | None,
+        with_changes: bool,
+    ) -> UnsubscribeType:
+        """Register subscription and return function to unsubscribe."""
+        events = _as_tuple(event_filter, tuple(ItemEvent))
+        obj_ids = _as_tuple(id_filter, (ID_FILTER_ALL,))
+        fields = _as_tuple(field_filter, ())
+
+        indexes: list[dict[str, SubscribersType]] = []
+        for event in events:
+            if fields and event is ItemEvent.CHANGED:
+                indexes.extend(
+                    self._field_subscribers.setdefault(field_name, {})
+                    for field_name in fields
+                )
+            else:
+                indexes.append(self._subscribers[event])
+
+        subscription_id = next(self._subscription_ids)
+        subscription = (callback, with_changes)
+        for index in indexes:
+            for obj_id in obj_ids:
+                self._add_subscription(index, obj_id, subscription_id, subscription)
+        if fields:
+            self._field_filter_updated()
+        self._changes_subscriptions += with_changes
+        subscribed = True
 
         def unsubscribe() -> None:
-            for obj_id in _id_filter:
-                if obj_id not in self._subscribers:
-                    continue
-                if subscription not in self._subscribers[obj_id]:
-                    continue
-                self._subscribers[obj_id].remove(subscription)
+            nonlocal subscribed
+            if not subscribed:
+                return
+            subscribed = False
+            for index in indexes:
+                for obj_id in obj_ids:
+                    self._remove_subscription(index, obj_id, subscription_id)
+            if fields:
+                self._remove_empty_fields(fields)
+            self._changes_subscriptions -= with_changes
+
+        return unsubscribe
+
+    def _add_subscription(
+        self,
+        index: dict[str, SubscribersType],
+        obj_id: str,
+        subscription_id: int,
+        subscription: SubscriptionType,
+    ) -> None:
+        """Add subscription to the bucket of object ID."""
+        if (subscribers := index.get(obj_id)) is None:
+            index[obj_id] = {subscription_id: subscription}
+        elif self._signalling:
+            index[obj_id] = {**subscribers, subscription_id: subscription}
+        else:
+            subscribers[subscription_id] = subscription
+
+    def _remove_subscription(
+        self,
+        index: dict[str, SubscribersType],
+        obj_id: str,
+        subscription_id: int,
+    ) -> None:
+        """Remove subscription from the bucket of object ID."""
+        if (subscribers := index.get(obj_id)) is None:
+            return
+        if subscription_id not in subscribers:
+            return
+        if len(subscribers) == 1:
+            del index[obj_id]
+        elif self._signalling:
+            index[obj_id] = {
+                key: value
+                for key, value in subscribers.items()
+                if key != subscription_id
+            }
+        else:
+            del subscribers[subscription_id]
+
+    def _remove_empty_fields(self, fields: tuple[str, ...]) -> None:
+        """Drop field indexes without subscribers."""
+        for field_name in fields:
+            if (
+                field_name in self._field_subscribers
+                and not self._field_subscribers[field_name]
+            ):
+                del self._field_subscribers[field_name]
+        self._field_filter_updated()
+
+    def _field_filter_updated(self) -> None:
+        """Field filters have been added or removed."""
+
+    def subscribe_batch(self, callback: BatchCallbackType) -> UnsubscribeType:
+        """Subscribe to one aggregated notification per batch of items.
+
+        A batch is a websocket frame, a refreshed list of items or any
+        updates applied inside "batch".
+        """
+        subscription_id = next(self._subscription_ids)
+        self._batch_subscribers[subscription_id] = callback
+
+        def unsubscribe() -> None:
+            self._batch_subscribers.pop(subscription_id, None)
 
         return unsubscribe
 
+    def add_batch_dependent(self, handler: SubscriptionHandler) -> None:
+        """Collect events of handler into the batches of this handler.
+
+        For handlers updated from events of this handler, like ports of
+        devices, so a frame of devices is also a single batch of ports.
+        """
+        self._batch_dependents.append(handler)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Collect events and signal batch subscribers once when done.
+
+        Subscribers of individual events are still signalled per event,
+        events applied before an exception are signalled as well.
+        """
+        if not (batches := self._new_batches()):
+            yield
+            return
+
+        try:
+            with self._collect(batches):
+                yield
+        finally:
+            self._signal_batches(batches)
+
+    def _new_batches(self) -> dict[SubscriptionHandler, ItemBatch]:
+        """Create batches of this handler and its dependents.
+
+        Handlers without batch subscribers or already collecting a batch
+        are left out.
+        """
+        return {
+            handler: ItemBatch()
+            for handler in (self, *self._batch_dependents)
+            if handler._batch is None and handler._batch_subscribers
+        }
+
+    @staticmethod
+    @contextmanager
+    def _collect(batches: dict[SubscriptionHandler, ItemBatch]) -> Iterator[None]:
+        """Collect events of handlers into their batches.
+
+        Must not be held across awaits, other updates of the handlers
+        would join the batches.
+        """
+        collecting = [handler for handler in batches if handler._batch is None]
+        for handler in collecting:
+            handler._batch = batches[handler]
+        try:
+            yield
+        finally:
+            for handler in collecting:
+                handler._batch = None
+
+    @staticmethod
+    def _signal_batches(batches: dict[SubscriptionHandler, ItemBatch]) -> None:
+        """Signal batch subscribers of each handler with a non-empty batch."""
+        for handler, batch in batches.items():
+            if batch:
+                for callback in tuple(handler._batch_subscribers.values()):
+                    callback(batch)
+
 
 class APIHandler(SubscriptionHandler, Generic[ApiItemT]):
     """Base class for a map of API Items."""
@@ -87,27 +430,165 @@ class APIHandler(SubscriptionHandler, Generic[ApiItemT]):
     api_request: ApiRequest
     process_messages: tuple[MessageKey, ...] = ()
     remove_messages: tuple[MessageKey, ...] = ()
+    # Compare updates with stored raw data, update in place and drop no-op updates.
+    # Field filters enable comparison without dropping updates.
+    diff_mode: bool = False
+    # Index name and declaration of index to query with "by"
+    indexes: dict[str, Index] = {}
+    # Process items while the refresh response is received, memory is bounded
+    # by a single item rather than the whole response.
+    stream: bool = False
+    # Column name and numeric raw field stored column wise once "enable_columns"
+    columns: dict[str, str] = {}
 
     def __init__(self, controller: Controller) -> None:
         """Initialize API handler."""
         super().__init__()
         self.controller = controller
         self._items: dict[str, ApiItemT] = {}
+        # Object IDs per index key, dict keys keep items ordered
+        self._indexes: dict[str, dict[Hashable, dict[str, None]]] = {
+            name: {} for name in self.indexes
+        }
+        self._index_keys: dict[str, tuple[tuple[Hashable, ...], ...]] = {}
+        self._watched_properties: tuple[str, ...] = ()
+        self.column_store: ColumnStore | None = None
+        self.initialized = False
+        self._update_task: asyncio.Task[set[str]] | None = None
 
         if message_filter := self.process_messages + self.remove_messages:
-            controller.messages.subscribe(self.process_message, message_filter)
+            controller.messages.subscribe_frames(self.process_frame, message_filter)
+
+    @final
+    async def update(self, remove_missing: bool = False) -> None:
+        """Refresh data, concurrent calls share a single refresh.
+
+        "remove_missing" - remove items missing from the refreshed data.
+        """
+        if self._update_task is None:
+            self._update_task = asyncio.create_task(self._update())
+            self._update_task.add_done_callback(self._update_done)
+        # Cancelling one caller does not cancel the refresh shared with others
+        missing = await asyncio.shield(self._update_task)
+        if remove_missing:
+            with self.batch():
+                self._remove_items(missing)
+
+    def _update_done(self, task: asyncio.Task[set[str]]) -> None:
+        """Stop sharing finished refresh."""
+        self._update_task = None
+        if not task.cancelled():
+            # Mark exception as retrieved in case all callers were cancelled
+            task.exception()
+
+    async def _update(self) -> set[str]:
+        """Request data and apply it, return object IDs missing from the data."""
+        received: set[str] = set()
+
+        def process_item(raw_item: dict[str, Any]) -> None:
+            if (obj_id := self._obj_id_from_raw(raw_item)) is not None:
+                received.add(obj_id)
+                self._update_item(obj_id, raw_item)
+
+        if not self.stream:
+            raw = await self.controller.request(self.api_request)
+            with self.batch():
+                for raw_item in raw.get("data", []):
+                    process_item(raw_item)
+        else:
+            # Batch per refresh rather than the handler wide batch, websocket
+            # frames received meanwhile are signalled as their own batches
+            batches = self._new_batches()
+
+            def process_streamed_item(raw_item: dict[str, Any]) -> None:
+                with self._collect(batches):
+                    process_item(raw_item)
+
+            try:
+                raw = await self.controller.request(
+                    self.api_request, process_streamed_item
+                )
+                with self._collect(batches):
+                    # Data not streamed, like a single object from a V2 API
+                    for raw_item in raw.get("data", []):
+                        process_item(raw_item)
+            finally:
+                self._signal_batches(batches)
+        self.initialized = True
+        return self._items.keys() - received
 
     @final
-    async def update(self) -> None:
-        """Refresh data."""
-        raw = await self.controller.request(self.api_request)
-        self.process_raw(raw.get("data", []))
+    async def iter_update(self, yield_every: int = 100) -> AsyncIterator[ApiItemT]:
+        """Refresh data, yielding items as they are applied.
+
+        Control is handed to the event loop every "yield_every" items so a
+        large refresh does not block it. Streaming handlers yield items while
+        the response is still being received, at most "yield_every" items are
+        buffered ahead of the consumer. Batch subscribers are signalled once
+        the iteration ends, also when it is stopped early.
+        """
+        batches = self._new_batches()
+        count = 0
+        try:
+            async with aclosing(self._iter_raw(yield_every)) as raw_items:
+                async for raw_item in raw_items:
+                    with self._collect(batches):
+                        self.process_item(raw_item)
+                    if (obj_id := self._obj_id_from_raw(raw_item)) is not None and (
+                        item := self._items.get(obj_id)
+                    ) is not None:
+                        yield item
+                    count += 1
+                    if count % yield_every == 0:
+                        await asyncio.sleep(0)
+        finally:
+            self._signal_batches(batches)
+        self.initialized = True
+
+    async def _iter_raw(self, buffer_size: int) -> AsyncGenerator[dict[str, Any]]:
+        """Request data and iterate over raw items as they become available.
+
+        Receiving a streamed response pauses while "buffer_size" items wait
+        for the consumer.
+        """
+        if not self.stream:
+            raw = await self.controller.request(self.api_request)
+            for raw_item in raw.get("data", []):
+                yield raw_item
+            return
+
+        queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue(buffer_size)
+
+        def put(raw_item: dict[str, Any]) -> Awaitable[None] | None:
+            if queue.full():
+                return queue.put(raw_item)
+            queue.put_nowait(raw_item)
+            return None
+
+        def request_done(_: asyncio.Task[TypedApiResponse]) -> None:
+            # A full queue is drained before noticing the request is done
+            with suppress(asyncio.QueueFull):
+                queue.put_nowait(None)
+
+        task = asyncio.create_task(self.controller.request(self.api_request, put))
+        task.add_done_callback(request_done)
+        try:
+            while not (queue.empty() and task.done()):
+                if (queued := await queue.get()) is None:
+                    break
+                yield queued
+            raw = await task
+        finally:
+            task.cancel()
+        for raw_item in raw.get("data", []):
+            yield raw_item
 
     @final
     def process_raw(self, raw: list[dict[str, Any]]) -> None:
         """Process full raw response."""
-        for raw_item in raw:
-            self.process_item(raw_item)
+        with self.batch():
+            for raw_item in raw:
+                self.process_item(raw_item)
 
     def _obj_id_from_raw(self, raw: dict[str, Any]) -> str | None:
         """Return object ID from raw data."""
@@ -121,9 +602,24 @@ class APIHandler(SubscriptionHandler, Generic[ApiItemT]):
 
         return cast(str, raw[obj_id_key])
 
+    @final
+    def process_frame(self, meta: Meta, data: list[dict[str, Any]]) -> None:
+        """Process all data elements of a websocket frame as one batch."""
+        with self.batch():
+            if meta.message in self.process_messages:
+                for raw in data:
+                    self.process_item(raw)
+
+            elif meta.message in self.remove_messages:
+                for raw in data:
+                    self.remove_item(raw)
+
     @final
     def process_message(self, message: Message) -> None:
-        """Process and forward websocket data."""
+        """Process and forward websocket data.
+
+        Kept for compatibility, websocket frames are processed by "process_frame".
+        """
         if message.meta.message in self.process_messages:
             self.process_item(message.data)
 
@@ -136,12 +632,110 @@ class APIHandler(SubscriptionHandler, Generic[ApiItemT]):
         if (obj_id := self._obj_id_from_raw(raw)) is None:
             return
 
-        obj_is_known = obj_id in self._items
-        self._items[obj_id] = self.item_cls(raw)
+        self._update_item(obj_id, raw)
+
+    def _update_item(self, obj_id: str, raw: Mapping[str, Any]) -> None:
+        """Store item data and signal subscribers about changed keys."""
+        # Key sets are only built when a change subscriber reads them
+        all_keys = frozenset(raw) if self._changes_subscriptions else frozenset()
+        if (item := self._items.get(obj_id)) is None:
+            item = self._items[obj_id] = self.item_cls(raw)
+            self._item_updated(obj_id, item)
+            self.signal_subscribers(ItemEvent.ADDED, obj_id, all_keys)
+            return
+
+        if not (
+            self.diff_mode or self._field_subscribers or self._changes_subscriptions
+        ):
+            item = self._items[obj_id] = self.item_cls(raw)
+            self._item_updated(obj_id, item)
+            self.signal_subscribers(ItemEvent.CHANGED, obj_id, all_keys)
+            return
+
+        changed_keys = diff_raw(item.raw, raw)
+        if self.diff_mode and not changed_keys:
+            return
+
+        watched = [(name, getattr(item, name)) for name in self._watched_properties]
+
+        if self.diff_mode:
+            item.raw = raw
+        else:
+            item = self._items[obj_id] = self.item_cls(raw)
+        self._item_updated(obj_id, item)
+
+        if watched:
+            changed_keys |= {
+                name for name, value in watched if getattr(item, name) != value
+            }
+
+        self.signal_subscribers(ItemEvent.CHANGED, obj_id, changed_keys)
+
+    def _item_updated(self, obj_id: str, item: ApiItemT) -> None:
+        """Move updated item to its current index keys and update columns.
+
+        Called before subscribers are signalled.
+        """
+        if self.column_store is not None:
+            self.column_store.update(obj_id, item.raw)
+        if not self.indexes:
+            return
+        keys = tuple(index.keys(item.raw) for index in self.indexes.values())
+        if (old_keys := self._index_keys.get(obj_id)) == keys:
+            return
+        if old_keys is not None:
+            self._unindex(obj_id, old_keys)
+        self._index_keys[obj_id] = keys
+        for index, index_keys in zip(self._indexes.values(), keys, strict=True):
+            for key in index_keys:
+                index.setdefault(key, {})[obj_id] = None
+
+    def _item_removed(self, obj_id: str) -> None:
+        """Remove item from indexes and columns.
+
+        Called before subscribers are signalled.
+        """
+        if self.column_store is not None:
+            self.column_store.remove(obj_id)
+        if (old_keys := self._index_keys.pop(obj_id, None)) is not None:
+            self._unindex(obj_id, old_keys)
+
+    def _unindex(self, obj_id: str, keys: tuple[tuple[Hashable, ...], ...]) -> None:
+        """Remove object ID from index keys."""
+        for index, index_keys in zip(self._indexes.values(), keys, strict=True):
+            for key in index_keys:
+                obj_ids = index[key]
+                del obj_ids[obj_id]
+                if not obj_ids:
+                    del index[key]
+
+    @final
+    def by(self, index_name: str, key: Hashable) -> list[ApiItemT]:
+        """List items with key in index."""
+        return [
+            self._items[obj_id] for obj_id in self._indexes[index_name].get(key, {})
+        ]
 
-        self.signal_subscribers(
-            ItemEvent.CHANGED if obj_is_known else ItemEvent.ADDED,
-            obj_id,
+    @final
+    def enable_columns(self) -> ColumnStore:
+        """Store numeric fields of items in columns for fast aggregation.
+
+        Columns are filled from current items and kept up to date on updates.
+        """
+        if self.column_store is None:
+            self.column_store = ColumnStore(self.columns)
+            for obj_id, item in self._items.items():
+                self.column_store.update(obj_id, item.raw)
+        return self.column_store
+
+    def _field_filter_updated(self) -> None:
+        """Track model properties used as field filters."""
+        self._watched_properties = tuple(
+            field_name
+            for field_name in self._field_subscribers
+            if isinstance(
+                getattr(self.item_cls, field_name, None), (property, cached_property)
+            )
         )
 
     @final
@@ -150,9 +744,14 @@ class APIHandler(SubscriptionHandler, Generic[ApiItemT]):
         if (obj_id := self._obj_id_from_raw(raw)) is None:
             return
 
-        if obj_id in self._items:
-            self._items.pop(obj_id)
-            self.signal_subscribers(ItemEvent.DELETED, obj_id)
+        self._remove_items((obj_id,))
+
+    def _remove_items(self, obj_ids: Iterable[str]) -> None:
+        """Remove stored items of object IDs and signal subscribers."""
+        for obj_id in obj_ids:
+            if self._items.pop(obj_id, None) is not None:
+                self._item_removed(obj_id)
+                self.signal_subscribers(ItemEvent.DELETED, obj_id)
 
     @final
     def items(self) -> ItemsView[str, ApiItemT]:
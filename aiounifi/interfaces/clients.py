@@ -9,7 +9,19 @@ from ..models.client import (
     ClientRemoveRequest,
 )
 from ..models.message import MessageKey
-from .api_handlers import APIHandler
+from .api_handlers import APIHandler, Index
+
+# Column name and raw field of numeric client data
+CLIENT_COLUMNS = {
+    "rx_bytes": "rx_bytes",
+    "tx_bytes": "tx_bytes",
+    "wired_rx_bytes": "wired-rx_bytes",
+    "wired_tx_bytes": "wired-tx_bytes",
+    "wired_rx_bytes_r": "wired-rx_bytes-r",
+    "wired_tx_bytes_r": "wired-tx_bytes-r",
+    "uptime": "uptime",
+    "last_seen": "last_seen",
+}
 
 
 class Clients(APIHandler[Client]):
@@ -20,6 +32,31 @@ class Clients(APIHandler[Client]):
     process_messages = (MessageKey.CLIENT,)
     remove_messages = (MessageKey.CLIENT_REMOVED,)
     api_request = ClientListRequest.create()
+    indexes = {
+        "access_point": Index("ap_mac"),
+        "switch_port": Index(
+            lambda raw: (raw["sw_mac"], raw.get("sw_port")) if "sw_mac" in raw else None
+        ),
+        "essid": Index("essid"),
+        "ip": Index("ip"),
+    }
+    columns = CLIENT_COLUMNS
+
+    def for_access_point(self, mac: str) -> list[Client]:
+        """List clients connected to access point."""
+        return self.by("access_point", mac)
+
+    def for_switch_port(self, mac: str, port: int) -> list[Client]:
+        """List clients connected to port of switch."""
+        return self.by("switch_port", (mac, port))
+
+    def for_essid(self, essid: str) -> list[Client]:
+        """List clients connected to ESSID."""
+        return self.by("essid", essid)
+
+    def for_ip(self, ip: str) -> list[Client]:
+        """List clients using IP address."""
+        return self.by("ip", ip)
 
     async def block(self, mac: str) -> TypedApiResponse:
         """Block client from controller."""
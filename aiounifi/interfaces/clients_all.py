@@ -1,7 +1,11 @@
 """Clients are devices on a UniFi network."""
 
-from ..models.client import AllClientListRequest, Client
+from collections.abc import Mapping
+from typing import Any
+
+from ..models.client import CLIENT_FIELDS, AllClientListRequest, Client
 from .api_handlers import APIHandler
+from .clients import CLIENT_COLUMNS
 
 
 class ClientsAll(APIHandler[Client]):
@@ -10,3 +14,13 @@ class ClientsAll(APIHandler[Client]):
     obj_id_key = "mac"
     item_cls = Client
     api_request = AllClientListRequest.create()
+    stream = True
+    columns = CLIENT_COLUMNS
+    # Only store raw fields exposed by Client, reduces memory of large client lists.
+    compact: bool = False
+
+    def _update_item(self, obj_id: str, raw: Mapping[str, Any]) -> None:
+        """Store item data, dropping raw fields not exposed in compact mode."""
+        if self.compact:
+            raw = {key: value for key, value in raw.items() if key in CLIENT_FIELDS}
+        super()._update_item(obj_id, raw)
@@ -0,0 +1,119 @@
+"""Columnar storage of numeric item fields for fast aggregation."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Mapping, Sequence
+import heapq
+import importlib
+from typing import Any
+
+# NumPy is optional, imported by name to type check with and without it
+np: Any
+try:
+    np = importlib.import_module("numpy")
+except ImportError:  # pragma: no cover
+    np = None
+
+
+class ColumnStore:
+    """Numeric raw fields of handler items kept in contiguous columns.
+
+    Every column is an "array.array" of doubles with one row per item,
+    "rows" maps object ID to row. A removed row is filled with the last row
+    so columns stay dense. Missing or non-numeric values are stored as 0.
+    Aggregates run on NumPy when installed.
+    """
+
+    def __init__(self, fields: Mapping[str, str]) -> None:
+        """Initialize column store.
+
+        "fields" - column name and raw field stored in the column.
+        """
+        self.fields = dict(fields)
+        self.columns: dict[str, array[float]] = {
+            name: array("d") for name in self.fields
+        }
+        self.rows: dict[str, int] = {}
+        self.obj_ids: list[str] = []
+
+    def __len__(self) -> int:
+        """Return number of rows."""
+        return len(self.obj_ids)
+
+    def update(self, obj_id: str, raw: Mapping[str, Any]) -> None:
+        """Store numeric fields of raw data in the row of object ID."""
+        if (row := self.rows.get(obj_id)) is None:
+            self.rows[obj_id] = len(self.obj_ids)
+            self.obj_ids.append(obj_id)
+            for name, key in self.fields.items():
+                self.columns[name].append(_number(raw.get(key)))
+            return
+        for name, key in self.fields.items():
+            self.columns[name][row] = _number(raw.get(key))
+
+    def remove(self, obj_id: str) -> None:
+        """Remove row of object ID, moving the last row in its place."""
+        if (row := self.rows.pop(obj_id, None)) is None:
+            return
+        last_obj_id = self.obj_ids.pop()
+        for column in self.columns.values():
+            last_value = column.pop()
+            if last_obj_id != obj_id:
+                column[row] = last_value
+        if last_obj_id != obj_id:
+            self.obj_ids[row] = last_obj_id
+            self.rows[last_obj_id] = row
+
+    def value(self, name: str, obj_id: str) -> float:
+        """Return column value of object ID."""
+        return self.columns[name][self.rows[obj_id]]
+
+    def sum(self, name: str) -> float:
+        """Return sum of column."""
+        if np is not None:
+            return float(np.frombuffer(self.columns[name]).sum())
+        return sum(self.columns[name])
+
+    def top(self, name: str, count: int) -> list[tuple[str, float]]:
+        """List object IDs and values of the largest values in column.
+
+        Ordered from largest to smallest.
+        """
+        column = self.columns[name]
+        count = min(count, len(column))
+        if count <= 0:
+            return []
+        if np is not None:
+            values = np.frombuffer(column)
+            rows = np.argpartition(values, -count)[-count:]
+            rows = rows[np.argsort(-values[rows], kind="stable")].tolist()
+        else:
+            rows = heapq.nlargest(count, range(len(column)), key=column.__getitem__)
+        return [(self.obj_ids[row], column[row]) for row in rows]
+
+    def histogram(self, name: str, bins: Sequence[float]) -> list[int]:
+        """Count column values per bin delimited by ascending "bins" edges.
+
+        Bins are half open except the last one which includes its upper edge,
+        values outside of the edges are not counted.
+        """
+        if len(bins) < 2:
+            raise ValueError("At least two bin edges are required")
+        if np is not None:
+            counts, _ = np.histogram(np.frombuffer(self.columns[name]), bins)
+            return [int(count) for count in counts]
+        counts = [0] * (len(bins) - 1)
+        lowest, highest = bins[0], bins[-1]
+        for value in self.columns[name]:
+            if lowest <= value <= highest:
+                counts[min(bisect_right(bins, value), len(bins) - 1) - 1] += 1
+        return counts
+
+
+def _number(value: Any) -> float:
+    """Return value as float, 0 if not a number."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    return 0.0
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
-import datetime
+import asyncio
+import base64
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from contextlib import suppress
+from email.utils import parsedate_to_datetime
+from functools import partial
 from http import HTTPStatus, cookies
 import logging
-from typing import TYPE_CHECKING, Any, cast
+import time
+from typing import TYPE_CHECKING, Any, TypeGuard, cast
 
 import aiohttp
 from aiohttp import client_exceptions
@@ -23,11 +28,15 @@ from ..errors import (
     RequestError,
     ResponseError,
     ServiceUnavailable,
+    TooManyRequests,
     TwoFaTokenRequired,
     WebsocketError,
 )
 from ..models.api import ERRORS
 from ..models.configuration import Configuration
+from .json_stream import JsonListStream
+from .scheduler import RequestPriority, RequestScheduler
+from .session_store import StoredSession
 
 if "partitioned" not in cookies.Morsel._reserved:  # type: ignore[attr-defined]
     # See: https://github.com/python/cpython/issues/112713
@@ -40,6 +49,8 @@ if TYPE_CHECKING:
 LOGGER = logging.getLogger(__name__)
 
 HTTP_STATUS_MFA_REQUIRED = 499
+# Seconds before session expiry to log in again, at most half the session lifetime
+SESSION_RENEW_MARGIN = 300.0
 
 
 class Connectivity:
@@ -57,7 +68,19 @@ class Connectivity:
         self.is_unifi_os = False
         self.headers: dict[str, str] = {}
         self.can_retry_login = False
-        self.ws_message_received: datetime.datetime | None = None
+        # Incremented by every login, tells requests if the session was renewed
+        self.session_generation = 0
+        self._login_task: asyncio.Task[None] | None = None
+        self._renew_handle: asyncio.TimerHandle | None = None
+        self._renew_task: asyncio.Task[None] | None = None
+        # Unix time the current session expires, None if not known
+        self._session_expiry: float | None = None
+        # Set by close, stops scheduling session renewals
+        self._closed = False
+        self.ws_message_received: float | None = None
+        self.scheduler = RequestScheduler(config.max_requests_in_flight)
+        # Shared GET requests in flight keyed by method, path and data
+        self._in_flight: dict[Hashable, asyncio.Task[TypedApiResponse]] = {}
 
         if config.ssl_context:
             LOGGER.warning("Using SSL context %s", config.ssl_context)
@@ -78,17 +101,17 @@ class Connectivity:
     async def login(self) -> None:
         """Log in to the UniFi controller.
 
-        Handles SSO MFA, 2FA, and error responses. Updates headers on success.
+        Handles SSO MFA, 2FA, and error responses. Replaces headers on success,
+        requests sent meanwhile keep using the current session.
         Raises RequestError or other custom exceptions on failure.
         """
-        self.headers.clear()
         url = f"{self.config.url}/api{'/auth/login' if self.is_unifi_os else '/login'}"
         auth: dict[str, Any] = {
             "username": self.config.username,
             "password": self.config.password,
             "rememberMe": True,
         }
-        response, bytes_data = await self._request("post", url, json=auth)
+        response, bytes_data = await self._request("post", url, json=auth, headers={})
 
         if response.status == HTTP_STATUS_MFA_REQUIRED:
             response, bytes_data = await self._handle_sso_mfa(url, auth, bytes_data)
@@ -104,6 +127,85 @@ class Connectivity:
             self._update_login_headers(response)
             self.can_retry_login = True
             LOGGER.debug("Logged in to UniFi %s", url)
+        await self._save_session()
+
+    async def restore_session(self) -> bool:
+        """Reuse the session stored by an earlier login instead of logging in.
+
+        The stored session is validated with a request of the logged in user,
+        a session that is malformed, expired or fails validation is removed
+        from the session store.
+
+        Returns:
+            bool: True if the stored session is valid, False otherwise.
+
+        """
+        if (store := self.config.session_store) is None or (
+            session := await store.load(self._session_key)
+        ) is None:
+            return False
+
+        try:
+            if not _is_stored_session(session):
+                raise RequestError("Stored session is malformed")
+            if (expiry := session.get("expires")) is not None and expiry <= time.time():
+                raise RequestError("Stored session expired")
+            url = (
+                f"{self.config.url}"
+                f"{'/proxy/network' if session['is_unifi_os'] else ''}/api/self"
+            )
+            response, bytes_data = await self._request(
+                "get", url, headers=session["headers"]
+            )
+            if not self._is_json_response(response) or self._is_error_response(
+                self._parse_json(bytes_data)
+            ):
+                raise RequestError("Stored session is not valid")
+        except AiounifiException as err:
+            LOGGER.debug("Stored UniFi session not reused: %s", err)
+            await store.remove(self._session_key)
+            return False
+
+        self.is_unifi_os = session["is_unifi_os"]
+        self.headers.clear()
+        self.headers.update(session["headers"])
+        self.can_retry_login = True
+        self.session_generation += 1
+        self._session_expiry = expiry
+        self._schedule_renewal()
+        LOGGER.debug("Reusing stored UniFi session")
+        return True
+
+    async def _save_session(self) -> None:
+        """Store the session of the current login in the session store."""
+        if (store := self.config.session_store) is None:
+            return
+        session = StoredSession(
+            is_unifi_os=self.is_unifi_os, headers=dict(self.headers)
+        )
+        if self._session_expiry is not None:
+            session["expires"] = self._session_expiry
+        await store.save(self._session_key, session)
+
+    async def close(self) -> None:
+        """Stop renewing the session in the background.
+
+        Call when the connectivity is no longer used.
+        """
+        self._closed = True
+        if self._renew_handle is not None:
+            self._renew_handle.cancel()
+            self._renew_handle = None
+        if (task := self._renew_task) is not None:
+            self._renew_task = None
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    @property
+    def _session_key(self) -> str:
+        """Identify stored sessions per user and host."""
+        return f"{self.config.username}@{self.config.host}:{self.config.port}"
 
     async def _handle_sso_mfa(
         self, url: str, auth: dict[str, Any], mfa_response_data: bytes
@@ -230,10 +332,54 @@ class Connectivity:
             response (aiohttp.ClientResponse): The HTTP response object.
 
         """
+        headers: dict[str, str] = {}
         if (csrf_token := response.headers.get("x-csrf-token")) is not None:
-            self.headers["x-csrf-token"] = csrf_token
+            headers["x-csrf-token"] = csrf_token
         if (cookie := response.headers.get("Set-Cookie")) is not None:
-            self.headers["Cookie"] = cookie
+            headers["Cookie"] = cookie
+        # Swapped in at once, a request never sees a partially updated session
+        self.headers.clear()
+        self.headers.update(headers)
+        self.session_generation += 1
+        # Stored as absolute time, a restored session expires as the cookie did
+        self._session_expiry = (
+            time.time() + lifetime
+            if cookie is not None
+            and (lifetime := _session_lifetime(cookie)) is not None
+            else None
+        )
+        self._schedule_renewal()
+
+    def _schedule_renewal(self) -> None:
+        """Schedule logging in again before the current session expires."""
+        if self._renew_handle is not None:
+            self._renew_handle.cancel()
+            self._renew_handle = None
+        if self._closed or self._session_expiry is None:
+            return
+        if (lifetime := self._session_expiry - time.time()) <= 0:
+            return
+        delay = max(lifetime - SESSION_RENEW_MARGIN, lifetime / 2)
+        LOGGER.debug("UniFi session expires in %s seconds", lifetime)
+        self._renew_handle = asyncio.get_running_loop().call_later(
+            delay, self._start_renewal
+        )
+
+    def _start_renewal(self) -> None:
+        """Start renewing the session in the background."""
+        self._renew_handle = None
+        self._renew_task = asyncio.create_task(self._renew_session())
+
+    async def _renew_session(self) -> None:
+        """Log in again before the session expires.
+
+        Requests made meanwhile wait for the login rather than being rejected.
+        """
+        LOGGER.debug("Renewing UniFi session")
+        try:
+            await self._relogin(self.session_generation)
+        except AiounifiException as err:
+            LOGGER.warning("Failed to renew UniFi session: %s", err)
 
     async def _login_local_2fa(
         self,
@@ -254,7 +400,9 @@ class Connectivity:
         """
         LOGGER.debug("Local 2FA required, retrying with TOTP token")
         token = pyotp.TOTP(totp_secret).now()
-        return await self._request("post", url, json={**auth, "ubic_2fa_token": token})
+        return await self._request(
+            "post", url, json={**auth, "ubic_2fa_token": token}, headers={}
+        )
 
     async def _login_sso_2fa(
         self,
@@ -295,13 +443,26 @@ class Connectivity:
         )
 
         token = pyotp.TOTP(totp_secret).now()
-        return await self._request("post", url, json={**auth, "token": token})
+        return await self._request(
+            "post", url, json={**auth, "token": token}, headers={}
+        )
 
-    async def request(self, api_request: ApiRequest) -> TypedApiResponse:
+    async def request(
+        self,
+        api_request: ApiRequest,
+        item_callback: Callable[[dict[str, Any]], Awaitable[None] | None] | None = None,
+        priority: RequestPriority | None = None,
+    ) -> TypedApiResponse:
         """Make a request to the API, retrying login on failure.
 
+        Requests are sent through the request scheduler and retried after
+        being rate limited. Identical GET requests in flight share a single
+        request and response, the shared response must not be modified.
+
         Args:
             api_request (ApiRequest): The API request object containing method, path, and data.
+            item_callback (Callable[[dict[str, Any]], Awaitable[None] | None] | None): Function to call with each element of the response data list while the response is received, those elements are not part of the returned data. An awaitable result is awaited before receiving more data.
+            priority (RequestPriority | None): Scheduling priority, defaults to REFRESH for GET requests and COMMAND otherwise.
 
         Returns:
             TypedApiResponse: The parsed response data from the API.
@@ -309,37 +470,146 @@ class Connectivity:
         Raises:
             LoginRequired: If login is required and cannot be retried.
             RequestError: For network or response errors.
+            TooManyRequests: If still rate limited after the scheduler retries.
 
         """
+        if priority is None:
+            priority = (
+                RequestPriority.REFRESH
+                if api_request.method == "get"
+                else RequestPriority.COMMAND
+            )
+        if item_callback is not None or api_request.method != "get":
+            return await self._api_request(api_request, item_callback, priority)
+
+        key = (
+            api_request.method,
+            api_request.full_path(self.config.site, self.is_unifi_os),
+            orjson.dumps(api_request.data, option=orjson.OPT_SORT_KEYS),
+        )
+        if (task := self._in_flight.get(key)) is None:
+            task = self._in_flight[key] = asyncio.create_task(
+                self._api_request(api_request, None, priority)
+            )
+            task.add_done_callback(partial(self._request_done, key))
+        # Cancelling one caller does not cancel the request shared with others
+        return await asyncio.shield(task)
+
+    def _request_done(
+        self, key: Hashable, task: asyncio.Task[TypedApiResponse]
+    ) -> None:
+        """Stop sharing finished request."""
+        del self._in_flight[key]
+        if not task.cancelled():
+            # Mark exception as retrieved in case all callers were cancelled
+            task.exception()
+
+    async def _api_request(
+        self,
+        api_request: ApiRequest,
+        item_callback: Callable[[dict[str, Any]], Awaitable[None] | None] | None,
+        priority: RequestPriority,
+        retry_login: bool = True,
+    ) -> TypedApiResponse:
+        """Make a request to the API, retrying once after logging in again."""
+        if self._login_task is not None:
+            # Session is being renewed, send request with the new session
+            with suppress(AiounifiException):
+                await asyncio.shield(self._login_task)
+        session_generation = self.session_generation
         url = self.config.url + api_request.full_path(
             self.config.site, self.is_unifi_os
         )
         data: TypedApiResponse = {}
+        stream: JsonListStream | None = None
+        chunk_callback: Callable[[bytes], Awaitable[None]] | None = None
+
+        if item_callback is not None:
+            stream = JsonListStream()
+
+            async def chunk_callback(chunk: bytes) -> None:
+                for element in stream.feed(chunk):
+                    if (pending := item_callback(element)) is not None:
+                        await pending
 
         try:
-            response, bytes_data = await self._request(
-                api_request.method, url, api_request.data
+            response, bytes_data = await self._scheduled_request(
+                api_request, url, priority, chunk_callback
             )
 
             if response.content_type == "application/json":
-                data = api_request.decode(bytes_data)
+                if stream is not None:
+                    data = api_request.to_response(stream.finish())
+                else:
+                    data = api_request.decode(bytes_data)
 
         except LoginRequired:
-            if not self.can_retry_login:
+            if not retry_login or not await self._relogin(session_generation):
                 raise
-            # Session likely expired, try again
-            self.can_retry_login = False
-            await self.login()
-            return await self.request(api_request)
+            return await self._api_request(
+                api_request, item_callback, priority, retry_login=False
+            )
 
         return data
 
+    async def _relogin(self, session_generation: int) -> bool:
+        """Log in again after a request of the session generation was rejected.
+
+        Concurrent callers share a single login. Returns true if the request
+        should be retried, which is also the case if a login completed since
+        the request was sent.
+        """
+        if self.session_generation != session_generation:
+            return True
+        if self._login_task is None:
+            if not self.can_retry_login:
+                return False
+            # Session likely expired, try again
+            self.can_retry_login = False
+            self._login_task = asyncio.create_task(self.login())
+            self._login_task.add_done_callback(self._login_done)
+        await asyncio.shield(self._login_task)
+        return True
+
+    def _login_done(self, task: asyncio.Task[None]) -> None:
+        """Allow a new login once the shared login finished."""
+        self._login_task = None
+        if not task.cancelled():
+            # Mark exception as retrieved in case all callers were cancelled
+            task.exception()
+
+    async def _scheduled_request(
+        self,
+        api_request: ApiRequest,
+        url: str,
+        priority: RequestPriority,
+        chunk_callback: Callable[[bytes], Awaitable[None]] | None,
+    ) -> tuple[aiohttp.ClientResponse, bytes]:
+        """Make request once scheduled, retry while rate limited."""
+        attempt = 0
+        while True:
+            try:
+                async with self.scheduler.slot(api_request.path, priority):
+                    return await self._request(
+                        api_request.method,
+                        url,
+                        api_request.data,
+                        chunk_callback=chunk_callback,
+                    )
+            except TooManyRequests:
+                if attempt >= self.scheduler.retries:
+                    raise
+                attempt += 1
+
     async def _request(
         self,
         method: str,
         url: str,
         json: Mapping[str, Any] | None = None,
         allow_redirects: bool = True,
+        *,
+        chunk_callback: Callable[[bytes], Awaitable[None]] | None = None,
+        headers: Mapping[str, str] | None = None,
     ) -> tuple[aiohttp.ClientResponse, bytes]:
         """Make a raw HTTP request to the API.
 
@@ -348,6 +618,8 @@ class Connectivity:
             url (str): The full request URL.
             json (Mapping[str, Any] | None): The JSON payload for the request, if any.
             allow_redirects (bool): Whether to allow redirects.
+            chunk_callback (Callable[[bytes], Awaitable[None]] | None): Function to await with each chunk of a JSON response body as it is received instead of returning the body.
+            headers (Mapping[str, str] | None): Headers to send instead of the session headers.
 
         Returns:
             tuple[aiohttp.ClientResponse, bytes]: The response object and response body as bytes.
@@ -355,7 +627,8 @@ class Connectivity:
         Raises:
             LoginRequired: If the response is 401 Unauthorized.
             Forbidden: If the response is 403 Forbidden.
-            ResponseError: For 404, 429, or invalid responses.
+            ResponseError: For 404 or invalid responses.
+            TooManyRequests: For other 429 rate limit errors.
             BadGateway: For 502 Bad Gateway.
             ServiceUnavailable: For 503 Service Unavailable.
             RequestError: For network or client errors.
@@ -371,7 +644,7 @@ class Connectivity:
                 url,
                 json=json,
                 ssl=self.config.ssl_context,
-                headers=self.headers,
+                headers=self.headers if headers is None else headers,
                 allow_redirects=allow_redirects,
             ) as res:
                 LOGGER.debug(
@@ -399,7 +672,15 @@ class Connectivity:
                         f"Call {url} received 503 service unavailable"
                     )
 
-                bytes_data = await res.read()
+                if (
+                    chunk_callback is not None
+                    and res.content_type == "application/json"
+                    and res.status != HTTPStatus.TOO_MANY_REQUESTS
+                ):
+                    async for chunk in res.content.iter_any():
+                        await chunk_callback(chunk)
+                else:
+                    bytes_data = await res.read()
 
         except client_exceptions.ClientError as err:
             raise RequestError(f"Error requesting data from {url}: {err}") from None
@@ -419,16 +700,23 @@ class Connectivity:
                 raise AuthenticationRateLimitError(
                     f"Call {url} received 429: {data.get('message', bytes_data)!r}"
                 )
-            # Fallback to old logic
-            raise ResponseError(f"Call {url} received 429: {bytes_data!r}")
+            raise TooManyRequests(
+                f"Call {url} received 429: {bytes_data!r}",
+                retry_after=_retry_after(res.headers.get("Retry-After")),
+            )
 
         return res, bytes_data
 
-    async def websocket(self, callback: Callable[[str], None]) -> None:
+    async def websocket(
+        self,
+        callback: Callable[[str], Awaitable[None] | None],
+        connected_callback: Callable[[], None] | None = None,
+    ) -> None:
         """Run the UniFi websocket connection and dispatch messages to a callback.
 
         Args:
-            callback (Callable[[str], None]): Function to call with each received text message.
+            callback (Callable[[str], Awaitable[None] | None]): Function to call with each received text message, an awaitable result is awaited before reading on.
+            connected_callback (Callable[[], None] | None): Function to call once the connection is established.
 
         Raises:
             aiohttp.ClientConnectorError: If the websocket connection cannot be established.
@@ -438,8 +726,9 @@ class Connectivity:
         Notes:
             - Only TEXT, CLOSED, and ERROR message types are handled explicitly. Others are logged as warnings.
             - The callback should be non-blocking and fast; slow callbacks may delay message processing.
-            - Reconnection logic is not handled here and should be implemented by the consumer.
+            - Reconnection logic is not handled here, see Controller.run_websocket.
             - On disconnect or error, an exception is raised for the consumer to handle.
+            - ws_message_received holds the time.monotonic() timestamp of the latest frame.
 
         """
         url = f"wss://{self.config.host}:{self.config.port}"
@@ -461,12 +750,16 @@ class Connectivity:
                     self.config.session.cookie_jar._cookies,  # type: ignore[attr-defined]
                 )
 
+                if connected_callback is not None:
+                    connected_callback()
+
                 async for message in websocket_connection:
-                    self.ws_message_received = datetime.datetime.now(datetime.UTC)
+                    self.ws_message_received = time.monotonic()
 
                     if message.type is aiohttp.WSMsgType.TEXT:
                         LOGGER.debug("Websocket '%s'", message.data)
-                        callback(message.data)
+                        if (pending := callback(message.data)) is not None:
+                            await pending
 
                     elif message.type is aiohttp.WSMsgType.CLOSED:
                         LOGGER.warning(
@@ -503,3 +796,63 @@ class Connectivity:
         except Exception as err:
             LOGGER.exception(err)
             raise WebsocketError from err
+
+
+def _is_stored_session(session: object) -> TypeGuard[StoredSession]:
+    """Check shape of a stored session, a store may return malformed data."""
+    return (
+        isinstance(session, dict)
+        and isinstance(session.get("is_unifi_os"), bool)
+        and isinstance(headers := session.get("headers"), dict)
+        and all(
+            isinstance(key, str) and isinstance(value, str)
+            for key, value in headers.items()
+        )
+        and isinstance(session.get("expires", 0.0), int | float)
+    )
+
+
+def _retry_after(value: str | None) -> float | None:
+    """Return seconds of a Retry-After header, None if missing or a date."""
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _session_lifetime(set_cookie: str) -> float | None:
+    """Return seconds until the earliest expiry of a session cookie.
+
+    Expiry is read from Max-Age, Expires and the "exp" claim of JWT values,
+    None if no expiry is known.
+    """
+    jar: cookies.SimpleCookie = cookies.SimpleCookie()
+    jar.load(set_cookie)
+    now = time.time()
+    lifetimes: list[float] = []
+    for morsel in jar.values():
+        if morsel["max-age"]:
+            with suppress(ValueError):
+                lifetimes.append(float(morsel["max-age"]))
+        if morsel["expires"]:
+            with suppress(TypeError, ValueError):
+                expires = parsedate_to_datetime(morsel["expires"])
+                lifetimes.append(expires.timestamp() - now)
+        if (expiry := _jwt_expiry(morsel.value)) is not None:
+            lifetimes.append(expiry - now)
+    return min(lifetimes, default=None)
+
+
+def _jwt_expiry(token: str) -> float | None:
+    """Return "exp" claim of a JWT, None if not a JWT with expiry."""
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    try:
+        payload = orjson.loads(
+            base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4))
+        )
+    except ValueError:
+        return None
+    expiry = payload.get("exp") if isinstance(payload, dict) else None
+    return float(expiry) if isinstance(expiry, (int, float)) else None
@@ -6,7 +6,7 @@ Access points, gateways, power plugs, switches.
 from ..models.api import TypedApiResponse
 from ..models.device import Device, DeviceListRequest, DeviceUpgradeRequest
 from ..models.message import MessageKey
-from .api_handlers import APIHandler
+from .api_handlers import APIHandler, Index
 
 
 class Devices(APIHandler[Device]):
@@ -16,6 +16,12 @@ class Devices(APIHandler[Device]):
     item_cls = Device
     process_messages = (MessageKey.DEVICE,)
     api_request = DeviceListRequest.create()
+    stream = True
+    indexes = {
+        "model": Index("model"),
+        "type": Index("type"),
+        "state": Index("state"),
+    }
 
     async def upgrade(self, mac: str) -> TypedApiResponse:
         """Upgrade network device."""
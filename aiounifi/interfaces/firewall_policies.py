@@ -1,7 +1,7 @@
 """Firewall policies as part of a UniFi network."""
 
 from ..models.firewall_policy import FirewallPolicy, FirewallPolicyListRequest
-from .api_handlers import APIHandler
+from .api_handlers import APIHandler, Index
 
 
 class FirewallPolicies(APIHandler[FirewallPolicy]):
@@ -10,3 +10,12 @@ class FirewallPolicies(APIHandler[FirewallPolicy]):
     obj_id_key = "_id"
     item_cls = FirewallPolicy
     api_request = FirewallPolicyListRequest.create()
+    indexes = {
+        "zone": Index(
+            lambda raw: (
+                raw.get("source", {}).get("zone_id"),
+                raw.get("destination", {}).get("zone_id"),
+            ),
+            multi=True,
+        ),
+    }
@@ -0,0 +1,102 @@
+"""Incremental decoding of the data list of JSON responses."""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+import orjson
+
+# Complete string, bracket or the quote of a string not yet fully received
+TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]|"')
+OPENING = (b"[", b"{")
+
+
+class JsonListStream:
+    """Split the data list of a JSON document into elements while it is received.
+
+    The data list is either a top level array or the array stored under
+    "key" of a top level object. Object elements are decoded as soon as
+    they are complete, so only a single element is buffered at a time.
+    Everything outside of the list is kept and decoded by "finish".
+    """
+
+    def __init__(self, key: str = "data") -> None:
+        """Initialize JSON list stream."""
+        self._key = orjson.dumps(key)
+        self._buffer = b""
+        self._pos = 0
+        self._depth = 0
+        # String last seen in the top level object, key of a following list
+        self._last_string = b""
+        self._list_depth = 0
+        self._list_done = False
+        self._element_start: int | None = None
+        self._rest: list[bytes] = []
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Add chunk of the document and return list elements completed by it."""
+        self._buffer += chunk
+        elements: list[Any] = []
+
+        while match := TOKEN.search(self._buffer, self._pos):
+            token = match.group()
+            if token == b'"':
+                self._pos = match.start()
+                break
+            self._pos = match.end()
+
+            if token[0] == 0x22:  # String
+                if self._depth == 1:
+                    self._last_string = token
+            elif token in OPENING:
+                self._open(token, match.start())
+            elif (element := self._close(match.start())) is not None:
+                elements.append(element)
+
+        if self._list_depth:
+            # Drop scanned list content not part of an incomplete element
+            start = self._pos if self._element_start is None else self._element_start
+            self._buffer, self._pos = self._buffer[start:], self._pos - start
+            if self._element_start is not None:
+                self._element_start = 0
+
+        return elements
+
+    def _open(self, token: bytes, start: int) -> None:
+        """Enter array or object starting at "start"."""
+        self._depth += 1
+        if self._list_depth:
+            if self._depth == self._list_depth + 1:
+                self._element_start = start
+
+        elif token == b"[" and not self._list_done and self._is_data_list():
+            self._list_depth = self._depth
+            self._rest.append(self._buffer[: self._pos])
+            self._buffer, self._pos = self._buffer[self._pos :], 0
+
+    def _close(self, start: int) -> Any:
+        """Leave array or object ending at "start", return completed element."""
+        element = None
+        if self._list_depth:
+            if self._depth == self._list_depth:
+                self._list_depth = 0
+                self._list_done = True
+                self._buffer, self._pos = self._buffer[start:], 1
+
+            elif (
+                self._depth == self._list_depth + 1 and self._element_start is not None
+            ):
+                element = orjson.loads(self._buffer[self._element_start : self._pos])
+                self._element_start = None
+
+        self._depth -= 1
+        return element
+
+    def _is_data_list(self) -> bool:
+        """Return true if the opened array is the data list."""
+        return self._depth == 1 or (self._depth == 2 and self._last_string == self._key)
+
+    def finish(self) -> Any:
+        """Decode the document with an empty list in place of the data list."""
+        return orjson.loads(b"".join(self._rest) + self._buffer)
@@ -0,0 +1,166 @@
+"""Bounded queue decoupling websocket reading from message handling."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+import enum
+import itertools
+import logging
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from .messages import message_object_id
+
+if TYPE_CHECKING:
+    from .messages import MessageHandler
+
+LOGGER = logging.getLogger(__name__)
+
+
+class OverflowPolicy(enum.StrEnum):
+    """What to do when the message queue is full."""
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
+
+
+@dataclass
+class MessageQueueMetrics:
+    """Counters of a message queue."""
+
+    received: int = 0
+    processed: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    max_depth: int = 0
+
+
+@dataclass
+class _CoalescedFrame:
+    """Latest data per object of queued frames of one message key."""
+
+    meta: dict[str, Any]
+    data: dict[Hashable, dict[str, Any]]
+
+
+class MessageQueue:
+    """Bounded queue between websocket reader and message handler.
+
+    Policy "block" pauses the reader while the queue is full,
+    "drop_oldest" discards the oldest frame to make room and
+    "coalesce" merges queued frames into one frame per message key with the
+    latest data per object ID, dropping the oldest entries if that does not
+    make room.
+    """
+
+    def __init__(
+        self,
+        handler: MessageHandler,
+        maxsize: int = 1000,
+        policy: OverflowPolicy = OverflowPolicy.BLOCK,
+    ) -> None:
+        """Initialize message queue."""
+        self.handler = handler
+        self.maxsize = maxsize
+        self.policy = policy
+        self.metrics = MessageQueueMetrics()
+        self._entries: OrderedDict[Hashable, str | _CoalescedFrame] = OrderedDict()
+        self._entry_ids = itertools.count()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+
+    @property
+    def depth(self) -> int:
+        """Number of queued entries."""
+        return len(self._entries)
+
+    async def put(self, raw_string: str) -> None:
+        """Queue websocket frame according to overflow policy."""
+        self.metrics.received += 1
+        if self.policy is OverflowPolicy.BLOCK:
+            while len(self._entries) >= self.maxsize:
+                self._not_full.clear()
+                await self._not_full.wait()
+        elif (
+            self.policy is OverflowPolicy.COALESCE
+            and len(self._entries) >= self.maxsize
+        ):
+            self._coalesce()
+        self._add(next(self._entry_ids), raw_string)
+        self._not_empty.set()
+
+    def _coalesce(self) -> None:
+        """Merge queued frames per message key keeping the latest data of each object.
+
+        Only done once the queue is full. Merged frames move to the end of the
+        queue and replaced data to the end of its frame to keep the order
+        between objects. Oldest entries are dropped until there is room.
+        """
+        entries, self._entries = self._entries, OrderedDict()
+        for entry_key, entry in entries.items():
+            if isinstance(entry, str):
+                self._merge(entry)
+            else:
+                self._entries[entry_key] = entry
+        while len(self._entries) >= self.maxsize:
+            self._entries.popitem(last=False)
+            self.metrics.dropped += 1
+
+    def _merge(self, raw_string: str) -> None:
+        """Merge queued frame into the coalesced frame of its message key."""
+        try:
+            raw = orjson.loads(raw_string)
+        except orjson.JSONDecodeError:
+            LOGGER.debug("Bad JSON data '%s'", raw_string)
+            self.metrics.dropped += 1
+            return
+        if not isinstance(raw, dict) or "meta" not in raw or "data" not in raw:
+            self.metrics.dropped += 1
+            return
+        key = ("message", raw["meta"].get("message"))
+        frame = self._entries.pop(key, None)
+        if not isinstance(frame, _CoalescedFrame):
+            frame = _CoalescedFrame(raw["meta"], {})
+        frame.meta = raw["meta"]
+        for data in raw["data"]:
+            obj_key: Hashable = message_object_id(data) or next(self._entry_ids)
+            if frame.data.pop(obj_key, None) is not None:
+                self.metrics.coalesced += 1
+            frame.data[obj_key] = data
+        self._entries[key] = frame
+
+    def _add(self, key: Hashable, entry: str | _CoalescedFrame) -> None:
+        """Add entry, dropping the oldest entry if the queue is full."""
+        if len(self._entries) >= self.maxsize:
+            self._entries.popitem(last=False)
+            self.metrics.dropped += 1
+        self._entries[key] = entry
+        self.metrics.max_depth = max(self.metrics.max_depth, len(self._entries))
+
+    async def run(self) -> None:
+        """Pass queued entries to message handler until cancelled.
+
+        Yields to the event loop between entries so reading can continue.
+        """
+        while True:
+            await self._not_empty.wait()
+            while self._entries:
+                _, entry = self._entries.popitem(last=False)
+                self._not_full.set()
+                try:
+                    if isinstance(entry, str):
+                        self.handler.new_data(entry)
+                    else:
+                        self.handler.handler(
+                            {"meta": entry.meta, "data": list(entry.data.values())}
+                        )
+                except Exception:
+                    LOGGER.exception("Failed to process websocket message")
+                self.metrics.processed += 1
+                await asyncio.sleep(0)
+            self._not_empty.clear()
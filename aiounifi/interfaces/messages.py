@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+from collections import Counter
+from collections.abc import Callable, Hashable
+import itertools
 import logging
 from typing import TYPE_CHECKING, Any
 
 import orjson
 
-from ..models.message import Message, MessageKey
+from ..models.message import Message, MessageKey, Meta
 
 if TYPE_CHECKING:
     from ..controller import Controller
@@ -17,10 +20,18 @@ LOGGER = logging.getLogger(__name__)
 
 
 SubscriptionCallback = Callable[[Message], None]
+FrameCallback = Callable[[Meta, list[dict[str, Any]]], None]
 SubscriptionType = tuple[SubscriptionCallback, tuple[MessageKey, ...] | None]
+FrameSubscriptionType = tuple[FrameCallback, tuple[MessageKey, ...] | None]
+RouteType = tuple[tuple[FrameCallback, ...], tuple[SubscriptionCallback, ...]]
 UnsubscribeType = Callable[[], None]
 
 
+def message_object_id(data: dict[str, Any]) -> str | None:
+    """Identify the object data of a message describes."""
+    return data.get("_id") or data.get("mac")
+
+
 class MessageHandler:
     """Message handler class."""
 
@@ -28,7 +39,14 @@ class MessageHandler:
         """Initialize message handler class."""
         self.controller = controller
         self._subscribers: list[SubscriptionType] = []
-        self._subscribed_messages: set[MessageKey] = set()
+        self._frame_subscribers: list[FrameSubscriptionType] = []
+        self._subscribed_messages: Counter[MessageKey] = Counter()
+        self._routes: dict[str, RouteType] = {}
+        # Seconds to merge data of the same object before dispatching, opt-in
+        self.coalesce_window: float | None = None
+        self._pending: dict[Hashable, tuple[dict[str, Any], dict[str, Any]]] = {}
+        self._pending_ids = itertools.count()
+        self._flush_handle: asyncio.TimerHandle | None = None
 
     def subscribe(
         self,
@@ -40,6 +58,28 @@ class MessageHandler:
         "callback" - callback function to call when on event.
         Return function to unsubscribe.
         """
+        return self._subscribe(self._subscribers, callback, message_filter)
+
+    def subscribe_frames(
+        self,
+        callback: FrameCallback,
+        message_filter: tuple[MessageKey, ...] | MessageKey | None = None,
+    ) -> UnsubscribeType:
+        """Subscribe to complete frames of messages.
+
+        "callback" - callback function called once per frame with its meta
+        and list of data elements.
+        Return function to unsubscribe.
+        """
+        return self._subscribe(self._frame_subscribers, callback, message_filter)
+
+    def _subscribe[CallbackT: (SubscriptionCallback, FrameCallback)](
+        self,
+        subscribers: list[tuple[CallbackT, tuple[MessageKey, ...] | None]],
+        callback: CallbackT,
+        message_filter: tuple[MessageKey, ...] | MessageKey | None,
+    ) -> UnsubscribeType:
+        """Register subscription and return function to unsubscribe."""
         if isinstance(message_filter, MessageKey):
             message_filter = (message_filter,)
 
@@ -47,13 +87,39 @@ class MessageHandler:
             self._subscribed_messages.update(message_filter)
 
         subscription = (callback, message_filter)
-        self._subscribers.append(subscription)
+        subscribers.append(subscription)
+        self._update_routes()
 
         def unsubscribe() -> None:
-            self._subscribers.remove(subscription)
+            subscribers.remove(subscription)
+            if message_filter is not None:
+                self._subscribed_messages.subtract(message_filter)
+                self._subscribed_messages = +self._subscribed_messages
+            self._update_routes()
 
         return unsubscribe
 
+    def _update_routes(self) -> None:
+        """Rebuild routing table from raw message key to callbacks.
+
+        Subscribers without a filter receive all subscribed message keys.
+        """
+        self._routes = {
+            message_key.value: (
+                tuple(
+                    callback
+                    for callback, message_filter in self._frame_subscribers
+                    if message_filter is None or message_key in message_filter
+                ),
+                tuple(
+                    callback
+                    for callback, message_filter in self._subscribers
+                    if message_filter is None or message_key in message_filter
+                ),
+            )
+            for message_key in self._subscribed_messages
+        }
+
     def new_data(self, raw_string: str) -> None:
         """Convert string data into parseable JSON data."""
         try:
@@ -62,28 +128,82 @@ class MessageHandler:
             LOGGER.debug("Bad JSON data '%s'", raw_string)
 
     def handler(self, raw: dict[str, Any]) -> None:
-        """Process data and identify where the message belongs."""
+        """Process data and identify where the message belongs.
+
+        Frames without subscribers are rejected before being parsed,
+        meta is shared between all data elements of a frame.
+        """
         if "meta" not in raw or "data" not in raw:
             return
 
-        for raw_data in raw["data"]:
-            data = Message.from_dict(
-                {
-                    "meta": raw["meta"],
-                    "data": raw_data,
-                }
+        if (route := self._routes.get(raw["meta"].get("message"))) is None:
+            return
+
+        # Only routed message types are watched, unused types never stall
+        self.controller.watchdog.record(raw["meta"]["message"])
+
+        if self.coalesce_window is not None:
+            self._coalesce(raw["meta"], raw["data"])
+            return
+
+        self._dispatch(route, raw["meta"], raw["data"])
+
+    def _coalesce(self, raw_meta: dict[str, Any], data: list[dict[str, Any]]) -> None:
+        """Keep only latest pending data per message key and object ID.
+
+        Replaced data is moved to the end to keep the order between objects.
+        """
+        for raw_data in data:
+            key: Hashable = next(self._pending_ids)
+            if (obj_id := message_object_id(raw_data)) is not None:
+                key = (raw_meta.get("message"), obj_id)
+                self._pending.pop(key, None)
+            self._pending[key] = (raw_meta, raw_data)
+
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self.coalesce_window or 0, self.flush
             )
-            if data.meta.message not in self._subscribed_messages:
-                break
 
-            for callback, message_filter in self._subscribers:
-                if (
-                    message_filter is not None
-                    and data.meta.message not in message_filter
-                ):
-                    continue
-                callback(data)
+    def flush(self) -> None:
+        """Dispatch pending coalesced data.
+
+        Consecutive data of the same message key is dispatched as one frame.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, {}
+        frames: list[tuple[dict[str, Any], list[dict[str, Any]]]] = []
+        for raw_meta, raw_data in pending.values():
+            if frames and frames[-1][0].get("message") == raw_meta.get("message"):
+                frames[-1][1].append(raw_data)
+            else:
+                frames.append((raw_meta, [raw_data]))
+
+        for raw_meta, data in frames:
+            if (route := self._routes.get(raw_meta.get("message", ""))) is not None:
+                self._dispatch(route, raw_meta, data)
+
+    def _dispatch(
+        self, route: RouteType, raw_meta: dict[str, Any], data: list[dict[str, Any]]
+    ) -> None:
+        """Pass frame to subscribers of route."""
+        meta = Meta.from_dict(raw_meta)
+        frame_callbacks, callbacks = route
+
+        for frame_callback in frame_callbacks:
+            frame_callback(meta, data)
+
+        if not callbacks:
+            return
+
+        for raw_data in data:
+            message = Message(meta=meta, data=raw_data)
+            for callback in callbacks:
+                callback(message)
 
     def __len__(self) -> int:
         """List number of message subscribers."""
-        return len(self._subscribers)
+        return len(self._subscribers) + len(self._frame_subscribers)
@@ -15,26 +15,42 @@ class Outlets(APIHandler[Outlet]):
     """Represents network device ports."""
 
     item_cls = Outlet
+    diff_mode = True
 
     def __init__(self, controller: Controller) -> None:
         """Initialize API handler."""
         super().__init__(controller)
+        # Object IDs per device ID, dict keys keep outlets ordered
+        self._device_outlets: dict[str, dict[str, None]] = {}
         controller.devices.subscribe(self.process_device)
+        controller.devices.add_batch_dependent(self)
 
     def process_device(self, event: ItemEvent, device_id: str) -> None:
+        """Add, update, remove."""
+        with self.batch():
+            self._process_device(event, device_id)
+
+    def _process_device(self, event: ItemEvent, device_id: str) -> None:
         """Add, update, remove."""
         if event in (ItemEvent.ADDED, ItemEvent.CHANGED):
             device = self.controller.devices[device_id]
-            for raw_outlet in device.outlet_table:
-                outlet = Outlet(raw_outlet)
-                obj_id = f"{device_id}_{outlet.index}"
-                self._items[obj_id] = outlet
-                self.signal_subscribers(event, obj_id)
+            if "outlet_table" not in device.raw:
+                return
+            obj_ids: dict[str, None] = {}
+            for raw_outlet in device.raw["outlet_table"]:
+                obj_ids[obj_id := f"{device_id}_{raw_outlet['index']}"] = None
+                self._update_item(obj_id, raw_outlet)
+            previous_obj_ids = self._device_outlets.get(device_id, {})
+            self._device_outlets[device_id] = obj_ids
+            self._remove_items(
+                [obj_id for obj_id in previous_obj_ids if obj_id not in obj_ids]
+            )
             return
 
-        matched_obj_ids = [
-            obj_id for obj_id in self._items if obj_id.startswith(device_id)
+        self._remove_items(self._device_outlets.pop(device_id, {}))
+
+    def for_device(self, device_id: str) -> list[Outlet]:
+        """List outlets of device."""
+        return [
+            self._items[obj_id] for obj_id in self._device_outlets.get(device_id, {})
         ]
-        for obj_id in matched_obj_ids:
-            self._items.pop(obj_id)
-            self.signal_subscribers(event, obj_id)
@@ -15,30 +15,43 @@ class Ports(APIHandler[Port]):
     """Represents network device ports."""
 
     item_cls = Port
+    diff_mode = True
 
     def __init__(self, controller: Controller) -> None:
         """Initialize API handler."""
         super().__init__(controller)
+        # Object IDs per device ID, dict keys keep ports ordered
+        self._device_ports: dict[str, dict[str, None]] = {}
         controller.devices.subscribe(self.process_device)
+        controller.devices.add_batch_dependent(self)
 
     def process_device(self, event: ItemEvent, device_id: str) -> None:
+        """Add, update, remove."""
+        with self.batch():
+            self._process_device(event, device_id)
+
+    def _process_device(self, event: ItemEvent, device_id: str) -> None:
         """Add, update, remove."""
         if event in (ItemEvent.ADDED, ItemEvent.CHANGED):
             device = self.controller.devices[device_id]
             if "port_table" not in device.raw:
                 return
+            obj_ids: dict[str, None] = {}
             for raw_port in device.raw["port_table"]:
-                port = Port(raw_port)
-                if (port_idx := port.port_idx or port.ifname) is None:
+                port_idx = raw_port.get("port_idx") or raw_port.get("ifname")
+                if port_idx is None:
                     continue
-                obj_id = f"{device_id}_{port_idx}"
-                self._items[obj_id] = port
-                self.signal_subscribers(event, obj_id)
+                obj_ids[obj_id := f"{device_id}_{port_idx}"] = None
+                self._update_item(obj_id, raw_port)
+            previous_obj_ids = self._device_ports.get(device_id, {})
+            self._device_ports[device_id] = obj_ids
+            self._remove_items(
+                [obj_id for obj_id in previous_obj_ids if obj_id not in obj_ids]
+            )
             return
 
-        matched_obj_ids = [
-            obj_id for obj_id in self._items if obj_id.startswith(device_id)
-        ]
-        for obj_id in matched_obj_ids:
-            self._items.pop(obj_id)
-            self.signal_subscribers(event, obj_id)
+        self._remove_items(self._device_ports.pop(device_id, {}))
+
+    def for_device(self, device_id: str) -> list[Port]:
+        """List ports of device."""
+        return [self._items[obj_id] for obj_id in self._device_ports.get(device_id, {})]
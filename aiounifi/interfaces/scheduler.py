@@ -0,0 +1,154 @@
+"""Schedule API requests to avoid overloading the controller."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import enum
+import heapq
+import itertools
+import logging
+import time
+
+from ..errors import TooManyRequests
+
+LOGGER = logging.getLogger(__name__)
+
+
+class RequestPriority(enum.IntEnum):
+    """Priority class of a request, lower values are sent first."""
+
+    COMMAND = 0
+    REFRESH = 1
+
+
+class TokenBucket:
+    """Rate limit of "rate" requests per second with bursts of "burst" requests."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """Initialize token bucket."""
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take a token, return seconds to wait until it is available.
+
+        Tokens may be taken ahead of time, later reservations wait longer.
+        """
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return max(0.0, -self._tokens / self.rate)
+
+
+class RequestScheduler:
+    """Limit requests in flight and order waiting requests by priority.
+
+    Requests to a path starting with a rate limited prefix wait for a token,
+    the longest matching prefix applies. A 429 response blocks all requests
+    for its "Retry-After" time or an exponential backoff between
+    "backoff_min" and "backoff_max" seconds.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 4,
+        retries: int = 3,
+        backoff_min: float = 1.0,
+        backoff_max: float = 60.0,
+    ) -> None:
+        """Initialize request scheduler.
+
+        "retries" - times a request is retried after a 429 response.
+        """
+        self.max_in_flight = max_in_flight
+        self.retries = retries
+        self.backoff_min = backoff_min
+        self.backoff_max = backoff_max
+        self.in_flight = 0
+        self.rate_limits: dict[str, TokenBucket] = {}
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._waiter_ids = itertools.count()
+        self._blocked_until = 0.0
+        self._backoffs = 0
+
+    def set_rate_limit(self, path_prefix: str, rate: float, burst: int = 1) -> None:
+        """Limit requests to paths starting with prefix, "" limits all paths."""
+        self.rate_limits[path_prefix] = TokenBucket(rate, burst)
+
+    def backoff(self, retry_after: float | None = None) -> None:
+        """Block requests after the controller signalled too many requests."""
+        if retry_after is None:
+            retry_after = min(self.backoff_max, self.backoff_min * 2**self._backoffs)
+        self._backoffs += 1
+        self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+        LOGGER.debug("Too many requests, backing off %s seconds", retry_after)
+
+    @asynccontextmanager
+    async def slot(
+        self, path: str, priority: RequestPriority = RequestPriority.REFRESH
+    ) -> AsyncIterator[None]:
+        """Wait until request to path may be sent, hold its slot while in flight.
+
+        A TooManyRequests error raised while in flight triggers a backoff.
+        """
+        if (bucket := self._rate_limit(path)) is not None and (
+            delay := bucket.reserve()
+        ):
+            await asyncio.sleep(delay)
+        while (delay := self._blocked_until - time.monotonic()) > 0:
+            await asyncio.sleep(delay)
+
+        await self._acquire(priority)
+        try:
+            yield
+        except TooManyRequests as err:
+            self.backoff(err.retry_after)
+            raise
+        else:
+            self._backoffs = 0
+        finally:
+            self._release()
+
+    def _rate_limit(self, path: str) -> TokenBucket | None:
+        """Return token bucket of the longest prefix matching path."""
+        prefixes = [prefix for prefix in self.rate_limits if path.startswith(prefix)]
+        if not prefixes:
+            return None
+        return self.rate_limits[max(prefixes, key=len)]
+
+    async def _acquire(self, priority: RequestPriority) -> None:
+        """Take a slot, wait behind requests of the same or higher priority."""
+        if self.in_flight < self.max_in_flight and not self._waiters:
+            self.in_flight += 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        waiter = (int(priority), next(self._waiter_ids), future)
+        heapq.heappush(self._waiters, waiter)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.cancelled():
+                # Release may already have skipped and dropped the waiter
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    heapq.heapify(self._waiters)
+            else:
+                # Slot was handed over before cancellation
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        """Hand slot over to the next waiting request or free it."""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            # Skip requests cancelled while waiting that did not resume yet
+            if not future.done():
+                future.set_result(None)
+                return
+        self.in_flight -= 1
@@ -0,0 +1,100 @@
+"""Persist login sessions to skip logging in on restart."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+from contextlib import suppress
+import logging
+import os
+from pathlib import Path
+from typing import Any, NotRequired, TypedDict, cast
+
+import orjson
+
+LOGGER = logging.getLogger(__name__)
+
+
+class StoredSession(TypedDict):
+    """Session state needed to make requests without logging in."""
+
+    is_unifi_os: bool
+    headers: dict[str, str]
+    # Unix time the session expires, missing if not known
+    expires: NotRequired[float]
+
+
+class SessionStore(ABC):
+    """Storage of sessions keyed per host and user.
+
+    Implementations handle their own storage errors, a session that can
+    not be loaded is treated as missing.
+    """
+
+    @abstractmethod
+    async def load(self, key: str) -> StoredSession | None:
+        """Return stored session of key, None if missing."""
+
+    @abstractmethod
+    async def save(self, key: str, session: StoredSession) -> None:
+        """Store session of key."""
+
+    @abstractmethod
+    async def remove(self, key: str) -> None:
+        """Remove stored session of key."""
+
+
+class FileSessionStore(SessionStore):
+    """Store sessions in a JSON file only readable by the current user.
+
+    The file is replaced atomically on every change.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Initialize file session store."""
+        self.path = Path(path)
+        self._lock = asyncio.Lock()
+
+    async def load(self, key: str) -> StoredSession | None:
+        """Return stored session of key, None if missing."""
+        sessions = await asyncio.to_thread(self._read)
+        return cast(StoredSession | None, sessions.get(key))
+
+    async def save(self, key: str, session: StoredSession) -> None:
+        """Store session of key."""
+        async with self._lock:
+            sessions = await asyncio.to_thread(self._read)
+            sessions[key] = session
+            await asyncio.to_thread(self._write, sessions)
+
+    async def remove(self, key: str) -> None:
+        """Remove stored session of key."""
+        async with self._lock:
+            sessions = await asyncio.to_thread(self._read)
+            if sessions.pop(key, None) is not None:
+                await asyncio.to_thread(self._write, sessions)
+
+    def _read(self) -> dict[str, Any]:
+        """Read all sessions, empty if the file is missing or invalid."""
+        try:
+            sessions = orjson.loads(self.path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (OSError, orjson.JSONDecodeError) as err:
+            LOGGER.warning("Failed to read UniFi sessions from %s: %s", self.path, err)
+            return {}
+        return sessions if isinstance(sessions, dict) else {}
+
+    def _write(self, sessions: dict[str, Any]) -> None:
+        """Write all sessions through a temporary file."""
+        temporary = self.path.with_name(f".{self.path.name}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as file:
+                file.write(orjson.dumps(sessions))
+            temporary.replace(self.path)
+        except OSError as err:
+            with suppress(OSError):
+                temporary.unlink(missing_ok=True)
+            LOGGER.warning("Failed to write UniFi sessions to %s: %s", self.path, err)
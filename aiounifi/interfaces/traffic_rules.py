@@ -8,7 +8,7 @@ from ..models.traffic_rule import (
     TrafficRuleEnableRequest,
     TrafficRuleListRequest,
 )
-from .api_handlers import APIHandler
+from .api_handlers import APIHandler, Index
 
 
 class TrafficRules(APIHandler[TrafficRule]):
@@ -17,6 +17,14 @@ class TrafficRules(APIHandler[TrafficRule]):
     obj_id_key = "_id"
     item_cls = TrafficRule
     api_request = TrafficRuleListRequest.create()
+    indexes = {
+        "target_device": Index(
+            lambda raw: (
+                target.get("client_mac") for target in raw.get("target_devices", ())
+            ),
+            multi=True,
+        ),
+    }
 
     async def enable(self, traffic_rule: TrafficRule) -> TypedApiResponse:
         """Enable traffic rule defined in controller."""
@@ -0,0 +1,90 @@
+"""Detect stalled websocket connections from gaps between frames."""
+
+from __future__ import annotations
+
+from collections import deque
+import time
+
+ANY_MESSAGE = "*"
+
+
+class WebsocketWatchdog:
+    """Track inter-frame gaps per message type to detect stalls.
+
+    A message type is stalled when the time since its last frame exceeds an
+    adaptive threshold, a high percentile of its recent gaps multiplied by
+    "factor", never lower than "min_threshold" seconds.
+    Gaps across all frames read from the websocket are tracked as message
+    type "*", a stall of those means the connection is dead.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.99,
+        factor: float = 3.0,
+        min_threshold: float = 60.0,
+        min_samples: int = 10,
+        history: int = 100,
+    ) -> None:
+        """Initialize websocket watchdog."""
+        self.percentile = percentile
+        self.factor = factor
+        self.min_threshold = min_threshold
+        self.min_samples = min_samples
+        self.history = history
+        self._gaps: dict[str, deque[float]] = {}
+        self._last_seen: dict[str, float] = {}
+
+    def reset(self) -> None:
+        """Forget last seen frames, learned gaps are kept.
+
+        Called when a new connection is established.
+        """
+        self._last_seen = {ANY_MESSAGE: time.monotonic()}
+
+    def record_frame(self, received: float | None = None) -> None:
+        """Record a frame read from the websocket as message type "*".
+
+        "received" - time.monotonic() timestamp of the frame, defaults to now.
+        Recorded by the reader so slow message handling is not seen as a stall.
+        """
+        self._record(ANY_MESSAGE, time.monotonic() if received is None else received)
+
+    def record(self, message: str) -> None:
+        """Record a handled frame of message type."""
+        self._record(message, time.monotonic())
+
+    def _record(self, message: str, now: float) -> None:
+        """Store gap since last frame of message type."""
+        if (last_seen := self._last_seen.get(message)) is not None:
+            if (gaps := self._gaps.get(message)) is None:
+                gaps = self._gaps[message] = deque(maxlen=self.history)
+            gaps.append(now - last_seen)
+        self._last_seen[message] = now
+
+    def threshold(self, message: str) -> float | None:
+        """Stall threshold in seconds of message type.
+
+        None if not enough gaps have been observed.
+        """
+        gaps = self._gaps.get(message, ())
+        if len(gaps) < self.min_samples:
+            return None
+        ordered = sorted(gaps)
+        index = min(len(ordered) - 1, int(self.percentile * len(ordered)))
+        return max(self.min_threshold, self.factor * ordered[index])
+
+    def stalled(self) -> list[str]:
+        """List message types that exceeded their stall threshold.
+
+        A reported message type is not reported again until a new frame
+        of that type has been received.
+        """
+        now = time.monotonic()
+        stalled = []
+        for message, last_seen in list(self._last_seen.items()):
+            threshold = self.threshold(message)
+            if threshold is not None and now - last_seen > threshold:
+                stalled.append(message)
+                del self._last_seen[message]
+        return stalled
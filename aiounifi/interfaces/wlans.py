@@ -3,7 +3,7 @@
 from ..models.api import TypedApiResponse
 from ..models.message import MessageKey
 from ..models.wlan import Wlan, WlanEnableRequest, WlanListRequest, wlan_qr_code
-from .api_handlers import APIHandler
+from .api_handlers import APIHandler, Index
 
 
 class Wlans(APIHandler[Wlan]):
@@ -13,6 +13,7 @@ class Wlans(APIHandler[Wlan]):
     item_cls = Wlan
     process_messages = (MessageKey.WLAN_CONF_UPDATED,)
     api_request = WlanListRequest.create()
+    indexes = {"site_id": Index("site_id")}
 
     async def enable(self, wlan: Wlan) -> TypedApiResponse:
         """Block client from controller."""
@@ -1,9 +1,10 @@
 """API management class and base class for the different end points."""
 
 from abc import ABC
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
-from typing import Any, TypedDict, TypeVar
+import enum
+from typing import Any, Self, TypedDict, TypeVar, cast, overload
 
 import orjson
 
@@ -46,12 +47,14 @@ class ApiRequest:
 
     def decode(self, raw: bytes) -> TypedApiResponse:
         """Put data, received from the unifi controller, into a TypedApiResponse."""
-        data: TypedApiResponse = orjson.loads(raw)
+        return self.to_response(orjson.loads(raw))
 
+    def to_response(self, data: Any) -> TypedApiResponse:
+        """Put decoded data into a TypedApiResponse, raise on error response."""
         if "meta" in data and data["meta"]["rc"] == "error":
             raise ERRORS.get(data["meta"]["msg"], AiounifiException)(data)
 
-        return data
+        return cast(TypedApiResponse, data)
 
 
 @dataclass
@@ -64,10 +67,8 @@ class ApiRequestV2(ApiRequest):
             return f"/proxy/network/v2/api/site/{site}{self.path}"
         return f"/v2/api/site/{site}{self.path}"
 
-    def decode(self, raw: bytes) -> TypedApiResponse:
-        """Put data, received from the unifi controller, into a TypedApiResponse."""
-        data = orjson.loads(raw)
-
+    def to_response(self, data: Any) -> TypedApiResponse:
+        """Put decoded data into a TypedApiResponse, raise on error response."""
         if "errorCode" in data:
             raise ERRORS.get(data["message"], AiounifiException)(data)
 
@@ -87,9 +88,70 @@ class ApiRequestV2(ApiRequest):
 class ApiItem(ABC):
     """Base class for all end points using APIItems class."""
 
+    __slots__ = ("_cache", "_cached_raw", "raw")
+
     def __init__(self, raw: Any) -> None:
         """Initialize API item."""
         self.raw = raw
+        # Values of cached properties, valid as long as "raw" is "_cached_raw",
+        # created on first use to keep items without cached properties small
+        self._cache: dict[str, Any]
+        self._cached_raw: Any = None
+
+
+class cached_property[T]:
+    """Property of an API item evaluated once until "raw" is replaced.
+
+    Changes made to the content of "raw" in place are not detected.
+    """
+
+    def __init__(self, func: Callable[[Any], T]) -> None:
+        """Initialize cached property."""
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    @overload
+    def __get__(self, instance: None, owner: type | None = None) -> Self: ...
+
+    @overload
+    def __get__(self, instance: ApiItem, owner: type | None = None) -> T: ...
+
+    def __get__(self, instance: ApiItem | None, owner: type | None = None) -> T | Self:
+        """Return cached value, evaluate it if missing or outdated."""
+        if instance is None:
+            return self
+        if instance._cached_raw is not instance.raw:
+            instance._cache = {}
+            instance._cached_raw = instance.raw
+        try:
+            return instance._cache[self.name]  # type: ignore[no-any-return]
+        except KeyError:
+            value = instance._cache[self.name] = self.func(instance)
+            return value
+
+
+# Unsupported enum values already logged, bounded as values come from the controller
+_UNSUPPORTED_VALUES: set[tuple[type[enum.Enum], object]] = set()
+UNSUPPORTED_VALUES_MAX = 1000
+
+
+def first_unsupported(enum_cls: type[enum.Enum], value: object) -> bool:
+    """Return true the first time an unsupported value of enum is seen.
+
+    Used by "_missing_" to log each unsupported value once. After
+    "UNSUPPORTED_VALUES_MAX" values have been seen, new values are not logged.
+    """
+    key = (enum_cls, value)
+    try:
+        if key in _UNSUPPORTED_VALUES:
+            return False
+    except TypeError:  # Unhashable value
+        return True
+    if len(_UNSUPPORTED_VALUES) >= UNSUPPORTED_VALUES_MAX:
+        return False
+    _UNSUPPORTED_VALUES.add(key)
+    return True
 
 
 ApiItemT = TypeVar("ApiItemT", bound=ApiItem)
@@ -99,6 +99,21 @@ class TypedClient(TypedDict):
     wired_rx_bytes_r: int
 
 
+# Raw fields exposed by Client, fields containing "-" are not part of TypedClient
+CLIENT_FIELDS = frozenset(
+    TypedClient.__required_keys__
+    | TypedClient.__optional_keys__
+    | {
+        "rx_bytes-r",
+        "tx_bytes-r",
+        "wired-rx_bytes",
+        "wired-rx_bytes-r",
+        "wired-tx_bytes",
+        "wired-tx_bytes-r",
+    }
+)
+
+
 @dataclass
 class AllClientListRequest(ApiRequest):
     """Request object for all clients list."""
@@ -173,6 +188,8 @@ class ClientRemoveRequest(ApiRequest):
 class Client(ApiItem):
     """Represents a client network device."""
 
+    __slots__ = ()
+
     raw: TypedClient
 
     @property
@@ -1,11 +1,16 @@
 """Python library to enable integration between Home Assistant and UniFi."""
 
+from __future__ import annotations
+
 from dataclasses import KW_ONLY, dataclass
 from ssl import SSLContext
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from aiohttp import ClientSession
 
+if TYPE_CHECKING:
+    from ..interfaces.session_store import SessionStore
+
 
 @dataclass
 class Configuration:
@@ -20,6 +25,9 @@ class Configuration:
     site: str = "default"
     ssl_context: SSLContext | Literal[False] = False
     totp_secret: str | None = None
+    max_requests_in_flight: int = 4
+    # Reuse sessions of earlier logins, e.g. across restarts
+    session_store: SessionStore | None = None
 
     @property
     def url(self) -> str:
@@ -9,7 +9,7 @@ import logging
 import re
 from typing import Any, NotRequired, Self, TypedDict, cast
 
-from .api import ApiItem, ApiRequest
+from .api import ApiItem, ApiRequest, cached_property, first_unsupported
 
 LOGGER = logging.getLogger(__name__)
 
@@ -511,7 +511,7 @@ class TypedDevice(TypedDict):
     outlet_ac_power_consumption: str
     outlet_enabled: bool
     outlet_overrides: list[TypedDeviceOutletOverrides]
-    outlet_table: list[TypedDeviceOutletTable]
+    outlet_table: NotRequired[list[TypedDeviceOutletTable]]
     overheating: bool
     power_source_ctrl_enabled: bool
     prev_non_busy_state: int
@@ -609,7 +609,8 @@ class DeviceType(enum.StrEnum):
     @classmethod
     def _missing_(cls, value: object) -> DeviceType:
         """Set default enum member if an unknown value is provided."""
-        LOGGER.warning("Unsupported device type %s %s", value, cls)
+        if first_unsupported(cls, value):
+            LOGGER.warning("Unsupported device type %s %s", value, cls)
         return DeviceType.UNKNOWN
 
 
@@ -625,7 +626,8 @@ class WifiBand(enum.StrEnum):
     @classmethod
     def _missing_(cls, value: object) -> WifiBand:
         """Set default enum member if an unknown band is provided."""
-        LOGGER.warning("Unsupported WiFi band %s, using UNKNOWN", value)
+        if first_unsupported(cls, value):
+            LOGGER.warning("Unsupported WiFi band %s, using UNKNOWN", value)
         return cls.UNKNOWN
 
 
@@ -650,7 +652,8 @@ class DeviceState(enum.IntEnum):
     @classmethod
     def _missing_(cls, value: object) -> DeviceState:
         """Set default enum member if an unknown value is provided."""
-        LOGGER.warning("Unsupported device state %s %s", value, cls)
+        if first_unsupported(cls, value):
+            LOGGER.warning("Unsupported device state %s %s", value, cls)
         return DeviceState.UNKNOWN
 
 
@@ -962,6 +965,8 @@ class DeviceSetLedStatus(ApiRequest):
 class Device(ApiItem):
     """Represents a network device."""
 
+    __slots__ = ()
+
     raw: TypedDevice
 
     @property
@@ -1127,10 +1132,16 @@ class Device(ApiItem):
             WifiBand enum member for the radio, or UNKNOWN if not found.
 
         """
-        for radio in self.radio_table:
-            if radio.get("name") == radio_name:
-                return WifiBand(radio.get("radio", "unknown"))
-        return WifiBand.UNKNOWN
+        return self.radio_bands.get(radio_name, WifiBand.UNKNOWN)
+
+    @cached_property
+    def radio_bands(self) -> dict[str, WifiBand]:
+        """WiFi band per radio name."""
+        return {
+            radio["name"]: WifiBand(radio.get("radio", "unknown"))
+            for radio in self.radio_table
+            if "name" in radio
+        }
 
     @property
     def speedtest_status(self) -> TypedDeviceSpeedtestStatus | None:
@@ -1139,7 +1150,7 @@ class Device(ApiItem):
             return cast(TypedDeviceSpeedtestStatus, value)
         return None
 
-    @property
+    @cached_property
     def state(self) -> DeviceState:
         """State of device."""
         return DeviceState(self.raw["state"])
@@ -1165,7 +1176,7 @@ class Device(ApiItem):
         """Device temperature sensors."""
         return self.raw.get("temperatures")
 
-    @property
+    @cached_property
     def type(self) -> DeviceType:
         """Type of device."""
         return DeviceType(self.raw.get("type", "unknown"))
@@ -45,6 +45,8 @@ class DPIRestrictionAppEnableRequest(ApiRequest):
 class DPIRestrictionApp(ApiItem):
     """Represents a DPI App configuration."""
 
+    __slots__ = ()
+
     raw: TypedDPIRestrictionApp
 
     @property
@@ -30,6 +30,8 @@ class TypedDPIRestrictionGroup(TypedDict):
 class DPIRestrictionGroup(ApiItem):
     """Represents a DPI Group configuration."""
 
+    __slots__ = ()
+
     raw: TypedDPIRestrictionGroup
 
     @property
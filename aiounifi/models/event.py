@@ -6,7 +6,7 @@ import enum
 import logging
 from typing import TypedDict, final
 
-from .api import ApiItem
+from .api import ApiItem, cached_property, first_unsupported
 
 LOGGER = logging.getLogger(__name__)
 
@@ -113,7 +113,8 @@ class EventKey(enum.Enum):
     @classmethod
     def _missing_(cls, value: object) -> EventKey:
         """Set default enum member if an unknown value is provided."""
-        LOGGER.warning("Unsupported event key %s", value)
+        if first_unsupported(cls, value):
+            LOGGER.warning("Unsupported event key %s", value)
         return EventKey.UNKNOWN
 
 
@@ -149,6 +150,8 @@ class TypedEvent(TypedDict):
 class Event(ApiItem):
     """UniFi event."""
 
+    __slots__ = ()
+
     raw: TypedEvent
 
     @property
@@ -156,7 +159,7 @@ class Event(ApiItem):
         """Datetime of event '2020-03-01T15:35:08Z'."""
         return self.raw["datetime"]
 
-    @property
+    @cached_property
     def key(self) -> EventKey:
         """Event key e.g. 'EVT_WU_Disconnected'."""
         key = EventKey(self.raw["key"])
@@ -52,6 +52,8 @@ class TypedFirewallPolicy(TypedDict):
 class FirewallPolicy(ApiItem):
     """Represent a firewall policy."""
 
+    __slots__ = ()
+
     raw: TypedFirewallPolicy
 
     @property
@@ -20,6 +20,8 @@ class TypedFirewallZone(TypedDict):
 class FirewallZone(ApiItem):
     """Represent a firewall zone."""
 
+    __slots__ = ()
+
     raw: TypedFirewallZone
 
     @property
@@ -7,6 +7,8 @@ import enum
 import logging
 from typing import Any, Self
 
+from .api import first_unsupported
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -62,7 +64,8 @@ class MessageKey(enum.Enum):
     @classmethod
     def _missing_(cls, value: object) -> MessageKey:
         """Set default enum member if an unknown value is provided."""
-        LOGGER.warning("Unsupported message key %s", value)
+        if first_unsupported(cls, value):
+            LOGGER.warning("Unsupported message key %s", value)
         return MessageKey.UNKNOWN
 
 
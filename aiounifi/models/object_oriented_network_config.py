@@ -138,6 +138,8 @@ class ObjectOrientedNetworkConfigUpdateRequest(ApiRequestV2):
 class ObjectOrientedNetworkConfig(ApiItem):
     """Represent an object-oriented network configuration."""
 
+    __slots__ = ()
+
     raw: TypedObjectOrientedNetworkConfig
 
     @property
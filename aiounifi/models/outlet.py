@@ -7,6 +7,8 @@ from .device import TypedDeviceOutletTable
 class Outlet(ApiItem):
     """Represents an outlet."""
 
+    __slots__ = ()
+
     raw: TypedDeviceOutletTable
 
     @property
@@ -6,7 +6,7 @@ from enum import StrEnum
 import logging
 from typing import cast
 
-from .api import ApiItem
+from .api import ApiItem, cached_property, first_unsupported
 from .device import TypedDevicePortTable
 
 LOGGER = logging.getLogger(__name__)
@@ -24,7 +24,8 @@ class PortMedia(StrEnum):
     @classmethod
     def _missing_(cls, value: object) -> PortMedia:
         """Set default enum member if an unknown media type is provided."""
-        LOGGER.warning("Unsupported port media %s, using UNKNOWN", value)
+        if first_unsupported(cls, value):
+            LOGGER.warning("Unsupported port media %s, using UNKNOWN", value)
         return cls.UNKNOWN
 
 
@@ -39,13 +40,16 @@ class PortPoEMode(StrEnum):
     @classmethod
     def _missing_(cls, value: object) -> PortPoEMode:
         """Set default enum member if an unknown PoE mode is provided."""
-        LOGGER.warning("Unsupported port PoE mode %s, using UNKNOWN", value)
+        if first_unsupported(cls, value):
+            LOGGER.warning("Unsupported port PoE mode %s, using UNKNOWN", value)
         return cls.UNKNOWN
 
 
 class Port(ApiItem):
     """Represents a network port."""
 
+    __slots__ = ()
+
     raw: TypedDevicePortTable
 
     @property
@@ -53,7 +57,7 @@ class Port(ApiItem):
         """Port name used by USG."""
         return self.raw.get("ifname")
 
-    @property
+    @cached_property
     def media(self) -> PortMedia:
         """Media port is connected to."""
         return PortMedia(self.raw.get("media", "unknown"))
@@ -95,7 +99,7 @@ class Port(ApiItem):
         """Is PoE supported/requested by client."""
         return self.raw.get("poe_enable")
 
-    @property
+    @cached_property
     def poe_mode(self) -> PortPoEMode:
         """PoE mode (auto, passthrough, off, or unknown)."""
         return PortPoEMode(self.raw.get("poe_mode", "unknown"))
@@ -50,6 +50,8 @@ class PortForwardEnableRequest(ApiRequest):
 class PortForward(ApiItem):
     """Represents a port forward configuration."""
 
+    __slots__ = ()
+
     raw: TypedPortForward
 
     @property
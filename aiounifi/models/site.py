@@ -36,6 +36,8 @@ class SiteListRequest(ApiRequest):
 class Site(ApiItem):
     """Represents a network device."""
 
+    __slots__ = ()
+
     raw: TypedSite
 
     @property
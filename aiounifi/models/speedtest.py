@@ -65,6 +65,8 @@ class SpeedtestTriggerRequest(ApiRequest):
 class SpeedtestStatus(ApiItem):
     """Represents a speedtest status."""
 
+    __slots__ = ()
+
     raw: TypedSpeedtestStatus
 
     @property
@@ -69,6 +69,8 @@ class SystemInformationRequest(ApiRequest):
 class SystemInformation(ApiItem):
     """Represents a client network device."""
 
+    __slots__ = ()
+
     raw: TypedSystemInfo
 
     @property
@@ -107,6 +107,8 @@ class TrafficRouteSaveRequest(ApiRequestV2):
 class TrafficRoute(ApiItem):
     """Represent a traffic route configuration."""
 
+    __slots__ = ()
+
     raw: TypedTrafficRoute
 
     @property
@@ -106,6 +106,8 @@ class TrafficRuleEnableRequest(ApiRequestV2):
 class TrafficRule(ApiItem):
     """Represent a traffic rule configuration."""
 
+    __slots__ = ()
+
     raw: TypedTrafficRule
 
     @property
@@ -126,6 +126,8 @@ class VoucherDeleteRequest(ApiRequest):
 class Voucher(ApiItem):
     """Represents a voucher."""
 
+    __slots__ = ()
+
     raw: TypedVoucher
 
     @property
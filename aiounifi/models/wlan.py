@@ -122,6 +122,8 @@ def wlan_qr_code(
 class Wlan(ApiItem):
     """Represent a WLAN configuration."""
 
+    __slots__ = ()
+
     raw: TypedWlan
 
     @property
@@ -0,0 +1,89 @@
+"""Measure memory per client stored by ClientsAll.
+
+python benchmarks/client_memory.py [number of clients]
+"""
+
+import sys
+import tracemalloc
+from typing import Any
+from unittest.mock import Mock
+
+from aiounifi.interfaces.clients_all import ClientsAll
+from aiounifi.models.client import Client
+
+
+class DictClient(Client):
+    """Client with a per instance __dict__, as before __slots__."""
+
+
+def raw_client(index: int) -> dict[str, Any]:
+    """Historical client as returned by /rest/user."""
+    mac = ":".join(f"{index >> shift & 0xFF:02x}" for shift in (40, 32, 24, 16, 8, 0))
+    return {
+        "_id": f"{index:024x}",
+        "mac": mac,
+        "site_id": "5a32aa4ee4b0412345678910",
+        "oui": "Apple",
+        "is_guest": False,
+        "first_seen": 1513271497 + index,
+        "last_seen": 1587765360 + index,
+        "is_wired": index % 3 == 0,
+        "hostname": f"client-{index}",
+        "name": f"Client {index}",
+        "noted": True,
+        "usergroup_id": "",
+        "fingerprint_source": 0,
+        "dev_cat": 1,
+        "dev_family": 9,
+        "os_name": 24,
+        "dev_vendor": 47,
+        "dev_id": 1234,
+        "device_name": "iPhone",
+        "fingerprint_engine_version": "3.0.1",
+        "fingerprint_override": False,
+        "confidence": 100,
+        "disconnect_timestamp": 1587765360 + index,
+        "wlanconf_id": "012345678910111213141516",
+        "last_connection_network_name": "LAN",
+        "last_connection_network_id": "5a32aa4ee4b0412345678911",
+        "last_uplink_name": "Access point",
+        "last_uplink_mac": f"78:8a:20:{index >> 16 & 0xFF:02x}:00:01",
+        "last_connection_mac": f"78:8a:20:{index >> 16 & 0xFF:02x}:00:02",
+        "last_ip": f"10.{index >> 16 & 0xFF}.{index >> 8 & 0xFF}.{index & 0xFF}",
+        "last_radio": "na",
+        "ipv6_addresses": [f"fe80::{index:x}:1", f"fd00::{index:x}:1"],
+        "fixed_ap_enabled": False,
+        "local_dns_record_enabled": False,
+        "virtual_network_override_enabled": False,
+        "fingerprint": {"dev_cat": 1, "dev_family": 9, "dev_id": 1234},
+    }
+
+
+def measure(count: int, item_cls: type[Client], compact: bool) -> float:
+    """Return bytes retained per client stored in ClientsAll, raw data included."""
+    handler = ClientsAll(Mock())
+    handler.item_cls = item_cls
+    handler.compact = compact
+
+    tracemalloc.start()
+    raw = [raw_client(index) for index in range(count)]
+    handler.process_raw(raw)
+    del raw
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / count
+
+
+def main() -> None:
+    """Print memory per client of each storage mode."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 60000
+    for label, item_cls, compact in (
+        ("__dict__", DictClient, False),
+        ("__slots__", Client, False),
+        ("__slots__, compact", Client, True),
+    ):
+        print(f"{label:>20}: {measure(count, item_cls, compact):7.0f} bytes/client")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+"""Library to communicate with a UniFi controller."""
+
+from .controller import Controller  # noqa: F401
+from .errors import *  # noqa: F403
@@ -0,0 +1 @@
+"""Program interfaces."""
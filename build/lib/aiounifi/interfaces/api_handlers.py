@@ -0,0 +1,398 @@
+"""API management class and base class for the different end points."""
+
+from __future__ import annotations
+
+from abc import ABC
+from collections.abc import (
+    Callable,
+    ItemsView,
+    Iterable,
+    Iterator,
+    Mapping,
+    ValuesView,
+)
+import enum
+import itertools
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast, final
+
+from ..models.api import ApiItemT, ApiRequest
+
+if TYPE_CHECKING:
+    from ..controller import Controller
+    from ..models.message import Message, MessageKey
+
+
+class ItemEvent(enum.Enum):
+    """The event action of the item."""
+
+    ADDED = "added"
+    CHANGED = "changed"
+    DELETED = "deleted"
+
+
+CallbackType = Callable[[ItemEvent, str], None]
+ChangesCallbackType = Callable[[ItemEvent, str, frozenset[str]], None]
+SubscriptionType = tuple[CallbackType | ChangesCallbackType, bool]
+# Ordered set of subscriptions keyed by subscription ID
+SubscribersType = dict[int, SubscriptionType]
+UnsubscribeType = Callable[[], None]
+
+ID_FILTER_ALL = "*"
+
+FilterT = TypeVar("FilterT", str, ItemEvent)
+
+_MISSING = object()
+
+
+def diff_raw(old: Mapping[str, Any], new: Mapping[str, Any]) -> frozenset[str]:
+    """Return top-level keys whose values differ between two raw dicts."""
+    if old == new:
+        return frozenset()
+    return frozenset(
+        key
+        for key in old.keys() | new.keys()
+        if old.get(key, _MISSING) != new.get(key, _MISSING)
+    )
+
+
+def _as_tuple(
+    value: Iterable[FilterT] | FilterT | None, default: tuple[FilterT, ...]
+) -> tuple[FilterT, ...]:
+    """Normalize a subscription filter into a tuple."""
+    if value is None:
+        return default
+    if isinstance(value, (str, ItemEvent)):
+        return (cast(FilterT, value),)
+    return tuple(value)
+
+
+class SubscriptionHandler(ABC):
+    """Manage subscription and notification to subscribers.
+
+    Subscriptions are indexed per event and object ID so signalling only visits
+    interested subscribers. A bucket that is modified while signalling is
+    replaced with a copy rather than mutated, keeping ongoing iteration valid.
+    """
+
+    def __init__(self) -> None:
+        """Initialize subscription handler."""
+        self._subscribers: dict[ItemEvent, dict[str, SubscribersType]] = {
+            event: {} for event in ItemEvent
+        }
+        # CHANGED subscriptions with field filter indexed per field and object ID
+        self._field_subscribers: dict[str, dict[str, SubscribersType]] = {}
+        self._subscription_ids = itertools.count()
+        self._signalling = 0
+
+    def signal_subscribers(
+        self,
+        event: ItemEvent,
+        obj_id: str,
+        changed_keys: frozenset[str] = frozenset(),
+    ) -> None:
+        """Signal subscribers.
+
+        "changed_keys" - raw keys that changed, passed to change subscribers
+        and matched against field filters on CHANGED events.
+        """
+        subscribers = self._subscribers[event]
+        self._signalling += 1
+        try:
+            if (obj_subscribers := subscribers.get(obj_id)) is not None:
+                for callback, with_changes in obj_subscribers.values():
+                    if with_changes:
+                        cast(ChangesCallbackType, callback)(event, obj_id, changed_keys)
+                    else:
+                        cast(CallbackType, callback)(event, obj_id)
+
+            if (all_subscribers := subscribers.get(ID_FILTER_ALL)) is not None:
+                for callback, with_changes in all_subscribers.values():
+                    if with_changes:
+                        cast(ChangesCallbackType, callback)(event, obj_id, changed_keys)
+                    else:
+                        cast(CallbackType, callback)(event, obj_id)
+
+            if event is ItemEvent.CHANGED and self._field_subscribers:
+                self._signal_field_subscribers(obj_id, changed_keys)
+        finally:
+            self._signalling -= 1
+
+    def _signal_field_subscribers(
+        self, obj_id: str, changed_keys: frozenset[str]
+    ) -> None:
+        """Signal field filtered subscribers of the changed fields.
+
+        Only subscriptions indexed under a changed field are visited.
+        """
+        signalled: set[int] = set()
+        for field in self._field_subscribers.keys() & changed_keys:
+            if (field_subscribers := self._field_subscribers.get(field)) is None:
+                continue
+            for key in (obj_id, ID_FILTER_ALL):
+                if (subscribers := field_subscribers.get(key)) is None:
+                    continue
+                for subscription_id, (callback, with_changes) in subscribers.items():
+                    if subscription_id in signalled:
+                        continue
+                    signalled.add(subscription_id)
+                    if with_changes:
+                        cast(ChangesCallbackType, callback)(
+                            ItemEvent.CHANGED, obj_id, changed_keys
+                        )
+                    else:
+                        cast(CallbackType, callback)(ItemEvent.CHANGED, obj_id)
+
+    def subscribe(
+        self,
+        callback: CallbackType,
+        event_filter: tuple[ItemEvent, ...] | ItemEvent | None = None,
+        id_filter: tuple[str] | str | None = None,
+        field_filter: Iterable[str] | str | None = None,
+    ) -> UnsubscribeType:
+        """Subscribe to added events.
+
+        "field_filter" - raw keys or model properties, CHANGED events are only
+        signalled when one of them changed.
+        """
+        return self._subscribe(callback, event_filter, id_filter, field_filter, False)
+
+    def subscribe_changes(
+        self,
+        callback: ChangesCallbackType,
+        event_filter: tuple[ItemEvent, ...] | ItemEvent | None = None,
+        id_filter: tuple[str] | str | None = None,
+        field_filter: Iterable[str] | str | None = None,
+    ) -> UnsubscribeType:
+        """Subscribe to events together with the set of changed raw keys.
+
+        ADDED carries all keys of the new item, DELETED an empty set.
+        """
+        return self._subscribe(callback, event_filter, id_filter, field_filter, True)
+
+    def _subscribe(
+        self,
+        callback: CallbackType | ChangesCallbackType,
+        event_filter: tuple[ItemEvent, ...] | ItemEvent | None,
+        id_filter: tuple[str] | str | None,
+        field_filter: Iterable[str] | str | None,
+        with_changes: bool,
+    ) -> UnsubscribeType:
+        """Register subscription and return function to unsubscribe."""
+        events = _as_tuple(event_filter, tuple(ItemEvent))
+        obj_ids = _as_tuple(id_filter, (ID_FILTER_ALL,))
+        fields = _as_tuple(field_filter, ())
+
+        indexes: list[dict[str, SubscribersType]] = []
+        for event in events:
+            if fields and event is ItemEvent.CHANGED:
+                indexes.extend(
+                    self._field_subscribers.setdefault(field, {}) for field in fields
+                )
+            else:
+                indexes.append(self._subscribers[event])
+
+        subscription_id = next(self._subscription_ids)
+        subscription = (callback, with_changes)
+        for index in indexes:
+            for obj_id in obj_ids:
+                self._add_subscription(index, obj_id, subscription_id, subscription)
+        if fields:
+            self._field_filter_updated()
+
+        def unsubscribe() -> None:
+            for index in indexes:
+                for obj_id in obj_ids:
+                    self._remove_subscription(index, obj_id, subscription_id)
+            if fields:
+                self._remove_empty_fields(fields)
+
+        return unsubscribe
+
+    def _add_subscription(
+        self,
+        index: dict[str, SubscribersType],
+        obj_id: str,
+        subscription_id: int,
+        subscription: SubscriptionType,
+    ) -> None:
+        """Add subscription to the bucket of object ID."""
+        if (subscribers := index.get(obj_id)) is None:
+            index[obj_id] = {subscription_id: subscription}
+        elif self._signalling:
+            index[obj_id] = {**subscribers, subscription_id: subscription}
+        else:
+            subscribers[subscription_id] = subscription
+
+    def _remove_subscription(
+        self,
+        index: dict[str, SubscribersType],
+        obj_id: str,
+        subscription_id: int,
+    ) -> None:
+        """Remove subscription from the bucket of object ID."""
+        if (subscribers := index.get(obj_id)) is None:
+            return
+        if subscription_id not in subscribers:
+            return
+        if len(subscribers) == 1:
+            del index[obj_id]
+        elif self._signalling:
+            index[obj_id] = {
+                key: value
+                for key, value in subscribers.items()
+                if key != subscription_id
+            }
+        else:
+            del subscribers[subscription_id]
+
+    def _remove_empty_fields(self, fields: tuple[str, ...]) -> None:
+        """Drop field indexes without subscribers."""
+        for field in fields:
+            if field in self._field_subscribers and not self._field_subscribers[field]:
+                del self._field_subscribers[field]
+        self._field_filter_updated()
+
+    def _field_filter_updated(self) -> None:
+        """Field filters have been added or removed."""
+
+
+class APIHandler(SubscriptionHandler, Generic[ApiItemT]):
+    """Base class for a map of API Items."""
+
+    obj_id_key: str | tuple[str, ...]
+    item_cls: type[ApiItemT]
+    api_request: ApiRequest
+    process_messages: tuple[MessageKey, ...] = ()
+    remove_messages: tuple[MessageKey, ...] = ()
+    # Compare updates with stored raw data, update in place and drop no-op updates.
+    # Field filters enable comparison without dropping updates.
+    diff_mode: bool = False
+
+    def __init__(self, controller: Controller) -> None:
+        """Initialize API handler."""
+        super().__init__()
+        self.controller = controller
+        self._items: dict[str, ApiItemT] = {}
+        self._watched_properties: tuple[str, ...] = ()
+
+        if message_filter := self.process_messages + self.remove_messages:
+            controller.messages.subscribe(self.process_message, message_filter)
+
+    @final
+    async def update(self) -> None:
+        """Refresh data."""
+        raw = await self.controller.request(self.api_request)
+        self.process_raw(raw.get("data", []))
+
+    @final
+    def process_raw(self, raw: list[dict[str, Any]]) -> None:
+        """Process full raw response."""
+        for raw_item in raw:
+            self.process_item(raw_item)
+
+    def _obj_id_from_raw(self, raw: dict[str, Any]) -> str | None:
+        """Return object ID from raw data."""
+        obj_id_keys = (
+            (self.obj_id_key,) if isinstance(self.obj_id_key, str) else self.obj_id_key
+        )
+        obj_id_key = next((key for key in obj_id_keys if key in raw), None)
+
+        if obj_id_key is None:
+            return None
+
+        return cast(str, raw[obj_id_key])
+
+    @final
+    def process_message(self, message: Message) -> None:
+        """Process and forward websocket data."""
+        if message.meta.message in self.process_messages:
+            self.process_item(message.data)
+
+        elif message.meta.message in self.remove_messages:
+            self.remove_item(message.data)
+
+    @final
+    def process_item(self, raw: dict[str, Any]) -> None:
+        """Process item data."""
+        if (obj_id := self._obj_id_from_raw(raw)) is None:
+            return
+
+        self._update_item(obj_id, raw)
+
+    def _update_item(self, obj_id: str, raw: Mapping[str, Any]) -> None:
+        """Store item data and signal subscribers about changed keys."""
+        if (item := self._items.get(obj_id)) is None:
+            self._items[obj_id] = self.item_cls(raw)
+            self.signal_subscribers(ItemEvent.ADDED, obj_id, frozenset(raw))
+            return
+
+        if not (self.diff_mode or self._field_subscribers):
+            self._items[obj_id] = self.item_cls(raw)
+            self.signal_subscribers(ItemEvent.CHANGED, obj_id, frozenset(raw))
+            return
+
+        changed_keys = diff_raw(item.raw, raw)
+        if self.diff_mode and not changed_keys:
+            return
+
+        watched = [(name, getattr(item, name)) for name in self._watched_properties]
+
+        if self.diff_mode:
+            item.raw = raw
+        else:
+            item = self._items[obj_id] = self.item_cls(raw)
+
+        if watched:
+            changed_keys |= {
+                name for name, value in watched if getattr(item, name) != value
+            }
+
+        self.signal_subscribers(ItemEvent.CHANGED, obj_id, changed_keys)
+
+    def _field_filter_updated(self) -> None:
+        """Track model properties used as field filters."""
+        self._watched_properties = tuple(
+            field
+            for field in self._field_subscribers
+            if isinstance(getattr(self.item_cls, field, None), property)
+        )
+
+    @final
+    def remove_item(self, raw: dict[str, Any]) -> None:
+        """Remove item."""
+        if (obj_id := self._obj_id_from_raw(raw)) is None:
+            return
+
+        if obj_id in self._items:
+            self._items.pop(obj_id)
+            self.signal_subscribers(ItemEvent.DELETED, obj_id)
+
+    @final
+    def items(self) -> ItemsView[str, ApiItemT]:
+        """Return items dictionary."""
+        return self._items.items()
+
+    @final
+    def values(self) -> ValuesView[ApiItemT]:
+        """Return items."""
+        return self._items.values()
+
+    @final
+    def get(self, obj_id: str, default: Any | None = None) -> ApiItemT | None:
+        """Get item value based on key, return default if no match."""
+        return self._items.get(obj_id, default)
+
+    @final
+    def __contains__(self, obj_id: str) -> bool:
+        """Validate membership of item ID."""
+        return obj_id in self._items
+
+    @final
+    def __getitem__(self, obj_id: str) -> ApiItemT:
+        """Get item value based on key."""
+        return self._items[obj_id]
+
+    @final
+    def __iter__(self) -> Iterator[str]:
+        """Allow iterate over items."""
+        return iter(self._items)
@@ -1,10 +1,30 @@
 """Test API handlers."""
 
-from unittest.mock import Mock
+import asyncio
+from copy import deepcopy
+from unittest.mock import Mock, call, patch
 
 import pytest
 
-from aiounifi.interfaces.api_handlers import APIHandler, ItemEvent
+from aiounifi.errors import RequestError
+from aiounifi.interfaces.api_handlers import (
+    APIHandler,
+    Index,
+    ItemBatch,
+    ItemEvent,
+    diff_raw,
+)
+from aiounifi.models.api import ApiItem, cached_property
+from aiounifi.models.message import Message, MessageKey, Meta
+
+from .fixtures import (
+    MESSAGE_WIRELESS_CLIENT_REMOVED,
+    STRIP_UP6,
+    SWITCH_8_PORT,
+    SWITCH_16_PORT_POE,
+    WIRED_CLIENT,
+    WIRELESS_CLIENT,
+)
 
 
 @pytest.mark.parametrize(
@@ -151,3 +171,585 @@ async def test_api_handler_tuple_obj_id_key_remove_item():
     handler.remove_item({"id": "2"})
     handler.remove_item({})
     assert mock_subscribe_cb.call_count == 2
+
+
+class DiffItem(ApiItem):
+    """API item used to verify diff mode."""
+
+    @property
+    def is_big(self) -> bool:
+        """Derived property used to verify property field filters."""
+        return self.raw.get("a", 0) > 10
+
+    @cached_property
+    def is_odd(self) -> bool:
+        """Odd value used to verify cached property field filters."""
+        return self.raw.get("a", 0) % 2 == 1
+
+
+@pytest.mark.parametrize(
+    ("old", "new", "expected"),
+    [
+        ({"a": 1}, {"a": 1}, set()),
+        ({"a": 1, "b": 2}, {"a": 1, "b": 3}, {"b"}),
+        ({"a": 1}, {"a": 1, "b": 2}, {"b"}),
+        ({"a": 1, "b": 2}, {"a": 1}, {"b"}),
+        ({"a": {"x": 1}}, {"a": {"x": 2}}, {"a"}),
+    ],
+)
+def test_diff_raw(old, new, expected):
+    """Verify top-level key diffing of raw data."""
+    assert diff_raw(old, new) == expected
+
+
+async def test_api_handler_subscribe_changes():
+    """Verify change subscribers receive the changed raw keys."""
+    handler = APIHandler(Mock())
+    handler.obj_id_key = "key"
+    handler.item_cls = DiffItem
+
+    unsub = handler.subscribe_changes(mock_subscribe_cb := Mock())
+
+    handler.process_item({"key": "1", "a": 1})
+    mock_subscribe_cb.assert_called_with(ItemEvent.ADDED, "1", {"key", "a"})
+
+    handler.process_item({"key": "1", "a": 1})
+    mock_subscribe_cb.assert_called_with(ItemEvent.CHANGED, "1", frozenset())
+
+    handler.process_item({"key": "1", "a": 2})
+    mock_subscribe_cb.assert_called_with(ItemEvent.CHANGED, "1", {"a"})
+
+    # Changed keys do not depend on other subscriptions
+    unsub_field = handler.subscribe(Mock(), field_filter="b")
+    handler.process_item({"key": "1", "a": 3})
+    mock_subscribe_cb.assert_called_with(ItemEvent.CHANGED, "1", {"a"})
+    unsub_field()
+
+    handler.remove_item({"key": "1"})
+    mock_subscribe_cb.assert_called_with(ItemEvent.DELETED, "1", frozenset())
+    assert mock_subscribe_cb.call_count == 5
+
+    assert handler._changes_subscriptions == 1
+    unsub()
+    unsub()
+    assert handler._changes_subscriptions == 0
+
+
+async def test_api_handler_no_changes_subscribers():
+    """Verify key sets are not built without change subscribers."""
+    handler = APIHandler(Mock())
+    handler.obj_id_key = "key"
+    handler.item_cls = DiffItem
+    handler.subscribe(mock_subscribe_cb := Mock())
+
+    with patch("aiounifi.interfaces.api_handlers.frozenset") as mock_frozenset:
+        handler.process_item({"key": "1", "a": 1})
+        handler.process_item({"key": "1", "a": 2})
+    assert mock_frozenset.call_args_list == [call(), call()]
+    assert mock_subscribe_cb.call_count == 2
+
+
+async def test_api_handler_duplicate_filter():
+    """Verify subscriptions with repeated filter values unsubscribe cleanly."""
+    handler = APIHandler(Mock())
+    handler.subscribe(Mock(), ItemEvent.ADDED, id_filter="1")
+    unsub = handler.subscribe(Mock(), ItemEvent.ADDED, id_filter=("1", "1", "2", "2"))
+    unsub()
+    assert list(handler._subscribers[ItemEvent.ADDED]) == ["1"]
+
+
+async def test_api_handler_diff_mode():
+    """Verify diff mode drops no-op updates and updates items in place."""
+    handler = APIHandler(Mock())
+    handler.obj_id_key = "key"
+    handler.item_cls = DiffItem
+    handler.diff_mode = True
+
+    handler.subscribe(mock_subscribe_cb := Mock())
+    handler.subscribe_changes(mock_changes_cb := Mock(), ItemEvent.CHANGED)
+
+    handler.process_item({"key": "1", "a": 1, "b": 1})
+    item = handler["1"]
+    mock_subscribe_cb.assert_called_once_with(ItemEvent.ADDED, "1")
+    mock_changes_cb.assert_not_called()
+
+    handler.process_item({"key": "1", "a": 1, "b": 1})
+    assert mock_subscribe_cb.call_count == 1
+    mock_changes_cb.assert_not_called()
+
+    handler.process_item({"key": "1", "a": 2, "b": 1})
+    mock_subscribe_cb.assert_called_with(ItemEvent.CHANGED, "1")
+    mock_changes_cb.assert_called_once_with(ItemEvent.CHANGED, "1", {"a"})
+    assert handler["1"] is item
+    assert item.raw == {"key": "1", "a": 2, "b": 1}
+
+
+@pytest.mark.parametrize("diff_mode", [True, False])
+async def test_api_handler_field_filter(diff_mode):
+    """Verify field filtered subscriptions only trigger on relevant changes."""
+    handler = APIHandler(Mock())
+    handler.obj_id_key = "key"
+    handler.item_cls = DiffItem
+    handler.diff_mode = diff_mode
+
+    unsub_a = handler.subscribe(mock_a_cb := Mock(), field_filter="a")
+    unsub_big = handler.subscribe_changes(
+        mock_big_cb := Mock(), id_filter="1", field_filter={"is_big", "b"}
+    )
+    assert handler._watched_properties == ("is_big",)
+
+    handler.process_item({"key": "1", "a": 1, "b": 1, "uptime": 1})
+    mock_a_cb.assert_called_once_with(ItemEvent.ADDED, "1")
+    mock_big_cb.assert_called_once_with(
+        ItemEvent.ADDED, "1", {"key", "a", "b", "uptime"}
+    )
+
+    handler.process_item({"key": "1", "a": 1, "b": 1, "uptime": 2})
+    assert mock_a_cb.call_count == 1
+    assert mock_big_cb.call_count == 1
+
+    handler.process_item({"key": "1", "a": 2, "b": 1, "uptime": 3})
+    mock_a_cb.assert_called_with(ItemEvent.CHANGED, "1")
+    assert mock_a_cb.call_count == 2
+    assert mock_big_cb.call_count == 1
+
+    handler.process_item({"key": "1", "a": 20, "b": 2, "uptime": 4})
+    assert mock_a_cb.call_count == 3
+    mock_big_cb.assert_called_with(
+        ItemEvent.CHANGED, "1", {"a", "b", "uptime", "is_big"}
+    )
+    assert mock_big_cb.call_count == 2
+
+    handler.process_item({"key": "2", "a": 1})
+    assert mock_a_cb.call_count == 4
+    assert mock_big_cb.call_count == 2
+
+    handler.remove_item({"key": "1"})
+    mock_a_cb.assert_called_with(ItemEvent.DELETED, "1")
+    mock_big_cb.assert_called_with(ItemEvent.DELETED, "1", frozenset())
+
+    unsub_a()
+    unsub_big()
+    unsub_big()
+    assert not handler._field_subscribers
+    assert handler._watched_properties == ()
+
+
+@pytest.mark.parametrize("diff_mode", [True, False])
+async def test_api_handler_cached_property_field_filter(diff_mode):
+    """Verify cached properties are watched and reevaluated on updates."""
+    handler = APIHandler(Mock())
+    handler.obj_id_key = "key"
+    handler.item_cls = DiffItem
+    handler.diff_mode = diff_mode
+
+    handler.subscribe(mock_cb := Mock(), ItemEvent.CHANGED, field_filter="is_odd")
+    assert handler._watched_properties == ("is_odd",)
+    assert isinstance(DiffItem.is_odd, cached_property)
+
+    handler.process_item({"key": "1", "a": 1})
+    assert handler["1"].is_odd is True
+
+    handler.process_item({"key": "1", "a": 3})
+    mock_cb.assert_not_called()
+
+    handler.process_item({"key": "1", "a": 4})
+    mock_cb.assert_called_once_with(ItemEvent.CHANGED, "1")
+    assert handler["1"].is_odd is False
+
+
+async def test_ports_field_filter(unifi_controller):
+    """Verify field filters work on device ports."""
+    unifi_controller.ports.subscribe(
+        mock_subscribe_cb := Mock(),
+        ItemEvent.CHANGED,
+        field_filter="poe_power",
+    )
+    device = deepcopy(SWITCH_16_PORT_POE)
+    unifi_controller.devices.process_raw([device])
+    unifi_controller.devices.process_raw([device])
+    mock_subscribe_cb.assert_not_called()
+
+    device = deepcopy(device)
+    device["port_table"][0]["poe_power"] = "2.00"
+    unifi_controller.devices.process_raw([device])
+    mock_subscribe_cb.assert_called_once_with(ItemEvent.CHANGED, "fc:ec:da:11:22:33_1")
+
+
+async def test_api_handler_subscription_changes_while_signalling():
+    """Verify subscriptions can be modified by a subscriber callback."""
+    handler = APIHandler(Mock())
+    handler.obj_id_key = "key"
+    handler.item_cls = DiffItem
+
+    def unsubscribe_others(event: ItemEvent, obj_id: str) -> None:
+        unsub_second()
+        unsub_field_b()
+        handler.subscribe(mock_late_cb)
+
+    mock_late_cb = Mock()
+    handler.subscribe(unsubscribe_others, ItemEvent.CHANGED, id_filter=("1", "2"))
+    handler.subscribe(Mock())
+    unsub_second = handler.subscribe(mock_second_cb := Mock(), ItemEvent.CHANGED)
+    handler.subscribe(Mock(), ItemEvent.CHANGED, field_filter="a")
+    unsub_field_b = handler.subscribe(mock_b_cb := Mock(), field_filter="b")
+
+    handler.process_item({"key": "1", "a": 1, "b": 1})
+    handler.process_item({"key": "1", "a": 2, "b": 2})
+
+    # Removed while signalling, ongoing signal is unaffected
+    mock_second_cb.assert_called_once_with(ItemEvent.CHANGED, "1")
+    mock_b_cb.assert_called_once_with(ItemEvent.ADDED, "1")
+    mock_late_cb.assert_not_called()
+
+    handler.process_item({"key": "1", "a": 3, "b": 3})
+    assert mock_second_cb.call_count == 1
+    assert mock_b_cb.call_count == 1
+    mock_late_cb.assert_called_once_with(ItemEvent.CHANGED, "1")
+
+    unsub_second()
+    assert "1" in handler._subscribers[ItemEvent.CHANGED]
+    assert "b" not in handler._field_subscribers
+
+    deleted_subscribers = len(handler._subscribers[ItemEvent.DELETED]["*"])
+    unsub_deleted = handler.subscribe(Mock(), ItemEvent.DELETED)
+    unsub_deleted()
+    assert len(handler._subscribers[ItemEvent.DELETED]["*"]) == deleted_subscribers
+
+
+async def test_api_handler_field_unsubscribe_while_signalling():
+    """Verify field subscribers can unsubscribe each other while signalling."""
+    handler = APIHandler(Mock())
+    handler.obj_id_key = "key"
+    handler.item_cls = DiffItem
+
+    def unsubscribe_all(event: ItemEvent, obj_id: str) -> None:
+        unsub_a()
+        unsub_b()
+
+    unsub_a = handler.subscribe(unsubscribe_all, ItemEvent.CHANGED, field_filter="a")
+    unsub_b = handler.subscribe(unsubscribe_all, ItemEvent.CHANGED, field_filter="b")
+
+    handler.process_item({"key": "1", "a": 1, "b": 1})
+    handler.process_item({"key": "1", "a": 2, "b": 2})
+    assert not handler._field_subscribers
+
+
+@pytest.mark.parametrize(
+    ("events", "expected"),
+    [
+        ([ItemEvent.ADDED], ({"1"}, set(), set())),
+        ([ItemEvent.ADDED, ItemEvent.CHANGED], ({"1"}, set(), set())),
+        ([ItemEvent.ADDED, ItemEvent.DELETED], (set(), set(), set())),
+        ([ItemEvent.CHANGED, ItemEvent.CHANGED], (set(), {"1"}, set())),
+        ([ItemEvent.CHANGED, ItemEvent.DELETED], (set(), set(), {"1"})),
+        ([ItemEvent.DELETED, ItemEvent.ADDED], (set(), {"1"}, set())),
+    ],
+)
+def test_item_batch(events, expected):
+    """Verify events are merged to their net effect."""
+    batch = ItemBatch()
+    for event in events:
+        batch.add_event(event, "1")
+    assert (batch.added, batch.changed, batch.deleted) == expected
+    assert bool(batch) is any(expected)
+
+
+async def test_api_handler_batch(unifi_controller, new_ws_data_fn):
+    """Verify batch subscribers are signalled once per frame."""
+    clients = unifi_controller.clients
+    clients.subscribe(mock_subscribe_cb := Mock())
+    unsub = clients.subscribe_batch(mock_batch_cb := Mock())
+
+    new_ws_data_fn(
+        {
+            "meta": {"message": MessageKey.CLIENT.value},
+            "data": [WIRELESS_CLIENT, WIRED_CLIENT],
+        }
+    )
+    assert mock_subscribe_cb.call_count == 2
+    mock_batch_cb.assert_called_once_with(
+        ItemBatch(added={WIRELESS_CLIENT["mac"], WIRED_CLIENT["mac"]})
+    )
+
+    clients.process_raw([WIRELESS_CLIENT, WIRED_CLIENT])
+    assert mock_subscribe_cb.call_count == 4
+    mock_batch_cb.assert_called_with(
+        ItemBatch(changed={WIRELESS_CLIENT["mac"], WIRED_CLIENT["mac"]})
+    )
+
+    new_ws_data_fn(MESSAGE_WIRELESS_CLIENT_REMOVED)
+    mock_batch_cb.assert_called_with(ItemBatch(deleted={WIRELESS_CLIENT["mac"]}))
+    assert mock_batch_cb.call_count == 3
+
+    # Empty batches are not signalled
+    clients.process_raw([])
+    assert mock_batch_cb.call_count == 3
+
+    # Nested batches are signalled once
+    with clients.batch():
+        clients.process_raw([WIRELESS_CLIENT])
+        clients.process_raw([WIRED_CLIENT])
+    mock_batch_cb.assert_called_with(
+        ItemBatch(added={WIRELESS_CLIENT["mac"]}, changed={WIRED_CLIENT["mac"]})
+    )
+    assert mock_batch_cb.call_count == 4
+
+    unsub()
+    unsub()
+    clients.process_raw([WIRELESS_CLIENT])
+    assert mock_batch_cb.call_count == 4
+
+
+async def test_ports_batch(unifi_controller, new_ws_data_fn):
+    """Verify ports of all devices of a frame are signalled as one batch."""
+    unifi_controller.ports.subscribe_batch(mock_batch_cb := Mock())
+    unifi_controller.outlets.subscribe_batch(mock_outlet_batch_cb := Mock())
+    new_ws_data_fn(
+        {
+            "meta": {"message": MessageKey.DEVICE.value},
+            "data": [SWITCH_16_PORT_POE, STRIP_UP6, SWITCH_8_PORT],
+        }
+    )
+    mock_batch_cb.assert_called_once()
+    assert mock_batch_cb.call_args.args[0].added == set(unifi_controller.ports)
+    assert len(unifi_controller.ports.for_device(SWITCH_8_PORT["mac"])) == 8
+    mock_outlet_batch_cb.assert_called_once()
+    assert len(mock_outlet_batch_cb.call_args.args[0].added) == 7
+
+    unifi_controller.devices.remove_item(SWITCH_16_PORT_POE)
+    assert len(mock_batch_cb.call_args.args[0].deleted) == 18
+    assert mock_batch_cb.call_count == 2
+
+
+async def test_api_handler_process_message(unifi_controller):
+    """Verify single websocket messages can still be processed."""
+    clients = unifi_controller.clients
+    clients.process_message(Message(Meta("ok", MessageKey.CLIENT, {}), WIRELESS_CLIENT))
+    assert WIRELESS_CLIENT["mac"] in clients
+
+    clients.process_message(
+        Message(Meta("ok", MessageKey.CLIENT_REMOVED, {}), WIRELESS_CLIENT)
+    )
+    assert WIRELESS_CLIENT["mac"] not in clients
+
+
+class IndexedHandler(APIHandler[DiffItem]):
+    """API handler used to verify indexes."""
+
+    obj_id_key = "key"
+    item_cls = DiffItem
+    indexes = {
+        "group": Index("group"),
+        "tags": Index(lambda raw: raw.get("tags"), multi=True),
+    }
+
+
+@pytest.mark.parametrize("diff_mode", [True, False])
+async def test_api_handler_indexes(diff_mode):
+    """Verify indexes are maintained on add, change and remove."""
+    handler = IndexedHandler(Mock())
+    handler.diff_mode = diff_mode
+    assert handler.by("group", "a") == []
+
+    handler.process_raw(
+        [
+            {"key": "1", "group": "a", "tags": ["x", "y", "x", None]},
+            {"key": "2", "group": "a", "tags": ["y"]},
+            {"key": "3"},
+        ]
+    )
+    assert handler.by("group", "a") == [handler["1"], handler["2"]]
+    assert handler.by("tags", "x") == [handler["1"]]
+    assert handler.by("tags", "y") == [handler["1"], handler["2"]]
+    assert handler._index_keys["1"] == (("a",), ("x", "y"))
+    assert handler._index_keys["3"] == ((), ())
+
+    # Index subscribers see updated indexes
+    def check_index(event, obj_id):
+        assert handler.by("group", "b") == [handler["1"]]
+
+    unsub = handler.subscribe(check_index, ItemEvent.CHANGED, id_filter="1")
+    handler.process_item({"key": "1", "group": "b", "tags": ["y"]})
+    unsub()
+    assert handler.by("group", "a") == [handler["2"]]
+    assert handler.by("tags", "x") == []
+    assert handler._indexes["tags"].keys() == {"y"}
+
+    handler.remove_item({"key": "2"})
+    handler.remove_item({"key": "3"})
+    assert handler.by("group", "a") == []
+    assert handler.by("tags", "y") == [handler["1"]]
+
+    handler.remove_item({"key": "1"})
+    assert handler._indexes == {"group": {}, "tags": {}}
+    assert handler._index_keys == {}
+
+    with pytest.raises(KeyError):
+        handler.by("unknown", "a")
+
+
+async def test_api_handler_stream():
+    """Verify streamed and returned items are processed as one batch."""
+
+    async def request(api_request, item_callback):
+        item_callback({"key": "1"})
+        return {"data": [{"key": "2"}]}
+
+    handler = APIHandler(Mock(request=request))
+    handler.obj_id_key = "key"
+    handler.item_cls = Mock()
+    handler.api_request = Mock()
+    handler.stream = True
+    handler.subscribe_batch(batch_callback := Mock())
+
+    await handler.update()
+    assert list(handler) == ["1", "2"]
+    assert handler.initialized
+    batch_callback.assert_called_once_with(ItemBatch(added={"1", "2"}))
+
+
+async def test_api_handler_stream_interleaved():
+    """Verify frames during a streamed refresh and failed refreshes are signalled."""
+
+    async def request(api_request, item_callback):
+        item_callback({"key": "a"})
+        # Websocket frame processed while the response is received
+        handler.process_raw([{"key": "ws"}])
+        batch_callback.assert_called_once_with(ItemBatch(added={"ws"}))
+        raise RequestError("Connection lost")
+
+    handler = APIHandler(Mock(request=request))
+    handler.obj_id_key = "key"
+    handler.item_cls = Mock()
+    handler.api_request = Mock()
+    handler.stream = True
+    handler.subscribe_batch(batch_callback := Mock())
+
+    with pytest.raises(RequestError, match="Connection lost"):
+        await handler.update()
+    assert list(handler) == ["a", "ws"]
+    batch_callback.assert_called_with(ItemBatch(added={"a"}))
+    assert handler._batch is None
+
+    # Events applied before an exception are signalled
+    def fail_in_batch() -> None:
+        with handler.batch():
+            handler.process_item({"key": "b"})
+            raise RequestError("Failed")
+
+    with pytest.raises(RequestError, match="Failed"):
+        fail_in_batch()
+    batch_callback.assert_called_with(ItemBatch(added={"b"}))
+    assert batch_callback.call_count == 3
+
+
+@pytest.mark.parametrize("stream", [False, True])
+async def test_api_handler_iter_update(stream: bool) -> None:
+    """Verify iterating over a refresh yields items as they are applied."""
+    raw_items = [{"key": str(index)} for index in range(5)] + [{}]
+
+    async def request(api_request, item_callback=None):
+        if item_callback is None:
+            return {"data": raw_items}
+        for raw_item in raw_items[:3]:
+            if (pending := item_callback(raw_item)) is not None:
+                await pending
+        return {"data": raw_items[3:]}
+
+    handler = APIHandler(Mock(request=request))
+    handler.obj_id_key = "key"
+    handler.item_cls = Mock()
+    handler.api_request = Mock()
+    handler.stream = stream
+    handler.subscribe_batch(batch_callback := Mock())
+
+    with patch(
+        "aiounifi.interfaces.api_handlers.asyncio.sleep", wraps=asyncio.sleep
+    ) as mock_sleep:
+        items = [item async for item in handler.iter_update(yield_every=2)]
+
+    assert items == list(handler.values())
+    assert list(handler) == ["0", "1", "2", "3", "4"]
+    assert mock_sleep.call_count == 3
+    assert handler.initialized
+    batch_callback.assert_called_once_with(ItemBatch(added=set(handler)))
+
+
+async def test_api_handler_iter_update_stopped_early() -> None:
+    """Verify stopping an iteration keeps batches and the response bounded."""
+    received = 0
+
+    async def request(api_request, item_callback):
+        nonlocal received
+        for index in range(10):
+            if (pending := item_callback({"key": str(index)})) is not None:
+                await pending
+            received += 1
+        return {}
+
+    handler = APIHandler(Mock(request=request))
+    handler.obj_id_key = "key"
+    handler.item_cls = Mock()
+    handler.api_request = Mock()
+    handler.stream = True
+    handler.subscribe_batch(batch_callback := Mock())
+
+    iterator = handler.iter_update(yield_every=2)
+    async for _ in iterator:
+        break
+    for _ in range(10):
+        await asyncio.sleep(0)
+    # One item consumed, two buffered and one waiting for room
+    assert received == 3
+    assert list(handler) == ["0"]
+
+    # Batch state is not held while iteration is suspended
+    handler.process_raw([{"key": "ws"}])
+    batch_callback.assert_called_once_with(ItemBatch(added={"ws"}))
+
+    # Applied items are signalled once the iteration is closed
+    await iterator.aclose()
+    batch_callback.assert_called_with(ItemBatch(added={"0"}))
+    assert not handler.initialized
+
+    # Items buffered when the response completes are still yielded
+    items = [item async for item in handler.iter_update(yield_every=2)]
+    assert len(items) == 10
+    assert handler.initialized
+
+
+async def test_api_handler_iter_update_stream_failure() -> None:
+    """Verify request failures and abandoned iterations of a streamed refresh."""
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def request(api_request, item_callback):
+        item_callback({"key": "1"})
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return {}
+
+    handler = APIHandler(Mock(request=request))
+    handler.obj_id_key = "key"
+    handler.item_cls = Mock()
+    handler.api_request = Mock()
+    handler.stream = True
+
+    iterator = handler.iter_update()
+    assert await anext(iterator) is handler["1"]
+    await started.wait()
+    await iterator.aclose()
+    await cancelled.wait()
+    assert not handler.initialized
+
+    async def failing_request(api_request, item_callback):
+        raise RequestError("Failed")
+
+    handler.controller.request = failing_request
+    with pytest.raises(RequestError):
+        [item async for item in handler.iter_update()]
@@ -11,6 +11,7 @@ from aioresponses import aioresponses
 import pytest
 
 from aiounifi.controller import Controller
+from aiounifi.interfaces.api_handlers import ItemEvent
 from aiounifi.models.message import MessageKey
 
 from .fixtures import MESSAGE_WIRELESS_CLIENT_REMOVED, WIRED_CLIENT, WIRELESS_CLIENT
@@ -195,7 +196,7 @@ async def test_client_websocket(
 ) -> None:
     """Test controller managing clients."""
     unsub = unifi_controller.clients.subscribe(mock_callback := Mock())
-    assert len(unifi_controller.clients._subscribers["*"]) == 1
+    assert len(unifi_controller.clients._subscribers[ItemEvent.ADDED].get("*", {})) == 1
     assert mock_callback.call_count == 0
 
     # Add client from websocket
@@ -210,7 +211,7 @@ async def test_client_websocket(
 
     # Remove callback
     unsub()
-    assert len(unifi_controller.clients._subscribers["*"]) == 0
+    assert len(unifi_controller.clients._subscribers[ItemEvent.ADDED].get("*", {})) == 0
 
 
 @pytest.mark.parametrize("client_payload", [[WIRELESS_CLIENT]])
@@ -224,3 +225,83 @@ async def test_message_client_removed(
 
     new_ws_data_fn(MESSAGE_WIRELESS_CLIENT_REMOVED)
     assert len(unifi_controller.clients.items()) == 0
+
+
+async def test_client_indexes(unifi_controller: Controller) -> None:
+    """Verify clients can be looked up by connection details."""
+    clients = unifi_controller.clients
+    clients.process_raw([WIRELESS_CLIENT, WIRED_CLIENT])
+
+    wireless = clients[WIRELESS_CLIENT["mac"]]
+    wired = clients[WIRED_CLIENT["mac"]]
+    assert clients.for_access_point("80:2a:a8:00:01:02") == [wireless]
+    assert clients.for_access_point("") == []
+    assert clients.for_switch_port("fc:ec:da:11:22:33", 1) == [wireless]
+    assert clients.for_switch_port("fc:ec:da:11:22:33", 3) == [wired]
+    assert clients.for_essid("SSID") == [wireless]
+    assert clients.for_ip("192.168.0.2") == [wired]
+
+    # Updates move clients between index keys
+    clients.process_item(
+        WIRELESS_CLIENT | {"ap_mac": "80:2a:a8:00:01:03", "ip": "192.168.0.2"}
+    )
+    wireless = clients[WIRELESS_CLIENT["mac"]]
+    assert clients.for_access_point("80:2a:a8:00:01:02") == []
+    assert clients.for_access_point("80:2a:a8:00:01:03") == [wireless]
+    assert clients.for_ip("192.168.0.1") == []
+    assert clients.for_ip("192.168.0.2") == [wired, wireless]
+    assert clients._indexes["access_point"].keys() == {"80:2a:a8:00:01:03"}
+
+    # Unchanged index keys
+    clients.process_item(
+        WIRELESS_CLIENT | {"ap_mac": "80:2a:a8:00:01:03", "ip": "192.168.0.2"}
+    )
+    assert clients.for_ip("192.168.0.2") == [wired, clients[WIRELESS_CLIENT["mac"]]]
+
+    # Removed clients are dropped from indexes
+    clients.remove_item(WIRED_CLIENT)
+    assert clients.for_switch_port("fc:ec:da:11:22:33", 3) == []
+    assert clients.for_ip("192.168.0.2") == [clients[WIRELESS_CLIENT["mac"]]]
+
+    clients.remove_item(WIRELESS_CLIENT)
+    assert all(not index for index in clients._indexes.values())
+    assert clients._index_keys == {}
+
+
+@pytest.mark.parametrize("compact", [True, False])
+async def test_clients_all_compact(unifi_controller: Controller, compact: bool) -> None:
+    """Verify compact mode only stores raw fields exposed by client."""
+    clients_all = unifi_controller.clients_all
+    clients_all.compact = compact
+    clients_all.process_raw([WIRELESS_CLIENT | {"unexposed": 1}])
+
+    client = clients_all[WIRELESS_CLIENT["mac"]]
+    assert ("unexposed" in client.raw) is not compact
+    assert client.rx_bytes_r == 326
+    assert client.essid == "SSID"
+    assert not hasattr(client, "__dict__")
+
+
+async def test_client_columns(unifi_controller: Controller) -> None:
+    """Verify numeric client fields are kept in columns once enabled."""
+    clients = unifi_controller.clients
+    clients.process_raw([WIRELESS_CLIENT | {"rx_bytes": 10}])
+    assert clients.column_store is None
+
+    columns = clients.enable_columns()
+    assert clients.enable_columns() is columns
+    assert columns.value("rx_bytes", WIRELESS_CLIENT["mac"]) == 10
+
+    clients.process_raw(
+        [
+            WIRELESS_CLIENT | {"rx_bytes": 20},
+            WIRED_CLIENT | {"rx_bytes": 5, "wired-rx_bytes-r": 2.5},
+        ]
+    )
+    assert columns.sum("rx_bytes") == 25
+    assert columns.top("rx_bytes", 1) == [(WIRELESS_CLIENT["mac"], 20)]
+    assert columns.value("wired_rx_bytes_r", WIRED_CLIENT["mac"]) == 2.5
+
+    clients.remove_item(WIRELESS_CLIENT)
+    assert columns.obj_ids == [WIRED_CLIENT["mac"]]
+    assert columns.sum("rx_bytes") == 5
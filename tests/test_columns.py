@@ -0,0 +1,61 @@
+"""Test columnar storage of numeric item fields."""
+
+import pytest
+
+from aiounifi.interfaces import columns as columns_module
+from aiounifi.interfaces.columns import ColumnStore
+
+
+@pytest.fixture(params=["numpy", "array"])
+def column_store(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch):
+    """Column store aggregating with and without NumPy."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(columns_module, "np", None)
+    return ColumnStore({"rx": "rx_bytes", "up": "uptime"})
+
+
+async def test_column_store_rows(column_store: ColumnStore) -> None:
+    """Verify rows are added, updated and removed keeping columns dense."""
+    column_store.update("a", {"rx_bytes": 1, "uptime": 10})
+    column_store.update("b", {"rx_bytes": 2.5})
+    column_store.update("c", {"rx_bytes": "3", "uptime": None})
+    assert len(column_store) == 3
+    assert column_store.columns["rx"].tolist() == [1, 2.5, 0]
+    assert column_store.columns["up"].tolist() == [10, 0, 0]
+
+    column_store.update("a", {"rx_bytes": 4, "uptime": 20})
+    assert column_store.rows == {"a": 0, "b": 1, "c": 2}
+    assert column_store.value("rx", "a") == 4
+
+    # Last row is moved into the removed row
+    column_store.remove("a")
+    assert column_store.obj_ids == ["c", "b"]
+    assert column_store.rows == {"c": 0, "b": 1}
+    assert column_store.columns["rx"].tolist() == [0, 2.5]
+
+    column_store.remove("b")
+    column_store.remove("b")
+    assert column_store.obj_ids == ["c"]
+    assert column_store.columns["up"].tolist() == [0]
+
+
+async def test_column_store_aggregates(column_store: ColumnStore) -> None:
+    """Verify aggregates over columns."""
+    assert column_store.sum("rx") == 0
+    assert column_store.top("rx", 3) == []
+    assert column_store.histogram("rx", [0, 10]) == [0]
+
+    for index, value in enumerate([5, 1, 12, 7, 10, -1]):
+        column_store.update(str(index), {"rx_bytes": value})
+
+    assert column_store.sum("rx") == 34
+    assert column_store.top("rx", 3) == [("2", 12), ("4", 10), ("3", 7)]
+    assert column_store.top("rx", 10)[-1] == ("5", -1)
+    assert column_store.top("rx", 0) == []
+    # Last bin includes its upper edge, values outside are ignored
+    assert column_store.histogram("rx", [0, 5, 10]) == [1, 3]
+
+    with pytest.raises(ValueError, match="two bin edges"):
+        column_store.histogram("rx", [0])
@@ -3,11 +3,17 @@
 pytest --cov-report term-missing --cov=aiounifi.controller tests/test_controller.py
 """
 
+import asyncio
+import base64
 import ssl
+import time
+from unittest.mock import AsyncMock, Mock, patch
 
-from aiohttp import ClientSession, client_exceptions, web
+from aiohttp import ClientSession, WSServerHandshakeError, client_exceptions, web
+import orjson
 import pytest
 import trustme
+from yarl import URL
 
 from aiounifi import (
     AiounifiException,
@@ -18,15 +24,20 @@ from aiounifi import (
     RequestError,
     ResponseError,
     ServiceUnavailable,
+    TooManyRequests,
     TwoFaTokenRequired,
     Unauthorized,
 )
-from aiounifi.controller import Controller
+from aiounifi.controller import Controller, WebsocketState
 from aiounifi.errors import AuthenticationRateLimitError
+from aiounifi.interfaces.api_handlers import ItemEvent
+from aiounifi.interfaces.connectivity import _session_lifetime
+from aiounifi.interfaces.message_queue import MessageQueue
+from aiounifi.interfaces.session_store import FileSessionStore
 from aiounifi.models.api import ApiRequest, ApiRequestV2
 from aiounifi.models.configuration import Configuration
 
-from .fixtures import LOGIN_UNIFIOS_JSON_RESPONSE, SITE_RESPONSE
+from .fixtures import LOGIN_UNIFIOS_JSON_RESPONSE, SITE_RESPONSE, WIRED_CLIENT
 
 EMPTY_RESPONSE = {"meta": {"rc": "ok"}, "data": []}
 
@@ -565,6 +576,8 @@ async def test_api_request_generic_error_handling(
     expected_exception,
 ):
     """Verify request raise login required on a 401."""
+    # Rate limited requests raise without being retried
+    unifi_controller.connectivity.scheduler.retries = 0
     mock_aioresponse.get("https://host:8443/api/s/default/test", **unwanted_behavior)
     with pytest.raises(expected_exception):
         await unifi_controller.connectivity.request(ApiRequest("get", "/test"))
@@ -703,3 +716,645 @@ async def test_login_sso_mfa_missing_totp_secret(mock_aioresponse, unifi_control
     )
     with pytest.raises(RequestError):
         await unifi_controller.connectivity.login()
+
+
+async def test_run_websocket(aiohttp_server, caplog) -> None:
+    """Test supervised websocket reconnects, logs in and resyncs handlers."""
+    tls_certificate_authority = trustme.CA()
+    tls_certificate = tls_certificate_authority.issue_server_cert(
+        "localhost", "127.0.0.1", "::1"
+    )
+    ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    tls_certificate.configure_cert(ssl_context)
+
+    connections = 0
+    logins = 0
+    client_requests = 0
+    resynced = asyncio.Event()
+
+    async def ws_handler(request):
+        nonlocal connections
+        connections += 1
+        if connections == 1:
+            raise web.HTTPUnauthorized
+        if connections == 2:
+            raise web.HTTPBadGateway
+
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        if connections == 3:
+            await ws.send_json(
+                {"meta": {"rc": "ok", "message": "sta:sync"}, "data": [{"mac": "1"}]}
+            )
+            await ws.close()
+            return ws
+        await ws.receive()
+        return ws
+
+    async def login_handler(request):
+        nonlocal logins
+        logins += 1
+        return web.json_response(EMPTY_RESPONSE)
+
+    async def clients_handler(request):
+        nonlocal client_requests
+        client_requests += 1
+        if client_requests == 2:
+            resynced.set()
+            # Client "2" was removed while disconnected
+            return web.json_response({"meta": {"rc": "ok"}, "data": [{"mac": "1"}]})
+        return web.json_response(
+            {"meta": {"rc": "ok"}, "data": [{"mac": "1"}, {"mac": "2"}]}
+        )
+
+    async def redirect_handler(request):
+        raise web.HTTPFound("/manage")
+
+    async def not_found_handler(request):
+        raise web.HTTPNotFound
+
+    app = web.Application()
+    app.router.add_get("/", redirect_handler)
+    app.router.add_post("/api/login", login_handler)
+    app.router.add_get("/api/s/default/stat/sta", clients_handler)
+    app.router.add_get("/api/s/default/stat/device", not_found_handler)
+    app.router.add_get("/wss/s/default/events", ws_handler)
+    await aiohttp_server(app, port=8443, ssl=ssl_context)
+
+    session = ClientSession()
+    config = Configuration(
+        session, "0.0.0.0", username="user", password="pass", ssl_context=False
+    )
+    controller = Controller(config)
+    await controller.clients.update()
+    controller.devices.initialized = True
+    assert len(controller.clients.items()) == 2
+
+    states = []
+    unsub = controller.subscribe_websocket_state(states.append)
+
+    message_queue = MessageQueue(controller.messages)
+    task = asyncio.create_task(
+        controller.run_websocket(retry_min=0, retry_max=0, message_queue=message_queue)
+    )
+    removed = Mock()
+    controller.clients.subscribe(removed, ItemEvent.DELETED)
+    await asyncio.wait_for(resynced.wait(), timeout=5)
+    await controller._resync_task
+
+    assert list(controller.clients) == ["1"]
+    removed.assert_called_once_with(ItemEvent.DELETED, "2")
+    assert connections == 4
+    assert logins == 1
+    assert controller.websocket_state is WebsocketState.RUNNING
+    assert states == [
+        WebsocketState.CONNECTING,
+        WebsocketState.DISCONNECTED,
+        WebsocketState.CONNECTING,
+        WebsocketState.DISCONNECTED,
+        WebsocketState.CONNECTING,
+        WebsocketState.RUNNING,
+        WebsocketState.DISCONNECTED,
+        WebsocketState.CONNECTING,
+        WebsocketState.RUNNING,
+    ]
+    assert "Failed to resync Devices" in caplog.text
+    assert message_queue.metrics.processed == 1
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert controller.websocket_state is WebsocketState.STOPPED
+    assert states[-1] is WebsocketState.STOPPED
+
+    unsub()
+    await session.close()
+
+
+async def test_run_websocket_login_failure(unifi_controller) -> None:
+    """Test supervised websocket handles failing login after unauthorized."""
+    unifi_controller.connectivity.websocket = AsyncMock(
+        side_effect=[
+            RequestError,
+            WSServerHandshakeError(Mock(), (), status=401),
+            asyncio.CancelledError,
+        ]
+    )
+    unifi_controller.login = AsyncMock(side_effect=LoginRequired)
+
+    with pytest.raises(asyncio.CancelledError):
+        await unifi_controller.run_websocket(retry_min=0, watchdog_interval=None)
+    unifi_controller.login.assert_called_once()
+
+
+async def test_run_websocket_watchdog(unifi_controller, caplog) -> None:
+    """Test watchdog resyncs on stalled message types and reconnects on stall."""
+    unifi_controller.watchdog = Mock(
+        stalled=Mock(side_effect=[[], ["sta:sync"], ["*", "sta:sync"]])
+    )
+    unifi_controller.resync = AsyncMock()
+    connections = 0
+    resync_task = None
+
+    async def websocket(callback, connected_callback):
+        nonlocal connections, resync_task
+        connections += 1
+        connected_callback()
+        unifi_controller.connectivity.ws_message_received = 5.0
+        callback("{}")
+        if connections == 2:
+            resync_task = unifi_controller._resync_task
+            raise asyncio.CancelledError
+        await asyncio.Event().wait()
+
+    unifi_controller.connectivity.websocket = websocket
+
+    with pytest.raises(asyncio.CancelledError):
+        await unifi_controller.run_websocket(retry_min=0, watchdog_interval=0)
+    # Resync after reconnecting is stopped together with the websocket
+    assert unifi_controller._resync_task is None
+    with pytest.raises(asyncio.CancelledError):
+        await resync_task
+
+    assert connections == 2
+    assert unifi_controller.watchdog.stalled.call_count == 3
+    assert unifi_controller.watchdog.reset.call_count == 4
+    # Frames are recorded when read, not when handled
+    unifi_controller.watchdog.record_frame.assert_called_with(5.0)
+    assert unifi_controller.watchdog.record_frame.call_count == 2
+    assert unifi_controller.resync.call_count == 2
+    unifi_controller.resync.assert_any_call(["sta:sync"])
+    assert "UniFi websocket stalled on ['sta:sync'], resyncing" in caplog.text
+    assert "UniFi websocket stalled, reconnecting" in caplog.text
+
+
+async def test_resync_message_keys(unifi_controller) -> None:
+    """Verify resync of stalled message keys only refreshes their handlers."""
+    for handler in (unifi_controller.clients, unifi_controller.devices):
+        handler.initialized = True
+        handler.update = AsyncMock()
+
+    await unifi_controller.resync(["sta:sync", "session-metadata:sync"])
+    unifi_controller.clients.update.assert_called_once_with(remove_missing=True)
+    unifi_controller.devices.update.assert_not_called()
+
+    await unifi_controller.resync()
+    assert unifi_controller.clients.update.call_count == 2
+    unifi_controller.devices.update.assert_called_once_with(remove_missing=True)
+
+
+async def test_request_rate_limited(mock_aioresponse, unifi_controller):
+    """Verify rate limited requests are retried after backing off."""
+    scheduler = unifi_controller.connectivity.scheduler
+    scheduler.backoff_min = 0.01
+    url = "https://host:8443/api/s/default/stat/sta"
+    mock_aioresponse.get(url, status=429, headers={"Retry-After": "0.01"})
+    mock_aioresponse.get(url, status=429, headers={"Retry-After": "soon"})
+    mock_aioresponse.get(url, payload={"meta": {"rc": "ok"}, "data": [WIRED_CLIENT]})
+
+    response = await unifi_controller.request(ApiRequest("get", "/stat/sta"))
+    assert response["data"] == [WIRED_CLIENT]
+    assert scheduler._backoffs == 0
+
+    scheduler.retries = 1
+    for _ in range(2):
+        mock_aioresponse.post(url, status=429)
+    with pytest.raises(TooManyRequests):
+        await unifi_controller.request(ApiRequest("post", "/stat/sta"))
+    assert scheduler._backoffs == 2
+
+
+async def test_request_single_flight(mock_aioresponse, unifi_controller):
+    """Verify identical GET requests in flight share one request."""
+    url = "https://host:8443/api/s/default/stat/device"
+    mock_aioresponse.get(url, payload={"meta": {"rc": "ok"}, "data": []}, repeat=True)
+    mock_aioresponse.post(url, payload={"meta": {"rc": "ok"}, "data": []}, repeat=True)
+
+    responses = await asyncio.gather(
+        unifi_controller.request(ApiRequest("get", "/stat/device")),
+        unifi_controller.request(ApiRequest("get", "/stat/device")),
+        unifi_controller.request(ApiRequest("get", "/stat/device", {"macs": ["1"]})),
+        unifi_controller.request(ApiRequest("post", "/stat/device")),
+        unifi_controller.request(ApiRequest("post", "/stat/device")),
+    )
+    assert responses[0] is responses[1]
+    assert responses[0] is not responses[2]
+    assert responses[3] is not responses[4]
+    requests = mock_aioresponse.requests
+    assert len(requests[("get", URL(url))]) == 2
+    assert len(requests[("post", URL(url))]) == 2
+    assert unifi_controller.connectivity._in_flight == {}
+
+
+async def test_request_single_flight_cancel_and_failure(
+    mock_aioresponse, unifi_controller
+):
+    """Verify a cancelled caller does not cancel the shared request."""
+    url = "https://host:8443/api/s/default/stat/device"
+    mock_aioresponse.get(url, payload={"meta": {"rc": "ok"}, "data": []})
+
+    cancelled = asyncio.create_task(
+        unifi_controller.request(ApiRequest("get", "/stat/device"))
+    )
+    waiting = asyncio.create_task(
+        unifi_controller.request(ApiRequest("get", "/stat/device"))
+    )
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    assert await waiting == {"meta": {"rc": "ok"}, "data": []}
+    assert cancelled.cancelled()
+
+    # Failures are raised to every caller
+    mock_aioresponse.get(url, status=404)
+    results = await asyncio.gather(
+        unifi_controller.request(ApiRequest("get", "/stat/device")),
+        unifi_controller.request(ApiRequest("get", "/stat/device")),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, ResponseError) for result in results)
+
+    # Failure of a request without remaining callers is not left unretrieved
+    mock_aioresponse.get(url, status=404)
+    abandoned = asyncio.create_task(
+        unifi_controller.request(ApiRequest("get", "/stat/device"))
+    )
+    await asyncio.sleep(0)
+    task = next(iter(unifi_controller.connectivity._in_flight.values()))
+    abandoned.cancel()
+    with pytest.raises(ResponseError):
+        await task
+
+
+async def test_relogin_single_flight(aiohttp_server) -> None:
+    """Verify concurrent requests rejected by an expired session share one login."""
+    tls_certificate_authority = trustme.CA()
+    tls_certificate = tls_certificate_authority.issue_server_cert(
+        "localhost", "127.0.0.1", "::1"
+    )
+    ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    tls_certificate.configure_cert(ssl_context)
+
+    session = {"logins": 0, "token": "", "reject": False}
+
+    async def login(request):
+        session["logins"] += 1
+        await asyncio.sleep(0.05)
+        session["token"] = f"token{session['logins']}"
+        return web.json_response(
+            {"meta": {"rc": "ok"}, "data": []},
+            headers={"x-csrf-token": session["token"]},
+        )
+
+    async def stat(request):
+        if session["reject"] or request.headers.get("x-csrf-token") != session["token"]:
+            return web.Response(status=401)
+        return web.json_response(
+            {"meta": {"rc": "ok"}, "data": [{"index": request.match_info["index"]}]}
+        )
+
+    app = web.Application()
+    app.router.add_post("/api/login", login)
+    app.router.add_get("/api/s/default/stat/{index}", stat)
+    await aiohttp_server(app, port=8443, ssl=ssl_context)
+
+    async with ClientSession() as client_session:
+        controller = Controller(
+            Configuration(
+                client_session,
+                "0.0.0.0",
+                username="user",
+                password="pass",
+                ssl_context=False,
+            )
+        )
+        await controller.connectivity.login()
+        assert session["logins"] == 1
+
+        # Session expires
+        session["token"] = "expired"
+        responses = await asyncio.gather(
+            *(
+                controller.request(ApiRequest("get", f"/stat/{index}"))
+                for index in range(100)
+            )
+        )
+        assert [response["data"] for response in responses] == [
+            [{"index": str(index)}] for index in range(100)
+        ]
+        assert session["logins"] == 2
+        assert controller.connectivity.headers["x-csrf-token"] == "token2"
+
+        # A request still rejected after logging in again is not retried
+        session["reject"] = True
+        with pytest.raises(LoginRequired):
+            await controller.request(ApiRequest("get", "/stat/0"))
+        assert session["logins"] == 3
+
+
+def jwt(payload: dict) -> str:
+    """Create unsigned JWT with payload."""
+    encoded = base64.urlsafe_b64encode(orjson.dumps(payload)).rstrip(b"=").decode()
+    return f"eyJhbGciOiJIUzI1NiJ9.{encoded}.signature"
+
+
+@pytest.mark.parametrize(
+    ("cookie", "lifetime"),
+    [
+        (f"TOKEN={jwt({'exp': 2000})}; path=/; secure; httponly", 1000),
+        (f"TOKEN={jwt({'exp': 2000})}; path=/; max-age=600", 600),
+        ("unifises=abc; Expires=Thu, 01 Jan 1970 00:25:00 GMT", 500),
+        ("unifises=abc; Max-Age=soon; Expires=never", None),
+        ("unifises=abc; Path=/; Secure; HttpOnly", None),
+        (f"TOKEN={jwt({'iat': 1000})}", None),
+        ("TOKEN=a.!!!.c", None),
+        ("TOKEN=a.W10.c", None),
+        ("TOKEN=abc; invalid=attribute", None),
+    ],
+)
+async def test_session_lifetime(cookie: str, lifetime: float | None) -> None:
+    """Verify session lifetime is read from cookie attributes and JWT claims."""
+    with patch("aiounifi.interfaces.connectivity.time.time", return_value=1000):
+        assert _session_lifetime(cookie) == lifetime
+
+
+async def test_session_renewal(mock_aioresponse, unifi_controller, caplog) -> None:
+    """Verify session is renewed in the background before it expires."""
+    connectivity = unifi_controller.connectivity
+    url = "https://host:8443/api/login"
+    expiry = time.time() + 0.2
+    mock_aioresponse.post(
+        url,
+        payload={"meta": {"rc": "ok"}, "data": []},
+        headers={"Set-Cookie": f"TOKEN={jwt({'exp': expiry})}; path=/"},
+    )
+    await connectivity.login()
+    assert connectivity.session_generation == 1
+    assert connectivity._renew_handle is not None
+    cookie = connectivity.headers["Cookie"]
+
+    # Requests made during renewal wait for the new session
+    login_started = asyncio.Event()
+
+    async def slow_login(*args, **kwargs):
+        login_started.set()
+        await asyncio.sleep(0.05)
+
+    mock_aioresponse.post(
+        url,
+        payload={"meta": {"rc": "ok"}, "data": []},
+        headers={"Set-Cookie": "TOKEN=renewed; path=/"},
+        callback=slow_login,
+    )
+    await login_started.wait()
+    # Current session is kept until the renewed one replaces it
+    assert connectivity.headers["Cookie"] == cookie
+    assert mock_aioresponse.requests[("post", URL(url))][1].kwargs["headers"] == {}
+    mock_aioresponse.get(
+        "https://host:8443/api/s/default/stat/sta",
+        payload={"meta": {"rc": "ok"}, "data": []},
+    )
+    await unifi_controller.request(ApiRequest("get", "/stat/sta"))
+    assert connectivity.session_generation == 2
+    assert connectivity.headers["Cookie"] == "TOKEN=renewed; path=/"
+    assert connectivity._renew_handle is None
+    assert (
+        mock_aioresponse.requests[
+            ("get", URL("https://host:8443/api/s/default/stat/sta"))
+        ][0].kwargs["headers"]["Cookie"]
+        == "TOKEN=renewed; path=/"
+    )
+
+    # Failed renewal is logged
+    connectivity._session_expiry = time.time() + 0.01
+    connectivity._schedule_renewal()
+    connectivity._schedule_renewal()
+    mock_aioresponse.post(url, status=401)
+    await asyncio.sleep(0.05)
+    await connectivity._renew_task
+    assert "Failed to renew UniFi session" in caplog.text
+
+    # Expired sessions are not renewed
+    connectivity._session_expiry = time.time()
+    connectivity._schedule_renewal()
+    assert connectivity._renew_handle is None
+
+
+async def test_close(mock_aioresponse, unifi_controller) -> None:
+    """Verify close stops resync and session renewal."""
+    connectivity = unifi_controller.connectivity
+
+    # Scheduled renewal and resync are cancelled
+    connectivity._session_expiry = time.time() + 3600
+    connectivity._schedule_renewal()
+    handle = connectivity._renew_handle
+    assert handle is not None
+    resync_task = unifi_controller._resync_task = asyncio.create_task(asyncio.sleep(10))
+    await unifi_controller.close()
+    assert handle.cancelled()
+    assert connectivity._renew_handle is None
+    assert unifi_controller._resync_task is None
+    with pytest.raises(asyncio.CancelledError):
+        await resync_task
+
+    # Running renewal is cancelled
+    connectivity._closed = False
+    connectivity.can_retry_login = True
+    login_started = asyncio.Event()
+
+    async def slow_login(*args, **kwargs):
+        login_started.set()
+        await asyncio.sleep(0.05)
+
+    mock_aioresponse.post(
+        "https://host:8443/api/login",
+        payload={"meta": {"rc": "ok"}, "data": []},
+        headers={"Set-Cookie": "TOKEN=abc; max-age=3600"},
+        callback=slow_login,
+    )
+    connectivity._start_renewal()
+    task = connectivity._renew_task
+    assert task is not None
+    await login_started.wait()
+    await unifi_controller.close()
+    assert task.cancelled()
+    assert connectivity._renew_task is None
+
+    # Login completing after closing does not schedule a renewal
+    await asyncio.sleep(0.1)
+    assert connectivity.session_generation == 1
+    assert connectivity._renew_handle is None
+
+
+@pytest.mark.parametrize("is_unifi_os", [True, False])
+async def test_session_store(
+    mock_aioresponse, unifi_controller, tmp_path, is_unifi_os
+) -> None:
+    """Verify a stored session is reused instead of logging in."""
+    store = FileSessionStore(tmp_path / "sessions.json")
+    unifi_controller.connectivity.config.session_store = store
+    mock_aioresponse.get(
+        "https://host:8443",
+        status=200 if is_unifi_os else 302,
+        content_type="text/html",
+    )
+    login_url = f"https://host:8443/api/{'auth/login' if is_unifi_os else 'login'}"
+    mock_aioresponse.post(
+        login_url,
+        payload=EMPTY_RESPONSE,
+        headers={"x-csrf-token": "123", "Set-Cookie": "TOKEN=abc; path=/"},
+    )
+    await unifi_controller.login()
+    session = {
+        "is_unifi_os": is_unifi_os,
+        "headers": {"x-csrf-token": "123", "Cookie": "TOKEN=abc; path=/"},
+    }
+    assert await store.load("user@host:8443") == session
+
+    # A restarted controller validates the stored session only
+    mock_aioresponse.requests.clear()
+    self_url = f"https://host:8443{'/proxy/network' if is_unifi_os else ''}/api/self"
+    mock_aioresponse.get(self_url, payload=EMPTY_RESPONSE)
+    config = Configuration(
+        unifi_controller.connectivity.config.session,
+        "host",
+        username="user",
+        password="pass",
+        session_store=store,
+    )
+    controller = Controller(config)
+    await controller.login()
+    assert list(mock_aioresponse.requests) == [("get", URL(self_url))]
+    assert mock_aioresponse.requests[("get", URL(self_url))][0].kwargs["headers"] == {
+        "x-csrf-token": "123",
+        "Cookie": "TOKEN=abc; path=/",
+    }
+    assert controller.connectivity.is_unifi_os is is_unifi_os
+    assert controller.connectivity.can_retry_login
+    assert controller.connectivity.session_generation == 1
+
+    # Logging in again, e.g. on websocket failure, does not reuse the session
+    mock_aioresponse.get(
+        "https://host:8443",
+        status=200 if is_unifi_os else 302,
+        content_type="text/html",
+    )
+    mock_aioresponse.post(login_url, payload=EMPTY_RESPONSE)
+    await controller.login()
+    assert ("post", URL(login_url)) in mock_aioresponse.requests
+    assert await store.load("user@host:8443") == {
+        "is_unifi_os": is_unifi_os,
+        "headers": {},
+    }
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        {"status": 401},
+        {"payload": {"meta": {"rc": "error", "msg": "api.err.LoginRequired"}}},
+        {"body": "<html>", "content_type": "text/html"},
+    ],
+)
+async def test_session_store_invalid_session(
+    mock_aioresponse, unifi_controller, tmp_path, response
+) -> None:
+    """Verify an invalid stored session is replaced by a full login."""
+    store = FileSessionStore(tmp_path / "sessions.json")
+    await store.save(
+        "user@host:8443", {"is_unifi_os": False, "headers": {"Cookie": "expired"}}
+    )
+    unifi_controller.connectivity.config.session_store = store
+    mock_aioresponse.get("https://host:8443/api/self", **response)
+    mock_aioresponse.get("https://host:8443", status=302, content_type="text/html")
+    mock_aioresponse.post(
+        "https://host:8443/api/login",
+        payload=EMPTY_RESPONSE,
+        headers={"Set-Cookie": "renewed"},
+    )
+    await unifi_controller.login()
+    assert unifi_controller.connectivity.headers == {"Cookie": "renewed"}
+    assert await store.load("user@host:8443") == {
+        "is_unifi_os": False,
+        "headers": {"Cookie": "renewed"},
+    }
+
+
+async def test_session_store_expiry(mock_aioresponse, tmp_path) -> None:
+    """Verify a restored session is renewed from its stored expiry."""
+    store = FileSessionStore(tmp_path / "sessions.json")
+    async with ClientSession() as session:
+        config = Configuration(
+            session, "host", username="user", password="pass", session_store=store
+        )
+        controller = Controller(config)
+        mock_aioresponse.get("https://host:8443", status=302, content_type="text/html")
+        mock_aioresponse.post(
+            "https://host:8443/api/login",
+            payload=EMPTY_RESPONSE,
+            headers={"Set-Cookie": "TOKEN=abc; max-age=3600"},
+        )
+        with patch("aiounifi.interfaces.connectivity.time.time", return_value=1000):
+            await controller.login()
+        stored = await store.load("user@host:8443")
+        assert stored is not None
+        assert stored["expires"] == 4600
+        await controller.close()
+
+        # Relative Max-Age does not restart on reuse
+        mock_aioresponse.get("https://host:8443/api/self", payload=EMPTY_RESPONSE)
+        controller = Controller(config)
+        with patch("aiounifi.interfaces.connectivity.time.time", return_value=4000):
+            await controller.login()
+        handle = controller.connectivity._renew_handle
+        assert handle is not None
+        assert handle.when() - asyncio.get_running_loop().time() == pytest.approx(
+            300, abs=1
+        )
+        await controller.close()
+
+        # Expired sessions are removed without being validated
+        mock_aioresponse.requests.clear()
+        mock_aioresponse.get("https://host:8443", status=302, content_type="text/html")
+        mock_aioresponse.post("https://host:8443/api/login", payload=EMPTY_RESPONSE)
+        controller = Controller(config)
+        with patch("aiounifi.interfaces.connectivity.time.time", return_value=5000):
+            await controller.login()
+        assert (
+            "get",
+            URL("https://host:8443/api/self"),
+        ) not in mock_aioresponse.requests
+        assert await store.load("user@host:8443") == {
+            "is_unifi_os": False,
+            "headers": {},
+        }
+
+
+@pytest.mark.parametrize(
+    "stored",
+    [
+        {},
+        [],
+        {"is_unifi_os": "no", "headers": {}},
+        {"is_unifi_os": False, "headers": {"Cookie": 1}},
+        {"is_unifi_os": False, "headers": {}, "expires": "soon"},
+    ],
+)
+async def test_session_store_malformed_session(
+    mock_aioresponse, unifi_controller, tmp_path, stored
+) -> None:
+    """Verify a malformed stored session is removed and replaced by a full login."""
+    store = FileSessionStore(tmp_path / "sessions.json")
+    await store.save("user@host:8443", stored)
+    unifi_controller.connectivity.config.session_store = store
+    mock_aioresponse.get("https://host:8443", status=302, content_type="text/html")
+    mock_aioresponse.post(
+        "https://host:8443/api/login",
+        payload=EMPTY_RESPONSE,
+        headers={"Set-Cookie": "renewed"},
+    )
+    await unifi_controller.login()
+    assert ("get", URL("https://host:8443/api/self")) not in mock_aioresponse.requests
+    assert await store.load("user@host:8443") == {
+        "is_unifi_os": False,
+        "headers": {"Cookie": "renewed"},
+    }
@@ -3,14 +3,16 @@
 pytest --cov-report term-missing --cov=aiounifi.devices tests/test_devices.py
 """
 
+import asyncio
 from collections.abc import Callable
 from typing import Any
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from aioresponses import aioresponses
 import pytest
 
 from aiounifi.controller import Controller
+from aiounifi.interfaces.api_handlers import ItemEvent
 from aiounifi.models.device import (
     Device,
     DeviceLocateRequest,
@@ -34,6 +36,7 @@ from .fixtures import (
     PDU_PRO,
     PLUG_UP1,
     STRIP_UP6,
+    SWITCH_8_PORT,
     SWITCH_16_PORT_POE,
 )
 
@@ -1162,10 +1165,10 @@ async def test_device_websocket(
     unifi_controller: Controller, new_ws_data_fn: Callable[[dict[str, Any]], None]
 ) -> None:
     """Test controller managing devices."""
-    assert len(unifi_controller.devices._subscribers["*"]) == 2
+    assert len(unifi_controller.devices._subscribers[ItemEvent.ADDED].get("*", {})) == 2
 
     unsub = unifi_controller.devices.subscribe(mock_callback := Mock())
-    assert len(unifi_controller.devices._subscribers["*"]) == 3
+    assert len(unifi_controller.devices._subscribers[ItemEvent.ADDED].get("*", {})) == 3
     assert mock_callback.call_count == 0
 
     # Add client from websocket
@@ -1176,10 +1179,22 @@ async def test_device_websocket(
         }
     )
     assert len(unifi_controller.devices.items()) == 1
-    assert len(unifi_controller.devices._subscribers["*"]) == 3
+    assert len(unifi_controller.devices._subscribers[ItemEvent.ADDED].get("*", {})) == 3
 
     unsub()
-    assert len(unifi_controller.devices._subscribers["*"]) == 2
+    assert len(unifi_controller.devices._subscribers[ItemEvent.ADDED].get("*", {})) == 2
+
+
+async def test_device_indexes(unifi_controller: Controller) -> None:
+    """Test devices can be looked up by model, type and state."""
+    devices = unifi_controller.devices
+    devices.process_raw([SWITCH_16_PORT_POE, ACCESS_POINT_AC_PRO])
+
+    switch = devices[SWITCH_16_PORT_POE["mac"]]
+    access_point = devices[ACCESS_POINT_AC_PRO["mac"]]
+    assert devices.by("model", "US16P150") == [switch]
+    assert devices.by("type", "uap") == [access_point]
+    assert devices.by("state", 1) == [switch, access_point]
 
 
 def test_enum_unknowns() -> None:
@@ -1218,6 +1233,38 @@ def test_wifi_band_unknown_fallback(caplog: pytest.LogCaptureFixture) -> None:
     assert "Unsupported WiFi band future-band" in caplog.text
 
 
+def test_enum_unknown_logged_once(caplog: pytest.LogCaptureFixture) -> None:
+    """Verify unsupported enum values are only logged the first time."""
+    assert DeviceState(1234) is DeviceState.UNKNOWN
+    assert DeviceState(1234) is DeviceState.UNKNOWN
+    assert caplog.text.count("Unsupported device state 1234") == 1
+    assert 1234 not in {state.value for state in DeviceState}
+    assert 1234 not in DeviceState._value2member_map_
+
+    # Unhashable values are always logged
+    assert DeviceType(["usw"]) is DeviceType.UNKNOWN
+    assert DeviceType(["usw"]) is DeviceType.UNKNOWN
+    assert caplog.text.count("Unsupported device type ['usw']") == 2
+
+    # Remembered values are bounded
+    with patch("aiounifi.models.api.UNSUPPORTED_VALUES_MAX", 0):
+        assert DeviceState(4321) is DeviceState.UNKNOWN
+    assert "Unsupported device state 4321" not in caplog.text
+
+
+def test_device_cached_properties() -> None:
+    """Verify cached properties are reevaluated when raw is replaced."""
+    device = Device({"state": 1, "type": "usw"})
+    assert device.state is DeviceState.CONNECTED
+    assert device._cache == {"state": DeviceState.CONNECTED}
+    assert device.type is DeviceType.SWITCH
+    assert device.state is DeviceState.CONNECTED
+
+    device.raw = {"state": 0, "type": "usw"}
+    assert device.state is DeviceState.DISCONNECTED
+    assert device._cache == {"state": DeviceState.DISCONNECTED}
+
+
 def test_device_get_radio_band() -> None:
     """Verify band lookup on Device radio table."""
     device = Device(
@@ -1514,3 +1561,36 @@ async def test_wan_not_present(unifi_controller: Controller) -> None:
     assert device.wan2 is None
     assert device.last_wan_status is None
     assert device.last_wan_ip is None
+
+
+@pytest.mark.parametrize(
+    ("device_payload"), [[SWITCH_16_PORT_POE, STRIP_UP6, SWITCH_8_PORT]]
+)
+@pytest.mark.usefixtures("_mock_endpoints")
+async def test_iter_update(unifi_controller: Controller) -> None:
+    """Test iterating over a streamed device refresh with a small buffer."""
+    devices = unifi_controller.devices
+    items = [device async for device in devices.iter_update(yield_every=1)]
+    assert [device.mac for device in items] == [
+        SWITCH_16_PORT_POE["mac"],
+        STRIP_UP6["mac"],
+        SWITCH_8_PORT["mac"],
+    ]
+    assert devices.initialized
+
+
+@pytest.mark.parametrize(("device_payload"), [[SWITCH_16_PORT_POE]])
+@pytest.mark.usefixtures("_mock_endpoints")
+async def test_concurrent_update(
+    mock_aioresponse: aioresponses, unifi_controller: Controller
+) -> None:
+    """Test concurrent refreshes of a streaming handler share one request."""
+    devices = unifi_controller.devices
+    cancelled = asyncio.create_task(devices.update())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.gather(devices.update(), devices.update())
+    assert cancelled.cancelled()
+    assert len(devices.items()) == 1
+    assert devices._update_task is None
+    assert sum(len(calls) for calls in mock_aioresponse.requests.values()) == 1
@@ -20,6 +20,8 @@ async def test_firewall_policies(unifi_controller, unifi_called_with):
     assert len(firewall_policies.values()) == 1
 
     policy = firewall_policies["678ceb9fe3849d293243405c"]
+    assert firewall_policies.by("zone", "678c63bc2d97692f08adcdfa") == [policy]
+    assert firewall_policies.by("zone", "678ccc26e3849d2932432e26") == [policy]
     assert policy.id == "678ceb9fe3849d293243405c"
     assert policy.action == "ALLOW"
     assert policy.connection_state_type == "ALL"
@@ -0,0 +1,81 @@
+"""Test incremental decoding of the data list of JSON responses."""
+
+from typing import Any
+
+import orjson
+import pytest
+
+from aiounifi.interfaces.json_stream import JsonListStream
+
+ELEMENTS = [
+    {"mac": "00:00:00:00:00:01", "name": 'quote " and } bracket ]', "port": 1},
+    {"mac": "00:00:00:00:00:02", "name": "escaped \\", "table": [{"a": [1, {}]}]},
+    {"mac": "00:00:00:00:00:03", "nested": {"data": [{"b": "["}]}},
+]
+
+
+def stream_document(document: bytes, chunk_size: int) -> tuple[list[Any], Any]:
+    """Feed document in chunks, return streamed elements and remaining document."""
+    stream = JsonListStream()
+    elements = []
+    for start in range(0, len(document), chunk_size):
+        elements += stream.feed(document[start : start + chunk_size])
+    return elements, stream.finish()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 100000])
+@pytest.mark.parametrize(
+    ("document", "remaining"),
+    [
+        (
+            {"meta": {"rc": "ok", "data": ["x"]}, "data": ELEMENTS, "count": 3},
+            {"meta": {"rc": "ok", "data": ["x"]}, "data": [], "count": 3},
+        ),
+        ({"data": ELEMENTS, "meta": {"rc": "ok"}}, {"data": [], "meta": {"rc": "ok"}}),
+        ({"meta": {"rc": "ok"}, "other": "data", "data": ELEMENTS}, None),
+        (ELEMENTS, []),
+    ],
+)
+async def test_stream_elements(document: Any, remaining: Any, chunk_size: int) -> None:
+    """Verify elements are decoded independent of how the document is chunked."""
+    elements, rest = stream_document(
+        orjson.dumps(document, option=orjson.OPT_INDENT_2), chunk_size
+    )
+    assert elements == ELEMENTS
+    assert rest == (remaining if remaining is not None else document | {"data": []})
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        {"errorCode": 401, "message": "api.err.LoginRequired"},
+        {"meta": {"rc": "error", "msg": "api.err.NoPermission"}, "data": []},
+        {"meta": {"rc": "ok"}, "list": [{"a": 1}], "data": []},
+    ],
+)
+async def test_stream_without_object_elements(document: Any) -> None:
+    """Verify documents without object elements are decoded as a whole."""
+    elements, rest = stream_document(orjson.dumps(document), 3)
+    assert elements == []
+    assert rest == document | ({"data": []} if "data" in document else {})
+
+
+async def test_stream_buffer_bounded() -> None:
+    """Verify only the incomplete element is buffered."""
+    stream = JsonListStream()
+    assert stream.feed(b'{"meta": {"rc": "ok"}, "data": [{"a": 1}, {"b": "x') == [
+        {"a": 1}
+    ]
+    assert stream._buffer == b'{"b": "x'
+    assert stream.feed(b'y"}, ') == [{"b": "xy"}]
+    assert stream._buffer == b", "  # Not yet scanned
+    assert stream.feed(b"]}") == []
+    assert stream.finish() == {"meta": {"rc": "ok"}, "data": []}
+
+
+async def test_stream_truncated() -> None:
+    """Verify a truncated document fails to decode."""
+    stream = JsonListStream()
+    stream.feed(b'{"data": [{"a": 1}, {"b"')
+    with pytest.raises(orjson.JSONDecodeError):
+        stream.finish()
@@ -0,0 +1,128 @@
+"""Test message queue.
+
+pytest --cov-report term-missing --cov=aiounifi.interfaces.message_queue tests/test_message_queue.py
+"""
+
+import asyncio
+from unittest.mock import Mock, call
+
+import orjson
+import pytest
+
+from aiounifi.interfaces.message_queue import (
+    MessageQueue,
+    MessageQueueMetrics,
+    OverflowPolicy,
+)
+
+
+def frame(message: str, *data: dict[str, str]) -> str:
+    """Websocket frame of message type."""
+    return orjson.dumps({"meta": {"message": message}, "data": list(data)}).decode()
+
+
+async def test_block() -> None:
+    """Verify reader waits for room in a full queue."""
+    queue = MessageQueue(handler := Mock(), maxsize=2)
+    await queue.put("1")
+    await queue.put("2")
+    put = asyncio.create_task(queue.put("3"))
+    await asyncio.sleep(0)
+    assert not put.done()
+    assert queue.depth == 2
+
+    consumer = asyncio.create_task(queue.run())
+    await put
+    while queue.depth:
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert [call.args[0] for call in handler.new_data.call_args_list] == [
+        "1",
+        "2",
+        "3",
+    ]
+    assert queue.metrics == MessageQueueMetrics(received=3, processed=3, max_depth=2)
+
+    consumer.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await consumer
+
+
+async def test_drop_oldest() -> None:
+    """Verify oldest frames are dropped from a full queue."""
+    queue = MessageQueue(Mock(), maxsize=2, policy=OverflowPolicy.DROP_OLDEST)
+    for raw in ("1", "2", "3"):
+        await queue.put(raw)
+    assert list(queue._entries.values()) == ["2", "3"]
+    assert queue.metrics == MessageQueueMetrics(received=3, dropped=1, max_depth=2)
+
+
+async def test_coalesce() -> None:
+    """Verify frames are merged per message key and object once the queue is full."""
+    queue = MessageQueue(handler := Mock(), maxsize=4, policy=OverflowPolicy.COALESCE)
+    frames = [
+        frame("sta:sync", {"mac": "1", "v": "1"}, {"mac": "2", "v": "1"}),
+        "bad",
+        '{"meta": {}}',
+        frame("sta:sync", {"mac": "1", "v": "2"}),
+    ]
+    for raw in frames:
+        await queue.put(raw)
+    # Frames are kept whole while there is room
+    assert list(queue._entries.values()) == frames
+    assert queue.metrics.coalesced == 0
+
+    # Unusable frames are dropped
+    await queue.put(frame("evt", {"key": "a"}))
+    assert queue.depth == 2
+    assert queue.metrics.coalesced == 1
+    assert queue.metrics.dropped == 2
+
+    await queue.put(frame("sta:sync", {"mac": "3"}))
+    await queue.put(frame("sta:sync", {"mac": "2", "v": "2"}))
+    await queue.put(frame("evt", {"key": "b"}))
+    assert queue.depth == 3
+    assert queue.metrics == MessageQueueMetrics(
+        received=8, dropped=2, coalesced=2, max_depth=4
+    )
+
+    handler.handler.side_effect = [ValueError, None]
+    consumer = asyncio.create_task(queue.run())
+    while queue.depth:
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert handler.mock_calls == [
+        call.handler({"meta": {"message": "evt"}, "data": [{"key": "a"}]}),
+        call.handler(
+            {
+                "meta": {"message": "sta:sync"},
+                "data": [{"mac": "1", "v": "2"}, {"mac": "3"}, {"mac": "2", "v": "2"}],
+            }
+        ),
+        call.new_data(frame("evt", {"key": "b"})),
+    ]
+    assert queue.metrics.processed == 3
+
+    consumer.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await consumer
+
+
+async def test_coalesce_bounded() -> None:
+    """Verify coalescing keeps the queue within its size."""
+    queue = MessageQueue(Mock(), maxsize=10, policy=OverflowPolicy.COALESCE)
+    clients = [{"mac": str(mac)} for mac in range(50)]
+    for _ in range(11):
+        await queue.put(frame("sta:sync", *clients))
+    assert queue.depth == 2
+    assert queue.metrics == MessageQueueMetrics(
+        received=11, coalesced=450, max_depth=10
+    )
+
+    # Oldest entries are dropped if merging does not make room
+    queue = MessageQueue(Mock(), maxsize=2, policy=OverflowPolicy.COALESCE)
+    for message in ("a", "b", "c"):
+        await queue.put(frame(message, {"mac": "1"}))
+    assert queue.depth == 2
+    assert queue.metrics.dropped == 1
+    assert list(queue._entries.values())[1] == frame("c", {"mac": "1"})
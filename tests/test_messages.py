@@ -3,6 +3,7 @@
 pytest --cov-report term-missing --cov=aiounifi.messages tests/test_messages.py
 """
 
+import asyncio
 from unittest.mock import Mock, patch
 
 import pytest
@@ -65,3 +66,137 @@ async def test_message_handler_bad_json_data(logger_mock):
     """Verify message handler catches json error."""
     MessageHandler(controller=Mock()).new_data("")
     assert logger_mock.debug.called
+
+
+async def test_message_handler_routes():
+    """Verify frames are routed to subscribers of the message key."""
+    message_handler = MessageHandler(controller=Mock())
+    unsub_client = message_handler.subscribe(
+        mock_client_callback := Mock(), MessageKey.CLIENT
+    )
+    message_handler.subscribe(mock_device_callback := Mock(), MessageKey.DEVICE)
+    message_handler.subscribe(mock_all_callback := Mock())
+
+    message_handler.handler(
+        {
+            "meta": {"rc": "ok", "message": MessageKey.CLIENT.value},
+            "data": [{"mac": "1"}, {"mac": "2"}],
+        }
+    )
+    assert mock_client_callback.call_count == 2
+    assert mock_all_callback.call_count == 2
+    mock_device_callback.assert_not_called()
+
+    first, second = (call.args[0] for call in mock_client_callback.call_args_list)
+    assert first.meta is second.meta
+    assert first.meta.message is MessageKey.CLIENT
+    assert (first.data, second.data) == ({"mac": "1"}, {"mac": "2"})
+
+    unsub_client()
+    assert MessageKey.CLIENT not in message_handler._subscribed_messages
+    message_handler.handler(
+        {
+            "meta": {"rc": "ok", "message": MessageKey.CLIENT.value},
+            "data": [{"mac": "1"}],
+        }
+    )
+    assert mock_client_callback.call_count == 2
+    assert mock_all_callback.call_count == 2
+
+
+async def test_message_handler_reference_counts_message_keys():
+    """Verify subscribed message keys are reference counted."""
+    message_handler = MessageHandler(controller=Mock())
+    unsub_1 = message_handler.subscribe(Mock(), MessageKey.CLIENT)
+    unsub_2 = message_handler.subscribe(Mock(), (MessageKey.CLIENT, MessageKey.DEVICE))
+    assert message_handler._subscribed_messages == {
+        MessageKey.CLIENT: 2,
+        MessageKey.DEVICE: 1,
+    }
+
+    unsub_2()
+    assert message_handler._subscribed_messages == {MessageKey.CLIENT: 1}
+    assert set(message_handler._routes) == {MessageKey.CLIENT.value}
+
+    unsub_1()
+    assert not message_handler._subscribed_messages
+    assert not message_handler._routes
+
+
+@pytest.mark.parametrize(
+    "message", ["unsupported", MessageKey.SESSION_METADATA.value, None]
+)
+async def test_message_handler_rejects_unsubscribed_frames(message):
+    """Verify frames without subscribers are dropped before being parsed."""
+    message_handler = MessageHandler(controller=Mock())
+    message_handler.subscribe(mock_callback := Mock())
+    message_handler.subscribe(Mock(), MessageKey.CLIENT)
+
+    with patch("aiounifi.interfaces.messages.Meta") as meta_mock:
+        message_handler.handler({"meta": {"message": message}, "data": [{}]})
+    meta_mock.from_dict.assert_not_called()
+    mock_callback.assert_not_called()
+
+
+async def test_message_handler_coalescing():
+    """Verify pending data is merged per message key and object."""
+    message_handler = MessageHandler(controller=Mock())
+    message_handler.coalesce_window = 60
+    message_handler.subscribe_frames(
+        frame_callback := Mock(), (MessageKey.DEVICE, MessageKey.EVENT)
+    )
+    message_handler.subscribe(mock_callback := Mock(), MessageKey.DEVICE)
+
+    def frame(message_key, *data):
+        return {"meta": {"rc": "ok", "message": message_key.value}, "data": list(data)}
+
+    message_handler.handler(
+        frame(MessageKey.DEVICE, {"mac": "1", "v": 1}, {"mac": "2", "v": 1})
+    )
+    message_handler.handler(frame(MessageKey.EVENT, {"key": "a"}, {"key": "b"}))
+    message_handler.handler(frame(MessageKey.DEVICE, {"mac": "1", "v": 2}))
+    message_handler.handler(frame(MessageKey.CLIENT, {"mac": "1"}))
+    assert not frame_callback.called
+
+    message_handler.flush()
+    assert [
+        (call.args[0].message, call.args[1]) for call in frame_callback.call_args_list
+    ] == [
+        (MessageKey.DEVICE, [{"mac": "2", "v": 1}]),
+        (MessageKey.EVENT, [{"key": "a"}, {"key": "b"}]),
+        (MessageKey.DEVICE, [{"mac": "1", "v": 2}]),
+    ]
+    assert [call.args[0].data for call in mock_callback.call_args_list] == [
+        {"mac": "2", "v": 1},
+        {"mac": "1", "v": 2},
+    ]
+    assert message_handler._flush_handle is None
+
+    # Flushing without pending data does nothing
+    message_handler.flush()
+    assert frame_callback.call_count == 3
+
+
+async def test_message_handler_coalescing_window():
+    """Verify pending data is dispatched when window passes."""
+    message_handler = MessageHandler(controller=Mock())
+    message_handler.coalesce_window = 0
+    unsub = message_handler.subscribe(mock_callback := Mock(), MessageKey.DEVICE)
+    message_handler.subscribe(Mock(), MessageKey.EVENT)
+
+    message_handler.handler(
+        {"meta": {"message": MessageKey.DEVICE.value}, "data": [{"mac": "1"}]}
+    )
+    message_handler.handler(
+        {"meta": {"message": MessageKey.DEVICE.value}, "data": [{"mac": "1"}]}
+    )
+    await asyncio.sleep(0.01)
+    assert mock_callback.call_count == 1
+
+    # Data of message keys unsubscribed while pending is discarded
+    message_handler.handler(
+        {"meta": {"message": MessageKey.DEVICE.value}, "data": [{"mac": "1"}]}
+    )
+    unsub()
+    await asyncio.sleep(0.01)
+    assert mock_callback.call_count == 1
@@ -3,6 +3,7 @@
 pytest --cov-report term-missing --cov=aiounifi.outlets tests/test_outlets.py
 """
 
+from copy import deepcopy
 from unittest.mock import Mock
 
 import pytest
@@ -52,25 +53,34 @@ async def test_handler_ports(unifi_controller):
     mock_subscribe_deleted.assert_not_called()
     mock_subscribe_bad.assert_not_called()
 
-    # Update outlets
+    # Unchanged outlets are not signalled
     unifi_controller.devices.process_raw([STRIP_UP6])
     assert len(outlets.values()) == 7
-    assert mock_subscribe_all.call_count == 14
+    assert mock_subscribe_all.call_count == 7
+
+    # Update outlets
+    device = deepcopy(STRIP_UP6)
+    raw = next(raw for raw in device["outlet_table"] if raw["index"] == 7)
+    raw["relay_state"] = not raw["relay_state"]
+    unifi_controller.devices.process_raw([device])
+    assert len(outlets.values()) == 7
+    assert outlets["78:45:58:fc:16:7d_7"].relay_state == raw["relay_state"]
+    assert mock_subscribe_all.call_count == 8
     mock_subscribe_all.assert_called_with(ItemEvent.CHANGED, "78:45:58:fc:16:7d_7")
     assert mock_subscribe_7.call_count == 2
     assert mock_subscribe_added.call_count == 7
-    assert mock_subscribe_changed.call_count == 7
+    assert mock_subscribe_changed.call_count == 1
     mock_subscribe_deleted.assert_not_called()
     mock_subscribe_bad.assert_not_called()
 
     # Remove outlets
     unifi_controller.devices.remove_item(STRIP_UP6)
     assert len(outlets.values()) == 0
-    assert mock_subscribe_all.call_count == 21
+    assert mock_subscribe_all.call_count == 15
     mock_subscribe_all.assert_called_with(ItemEvent.DELETED, "78:45:58:fc:16:7d_7")
     assert mock_subscribe_7.call_count == 3
     assert mock_subscribe_added.call_count == 7
-    assert mock_subscribe_changed.call_count == 7
+    assert mock_subscribe_changed.call_count == 1
     assert mock_subscribe_deleted.call_count == 7
     mock_subscribe_bad.assert_not_called()
 
@@ -85,6 +95,51 @@ async def test_handler_ports(unifi_controller):
     unsub_all()
 
 
+async def test_handler_outlets_for_device(unifi_controller):
+    """Verify outlets are tracked per device."""
+    outlets = unifi_controller.outlets
+    other_device = deepcopy(STRIP_UP6)
+    other_device["mac"] += "0"
+    unifi_controller.devices.process_raw([STRIP_UP6, other_device])
+    assert len(outlets.values()) == 14
+
+    device_outlets = outlets.for_device(STRIP_UP6["mac"])
+    assert len(device_outlets) == 7
+    assert all(isinstance(item, Outlet) for item in device_outlets)
+    assert device_outlets[0].index == 1
+    assert outlets.for_device("unknown") == []
+
+    # Removing a device keeps outlets of device with a longer ID
+    unifi_controller.devices.remove_item(STRIP_UP6)
+    assert outlets.for_device(STRIP_UP6["mac"]) == []
+    assert len(outlets.values()) == 7
+    assert len(outlets.for_device(other_device["mac"])) == 7
+
+    # Entries missing from device table are removed
+    outlets.subscribe(mock_deleted := Mock(), event_filter=ItemEvent.DELETED)
+    removed = other_device["outlet_table"].pop(0)
+    unifi_controller.devices.process_raw([other_device])
+    assert len(outlets.values()) == 6
+    assert (
+        outlets.for_device(other_device["mac"])[0].raw
+        is other_device["outlet_table"][0]
+    )
+    mock_deleted.assert_called_once_with(
+        ItemEvent.DELETED, f"{other_device['mac']}_{removed['index']}"
+    )
+
+    # Device data without table keeps entries, an empty table removes them
+    mock_deleted.reset_mock()
+    unifi_controller.devices.process_raw(
+        [{k: v for k, v in other_device.items() if k != "outlet_table"}]
+    )
+    assert len(outlets.for_device(other_device["mac"])) == 6
+    mock_deleted.assert_not_called()
+    unifi_controller.devices.process_raw([{**other_device, "outlet_table": []}])
+    assert outlets.for_device(other_device["mac"]) == []
+    assert mock_deleted.call_count == 6
+
+
 async def test_handler_process_device_no_index(unifi_controller):
     """Verify that device ports works."""
     ports = unifi_controller.ports
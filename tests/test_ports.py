@@ -3,6 +3,7 @@
 pytest --cov-report term-missing --cov=aiounifi.ports tests/test_ports.py
 """
 
+from copy import deepcopy
 from unittest.mock import Mock
 
 import pytest
@@ -52,25 +53,34 @@ async def test_handler_ports(unifi_controller):
     mock_subscribe_deleted.assert_not_called()
     mock_subscribe_bad.assert_not_called()
 
-    # Update ports
+    # Unchanged ports are not signalled
     unifi_controller.devices.process_raw([SWITCH_16_PORT_POE])
     assert len(ports.values()) == 18
-    assert mock_subscribe_all.call_count == 36
+    assert mock_subscribe_all.call_count == 18
+
+    # Update ports
+    device = deepcopy(SWITCH_16_PORT_POE)
+    raw = next(raw for raw in device["port_table"] if raw["port_idx"] == 18)
+    raw["up"] = not raw["up"]
+    unifi_controller.devices.process_raw([device])
+    assert len(ports.values()) == 18
+    assert ports["fc:ec:da:11:22:33_18"].up == raw["up"]
+    assert mock_subscribe_all.call_count == 19
     mock_subscribe_all.assert_called_with(ItemEvent.CHANGED, "fc:ec:da:11:22:33_18")
     assert mock_subscribe_18.call_count == 2
     assert mock_subscribe_added.call_count == 18
-    assert mock_subscribe_changed.call_count == 18
+    assert mock_subscribe_changed.call_count == 1
     mock_subscribe_deleted.assert_not_called()
     mock_subscribe_bad.assert_not_called()
 
     # Remove ports
     unifi_controller.devices.remove_item(SWITCH_16_PORT_POE)
     assert len(ports.values()) == 0
-    assert mock_subscribe_all.call_count == 54
+    assert mock_subscribe_all.call_count == 37
     mock_subscribe_all.assert_called_with(ItemEvent.DELETED, "fc:ec:da:11:22:33_18")
     assert mock_subscribe_18.call_count == 3
     assert mock_subscribe_added.call_count == 18
-    assert mock_subscribe_changed.call_count == 18
+    assert mock_subscribe_changed.call_count == 1
     assert mock_subscribe_deleted.call_count == 18
     mock_subscribe_bad.assert_not_called()
 
@@ -85,6 +95,48 @@ async def test_handler_ports(unifi_controller):
     unsub_all()
 
 
+async def test_handler_ports_for_device(unifi_controller):
+    """Verify ports are tracked per device."""
+    ports = unifi_controller.ports
+    other_device = deepcopy(SWITCH_16_PORT_POE)
+    other_device["mac"] += "0"
+    unifi_controller.devices.process_raw([SWITCH_16_PORT_POE, other_device])
+    assert len(ports.values()) == 36
+
+    device_ports = ports.for_device(SWITCH_16_PORT_POE["mac"])
+    assert len(device_ports) == 18
+    assert all(isinstance(item, Port) for item in device_ports)
+    assert device_ports[0].port_idx == 1
+    assert ports.for_device("unknown") == []
+
+    # Removing a device keeps ports of device with a longer ID
+    unifi_controller.devices.remove_item(SWITCH_16_PORT_POE)
+    assert ports.for_device(SWITCH_16_PORT_POE["mac"]) == []
+    assert len(ports.values()) == 18
+    assert len(ports.for_device(other_device["mac"])) == 18
+
+    # Entries missing from device table are removed
+    ports.subscribe(mock_deleted := Mock(), event_filter=ItemEvent.DELETED)
+    removed = other_device["port_table"].pop(0)
+    unifi_controller.devices.process_raw([other_device])
+    assert len(ports.values()) == 17
+    assert ports.for_device(other_device["mac"])[0].raw is other_device["port_table"][0]
+    mock_deleted.assert_called_once_with(
+        ItemEvent.DELETED, f"{other_device['mac']}_{removed['port_idx']}"
+    )
+
+    # Device data without table keeps entries, an empty table removes them
+    mock_deleted.reset_mock()
+    unifi_controller.devices.process_raw(
+        [{k: v for k, v in other_device.items() if k != "port_table"}]
+    )
+    assert len(ports.for_device(other_device["mac"])) == 17
+    mock_deleted.assert_not_called()
+    unifi_controller.devices.process_raw([{**other_device, "port_table": []}])
+    assert ports.for_device(other_device["mac"]) == []
+    assert mock_deleted.call_count == 17
+
+
 async def test_handler_process_device_no_index(unifi_controller):
     """Verify that device ports works."""
     ports = unifi_controller.ports
@@ -0,0 +1,154 @@
+"""Test request scheduler."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from aiounifi.errors import TooManyRequests
+from aiounifi.interfaces.scheduler import (
+    RequestPriority,
+    RequestScheduler,
+    TokenBucket,
+)
+
+
+@pytest.fixture(name="mock_time")
+def mock_time_fixture():
+    """Control monotonic time of the scheduler."""
+    with patch("aiounifi.interfaces.scheduler.time") as mock_time:
+        mock_time.monotonic.return_value = 100.0
+        yield mock_time
+
+
+async def test_priority_order() -> None:
+    """Verify waiting requests get slots by priority, then in order."""
+    scheduler = RequestScheduler(max_in_flight=2)
+    order = []
+    release = asyncio.Event()
+
+    async def request(name: str, priority: RequestPriority) -> None:
+        async with scheduler.slot("/stat/sta", priority):
+            order.append(name)
+            await release.wait()
+
+    tasks = [
+        asyncio.create_task(request(name, priority))
+        for name, priority in (
+            ("refresh 1", RequestPriority.REFRESH),
+            ("refresh 2", RequestPriority.REFRESH),
+            ("refresh 3", RequestPriority.REFRESH),
+            ("refresh 4", RequestPriority.REFRESH),
+            ("command", RequestPriority.COMMAND),
+        )
+    ]
+    await asyncio.sleep(0)
+    assert order == ["refresh 1", "refresh 2"]
+    assert scheduler.in_flight == 2
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert order == ["refresh 1", "refresh 2", "command", "refresh 3", "refresh 4"]
+    assert scheduler.in_flight == 0
+
+
+async def test_cancel_waiting_request() -> None:
+    """Verify cancelled requests do not keep or leak slots."""
+    scheduler = RequestScheduler(max_in_flight=1)
+
+    async with scheduler.slot("/stat/sta"):
+        waiting = asyncio.create_task(scheduler._acquire(RequestPriority.REFRESH))
+        await asyncio.sleep(0)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        assert scheduler._waiters == []
+
+        # Slot handed over to a request cancelled before it resumed
+        handed = asyncio.create_task(scheduler._acquire(RequestPriority.REFRESH))
+        await asyncio.sleep(0)
+    handed.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await handed
+    assert scheduler.in_flight == 0
+
+
+async def test_cancel_waiting_request_before_release() -> None:
+    """Verify a request cancelled while queued is skipped by release."""
+    scheduler = RequestScheduler(max_in_flight=1)
+
+    async def request() -> None:
+        async with scheduler.slot("/stat/sta"):
+            await asyncio.sleep(0)
+
+    await scheduler._acquire(RequestPriority.REFRESH)
+    waiting = asyncio.create_task(scheduler._acquire(RequestPriority.REFRESH))
+    await asyncio.sleep(0)
+    # Slot is freed before the cancelled request resumes
+    waiting.cancel()
+    scheduler._release()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert scheduler._waiters == []
+    assert scheduler.in_flight == 0
+
+    # Slots are not leaked, later requests do not hang
+    async with asyncio.timeout(1):
+        await asyncio.gather(request(), request())
+    assert scheduler.in_flight == 0
+
+
+async def test_token_bucket(mock_time: Mock) -> None:
+    """Verify token bucket allows bursts and spaces out further requests."""
+    bucket = TokenBucket(rate=2, burst=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0.5
+    assert bucket.reserve() == 1
+
+    mock_time.monotonic.return_value = 110.0
+    assert bucket.reserve() == 0
+    assert bucket._tokens == 1
+
+
+async def test_rate_limit(mock_time: Mock) -> None:
+    """Verify requests wait for a token of the longest matching prefix."""
+    scheduler = RequestScheduler()
+    scheduler.set_rate_limit("", rate=10, burst=10)
+    scheduler.set_rate_limit("/rest/device", rate=1)
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        for _ in range(2):
+            async with scheduler.slot("/rest/device/01"):
+                pass
+        async with scheduler.slot("/stat/sta"):
+            pass
+    mock_sleep.assert_awaited_once_with(1)
+    assert scheduler.rate_limits[""]._tokens == 9
+
+
+async def test_backoff(mock_time: Mock) -> None:
+    """Verify rate limited responses block requests."""
+    scheduler = RequestScheduler(backoff_min=1, backoff_max=3)
+
+    async def sleep(delay: float) -> None:
+        mock_time.monotonic.return_value += delay
+
+    with patch("asyncio.sleep", side_effect=sleep) as mock_sleep:
+        for _ in range(3):
+            with pytest.raises(TooManyRequests):
+                async with scheduler.slot("/stat/sta"):
+                    raise TooManyRequests("429")
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [1, 2]
+
+        # Retry-After from the response is respected
+        with pytest.raises(TooManyRequests):
+            async with scheduler.slot("/stat/sta"):
+                raise TooManyRequests("429", retry_after=10)
+        assert mock_sleep.call_args.args[0] == 3
+
+        async with scheduler.slot("/stat/sta"):
+            pass
+        assert mock_sleep.call_args.args[0] == 10
+        assert scheduler._backoffs == 0
+        assert scheduler.in_flight == 0
@@ -0,0 +1,62 @@
+"""Test persistent session store."""
+
+import logging
+import os
+from pathlib import Path
+import stat
+
+import pytest
+
+from aiounifi.interfaces.session_store import FileSessionStore, StoredSession
+
+SESSION = StoredSession(
+    is_unifi_os=True, headers={"x-csrf-token": "123", "Cookie": "TOKEN=abc"}
+)
+
+
+async def test_file_session_store(tmp_path: Path) -> None:
+    """Verify sessions are stored per key in a private file."""
+    path = tmp_path / "unifi" / "sessions.json"
+    store = FileSessionStore(path)
+    assert await store.load("user@host:8443") is None
+
+    await store.save("user@host:8443", SESSION)
+    await store.save("admin@host:8443", StoredSession(is_unifi_os=False, headers={}))
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert os.listdir(path.parent) == ["sessions.json"]
+
+    # A new store reads sessions of an earlier process
+    store = FileSessionStore(str(path))
+    assert await store.load("user@host:8443") == SESSION
+
+    await store.remove("user@host:8443")
+    await store.remove("user@host:8443")
+    assert await store.load("user@host:8443") is None
+    assert await store.load("admin@host:8443") == {"is_unifi_os": False, "headers": {}}
+
+
+@pytest.mark.parametrize("content", [b"{invalid", b"[]"])
+async def test_file_session_store_invalid(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture, content: bytes
+) -> None:
+    """Verify an invalid file is treated as empty and replaced."""
+    path = tmp_path / "sessions.json"
+    path.write_bytes(content)
+    store = FileSessionStore(path)
+    assert await store.load("user@host:8443") is None
+
+    await store.save("user@host:8443", SESSION)
+    assert await store.load("user@host:8443") == SESSION
+
+
+async def test_file_session_store_errors(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Verify storage errors are logged rather than raised."""
+    store = FileSessionStore(tmp_path)
+    with caplog.at_level(logging.WARNING):
+        assert await store.load("user@host:8443") is None
+        assert "Failed to read UniFi sessions" in caplog.text
+
+        await store.save("user@host:8443", SESSION)
+        assert "Failed to write UniFi sessions" in caplog.text
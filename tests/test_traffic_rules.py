@@ -116,3 +116,4 @@ async def test_traffic_rules(unifi_controller, unifi_called_with):
     assert traffic_rule.target_devices == [
         {"client_mac": WIRELESS_CLIENT["mac"], "type": "CLIENT"}
     ]
+    assert traffic_rules.by("target_device", WIRELESS_CLIENT["mac"]) == [traffic_rule]
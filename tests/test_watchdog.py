@@ -0,0 +1,97 @@
+"""Test websocket watchdog.
+
+pytest --cov-report term-missing --cov=aiounifi.interfaces.watchdog tests/test_watchdog.py
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from aiounifi.interfaces.messages import MessageHandler
+from aiounifi.interfaces.watchdog import ANY_MESSAGE, WebsocketWatchdog
+from aiounifi.models.message import MessageKey
+
+
+@pytest.fixture(name="clock")
+def clock_fixture():
+    """Control monotonic clock used by watchdog."""
+    with patch("aiounifi.interfaces.watchdog.time.monotonic") as clock:
+        clock.return_value = 0.0
+        yield clock
+
+
+def test_watchdog_threshold(clock) -> None:
+    """Verify threshold adapts to observed gaps."""
+    watchdog = WebsocketWatchdog(
+        percentile=0.9, factor=2.0, min_threshold=1.0, min_samples=3, history=4
+    )
+    watchdog.reset()
+    assert watchdog.threshold("sta:sync") is None
+
+    for now in (1.0, 2.0, 3.0):
+        clock.return_value = now
+        watchdog.record("sta:sync")
+        watchdog.record_frame(received=now)
+    assert watchdog.threshold("sta:sync") is None
+    assert watchdog.threshold(ANY_MESSAGE) == 2.0
+
+    clock.return_value = 13.0
+    watchdog.record("sta:sync")
+    assert watchdog.threshold("sta:sync") == 20.0
+
+    # Only the latest gaps are kept
+    for now in (14.0, 15.0, 16.0, 17.0):
+        clock.return_value = now
+        watchdog.record("sta:sync")
+    assert watchdog.threshold("sta:sync") == 2.0
+
+    # Minimum threshold applies to short gaps
+    for now in (17.1, 17.2, 17.3, 17.4):
+        clock.return_value = now
+        watchdog.record("sta:sync")
+    assert watchdog.threshold("sta:sync") == 1.0
+
+
+def test_watchdog_stalled(clock) -> None:
+    """Verify stalled message types are reported once."""
+    watchdog = WebsocketWatchdog(factor=1.0, min_threshold=0.0, min_samples=2)
+    watchdog.reset()
+    assert watchdog.stalled() == []
+
+    for now in (1.0, 2.0, 3.0):
+        clock.return_value = now
+        watchdog.record("sta:sync")
+        watchdog.record_frame()
+    clock.return_value = 3.5
+    watchdog.record("device:sync")
+    assert watchdog.stalled() == []
+
+    # Other frames keep connection alive while sta:sync stalls
+    clock.return_value = 4.5
+    watchdog.record_frame()
+    assert watchdog.stalled() == ["sta:sync"]
+    assert watchdog.stalled() == []
+
+    # All frames stall
+    clock.return_value = 10.0
+    assert watchdog.stalled() == [ANY_MESSAGE]
+
+    # New connection starts tracking again, learned gaps are kept
+    watchdog.reset()
+    assert watchdog.stalled() == []
+    clock.return_value = 11.0
+    watchdog.record("sta:sync")
+    assert watchdog.threshold("sta:sync") == 1.0
+
+
+def test_message_handler_records_frames() -> None:
+    """Verify only message types with subscribers are recorded."""
+    message_handler = MessageHandler(controller=Mock())
+    message_handler.subscribe(Mock(), MessageKey.CLIENT)
+    message_handler.handler({"meta": {"message": "sta:sync"}, "data": []})
+    message_handler.handler({"meta": {"message": "session-metadata:sync"}, "data": []})
+    message_handler.handler({"meta": {}, "data": []})
+    message_handler.handler({"data": []})
+
+    message_handler.controller.watchdog.record.assert_called_once_with("sta:sync")
+    message_handler.controller.watchdog.record_frame.assert_not_called()
@@ -83,6 +83,7 @@ async def test_wlans(mock_aioresponse, unifi_controller, unifi_called_with):
     wlans = unifi_controller.wlans
     await wlans.update()
     assert len(wlans.values()) == 2
+    assert len(wlans.by("site_id", "5a32aa4ee4b0412345678910")) == 2
 
     wlan = wlans["012345678910111213141516"]
     assert wlan.id == "012345678910111213141516"